@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+""":mod:`benchmarks.parsers` benchmarks the hand history parsers.
+
+A synthetic PokerStars log is generated and parsed both from a string
+and from a binary stream.
+
+.. code-block:: console
+
+   $ python benchmarks/parsers.py --hand-count 2000
+"""
+
+from argparse import ArgumentParser
+from collections.abc import Callable
+from io import BytesIO
+from random import Random
+from time import perf_counter
+from typing import Any
+from warnings import catch_warnings, simplefilter
+
+from pokerkit import PokerStarsParser
+
+PLAYERS = 'Alice', 'Bob', 'Carol', 'Dave', 'Eve', 'Frank'
+STREETS = 'FLOP', 'TURN', 'RIVER'
+
+
+def generate_hand(random: Random, index: int) -> list[str]:
+    """Generate the lines of a random PokerStars hand.
+
+    :param random: The random number generator.
+    :param index: The index of the hand.
+    :return: The lines.
+    """
+    players = list(PLAYERS[:random.randint(2, len(PLAYERS))])
+    deck = [rank + suit for rank in '23456789TJQKA' for suit in 'cdhs']
+
+    random.shuffle(deck)
+
+    button = random.randint(1, len(players))
+    lines = [
+        (
+            f"PokerStars Hand #{1000 + index}: Tournament #1, Hold'em No"
+            f' Limit - Level I (1/2) - 2020/01/{1 + index % 28:02} 3:04:05'
+            ' ET'
+        ),
+        f"Table 'Alpha {index % 7}' 6-max Seat #{button} is the button",
+    ]
+
+    for seat, player in enumerate(players, 1):
+        stack = random.randint(100, 500)
+
+        lines.append(f'Seat {seat}: {player} ({stack} in chips)')
+
+    positions = players[button:] + players[:button]
+
+    if len(players) == 2:
+        positions.reverse()
+
+    lines.append(f'{positions[0]}: posts small blind 1')
+    lines.append(f'{positions[1]}: posts big blind 2')
+    lines.append('*** HOLE CARDS ***')
+
+    hole_cards = {player: (deck.pop(), deck.pop()) for player in players}
+    hero = random.choice(players)
+
+    lines.append(f'Dealt to {hero} [{" ".join(hole_cards[hero])}]')
+
+    active_players = positions[2:] + positions[:2]
+    bets = dict.fromkeys(players, 0)
+    bets[positions[0]] = 1
+    bets[positions[1]] = 2
+    board_cards: list[str] = []
+
+    for street_index in range(len(STREETS) + 1):
+        if street_index:
+            if len(active_players) < 2:
+                break
+
+            cards = [deck.pop() for _ in range(3 if street_index == 1 else 1)]
+            street = STREETS[street_index - 1]
+
+            if board_cards:
+                lines.append(
+                    (
+                        f'*** {street} *** [{" ".join(board_cards)}]'
+                        f' [{" ".join(cards)}]'
+                    ),
+                )
+            else:
+                lines.append(f'*** {street} *** [{" ".join(cards)}]')
+
+            board_cards.extend(cards)
+            bets = dict.fromkeys(players, 0)
+            active_players = [
+                player for player in players[button:] + players[:button]
+                if player in active_players
+            ]
+
+        pending_players = list(active_players)
+        raised = False
+
+        while pending_players and len(active_players) > 1:
+            player = pending_players.pop(0)
+            max_bet = max(bets.values())
+            value = random.random()
+
+            if value < 0.2 and max_bet > bets[player]:
+                lines.append(f'{player}: folds')
+                active_players.remove(player)
+            elif value < 0.35 and not raised:
+                raised = True
+                amount = max(max_bet, 2) * 2
+
+                if max_bet:
+                    lines.append(
+                        f'{player}: raises {amount - max_bet} to {amount}',
+                    )
+                else:
+                    lines.append(f'{player}: bets {amount}')
+
+                bets[player] = amount
+                index_ = active_players.index(player)
+                pending_players = (
+                    active_players[index_ + 1:] + active_players[:index_]
+                )
+            elif max_bet > bets[player]:
+                lines.append(f'{player}: calls {max_bet - bets[player]}')
+
+                bets[player] = max_bet
+            else:
+                lines.append(f'{player}: checks')
+
+    if len(active_players) > 1:
+        lines.append('*** SHOW DOWN ***')
+
+        for player in active_players:
+            lines.append(
+                f'{player}: shows [{" ".join(hole_cards[player])}] (a hand)',
+            )
+
+    lines.append(f'{active_players[0]} collected 10 from pot')
+    lines.append('*** SUMMARY ***')
+
+    return lines
+
+
+def generate_log(hand_count: int, seed: int = 0) -> str:
+    """Generate a random PokerStars log.
+
+    :param hand_count: The number of hands.
+    :param seed: The random seed, defaults to ``0``.
+    :return: The log.
+    """
+    random = Random(seed)
+    hands = (
+        '\n'.join(generate_hand(random, index))
+        for index in range(hand_count)
+    )
+
+    return '\n\n\n'.join(hands) + '\n\n\n'
+
+
+def measure(function: Callable[[], Any], repeat_count: int) -> float:
+    """Measure the best running time of the function.
+
+    :param function: The function.
+    :param repeat_count: The number of repetitions.
+    :return: The best running time in seconds.
+    """
+    times = []
+
+    for _ in range(repeat_count):
+        start_time = perf_counter()
+
+        function()
+        times.append(perf_counter() - start_time)
+
+    return min(times)
+
+
+def main() -> None:
+    """Run the benchmarks.
+
+    :return: ``None``.
+    """
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+
+    parser.add_argument('--hand-count', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat-count', type=int, default=3)
+
+    args = parser.parse_args()
+    log = generate_log(args.hand_count, args.seed)
+    raw_log = log.encode()
+    benchmarks = {
+        'str': lambda: list(PokerStarsParser()(log)),
+        'str (no replays)': lambda: list(
+            PokerStarsParser(replay_status=False)(log),
+        ),
+        'stream': lambda: list(PokerStarsParser()(BytesIO(raw_log))),
+    }
+
+    print(f'{args.hand_count} hands ({len(raw_log)} bytes)')
+
+    with catch_warnings():
+        simplefilter('ignore')
+
+        for name, function in benchmarks.items():
+            time = measure(function, args.repeat_count)
+
+            print(
+                f'{name:<20} {time:8.3f} s'
+                f' {args.hand_count / time:10.0f} hands/s',
+            )
+
+
+if __name__ == '__main__':
+    main()
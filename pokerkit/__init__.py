@@ -6,11 +6,15 @@ All poker tools are imported here.
 __all__ = (
     'AbsolutePokerParser',
     'ACPCProtocolParser',
+    'Action',
     'AntePosting',
+    'apply_action',
     'Automation',
     'BadugiHand',
     'BadugiLookup',
+    'Batch',
     'BetCollection',
+    'BetSizer',
     'BettingStructure',
     'BlindOrStraddlePosting',
     'BoardCombinationHand',
@@ -22,6 +26,7 @@ __all__ = (
     'Card',
     'CardBurning',
     'CardsLike',
+    'CFRSolver',
     'CheckingOrCalling',
     'ChipsPulling',
     'ChipsPushing',
@@ -34,6 +39,7 @@ __all__ = (
     'Draw',
     'EightOrBetterLookup',
     'EightOrBetterLowHand',
+    'encode_observations',
     'Entry',
     'filter_none',
     'FixedLimitBadugi',
@@ -46,15 +52,23 @@ __all__ = (
     'FixedLimitTexasHoldem',
     'Folding',
     'FullTiltPokerParser',
+    'GameTree',
+    'get_actions',
+    'get_decision_maker_index',
+    'get_min_and_max_bet_sizes',
     'GreekHoldemHand',
     'Hand',
     'HandHistory',
+    'HandHistoryIndex',
+    'HandHistoryIndexEntry',
+    'HandHistorySummary',
     'HandKilling',
     'Holdem',
     'HoleBoardCombinationHand',
     'HoleCardsShowingOrMucking',
     'HoleDealing',
     'IPokerNetworkParser',
+    'iterate_nodes',
     'KuhnPoker',
     'KuhnPokerHand',
     'KuhnPokerLookup',
@@ -63,6 +77,7 @@ __all__ = (
     'max_or_none',
     'min_or_none',
     'Mode',
+    'Node',
     'NoLimitDeuceToSevenLowballSingleDraw',
     'NoLimitPokerMixin',
     'NoLimitRoyalHoldem',
@@ -81,9 +96,11 @@ __all__ = (
     'parse_range',
     'parse_time',
     'parse_value',
+    'ParsingFailure',
     'PartyPokerParser',
     'Poker',
     'PokerStarsParser',
+    'Policy',
     'Pot',
     'PotLimitOmahaHoldem',
     'PotLimitPokerMixin',
@@ -99,12 +116,14 @@ __all__ = (
     'rotated',
     'RoyalHoldemMixin',
     'RoyalRhodeIslandHoldem',
+    'RuleTable',
     'RunoutCountSelection',
     'SevenCardStud',
     'ShortDeckHoldemHand',
     'ShortDeckHoldemLookup',
     'shuffled',
     'sign',
+    'simulate',
     'SingleDraw',
     'StandardBadugiHand',
     'StandardBadugiLookup',
@@ -122,6 +141,7 @@ __all__ = (
     'UnfixedLimitHoldem',
     'UNMATCHABLE_PATTERN',
     'ValuesLike',
+    'VectorEnvironment',
 )
 
 from pokerkit.analysis import (
@@ -199,14 +219,29 @@ from pokerkit.notation import (
     ACPCProtocolParser,
     FullTiltPokerParser,
     HandHistory,
+    HandHistoryIndex,
+    HandHistoryIndexEntry,
+    HandHistorySummary,
     IPokerNetworkParser,
     OngameNetworkParser,
     parse_action,
     Parser,
+    ParsingFailure,
     PartyPokerParser,
     PokerStarsParser,
     REParser,
 )
+from pokerkit.simulation import (
+    Action,
+    apply_action,
+    Batch,
+    encode_observations,
+    get_decision_maker_index,
+    Policy,
+    simulate,
+    VectorEnvironment,
+)
+from pokerkit.solvers import CFRSolver
 from pokerkit.state import (
     AntePosting,
     Automation,
@@ -229,11 +264,20 @@ from pokerkit.state import (
     Opening,
     Operation,
     Pot,
+    RuleTable,
     RunoutCountSelection,
     StandingPatOrDiscarding,
     State,
     Street,
 )
+from pokerkit.trees import (
+    BetSizer,
+    GameTree,
+    get_actions,
+    get_min_and_max_bet_sizes,
+    iterate_nodes,
+    Node,
+)
 from pokerkit.utilities import (
     Card,
     CardsLike,
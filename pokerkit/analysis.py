@@ -24,7 +24,7 @@ from statistics import mean, stdev
 from typing import Any
 
 from pokerkit.hands import Hand
-from pokerkit.notation import HandHistory
+from pokerkit.notation import HandHistory, HandHistorySummary
 from pokerkit.utilities import Card, Deck, max_or_none, RankOrder, Suit
 
 __SUITS = Suit.CLUB, Suit.DIAMOND, Suit.HEART, Suit.SPADE
@@ -449,12 +449,6 @@ class Statistics:
         statistics = defaultdict[str, list[Statistics]](list)
 
         for hh in hhs:
-            if hh.finishing_stacks is None:
-                end_state = tuple(hh)[-1]
-                finishing_stacks = end_state.stacks
-            else:
-                finishing_stacks = hh.finishing_stacks
-
             players: Any
 
             if hh.players is None:
@@ -463,7 +457,7 @@ class Statistics:
                 players = hh.players
 
             for i, (starting_stack, stack, player) in enumerate(
-                    zip(hh.starting_stacks, finishing_stacks, players),
+                    zip(hh.starting_stacks, hh.final_stacks, players),
             ):
                 if player is not None:
                     statistics[player].append(
@@ -474,6 +468,34 @@ class Statistics:
             zip(statistics.keys(), starmap(cls.merge, statistics.values())),
         )
 
+    @classmethod
+    def from_hand_history_summary(
+            cls,
+            *summaries: HandHistorySummary,
+    ) -> dict[str, Statistics]:
+        """Obtain statistics for each player (if any) from summaries of
+        hand histories.
+
+        The summaries can be obtained without creating hand histories,
+        for example, with
+        :meth:`pokerkit.notation.HandHistory.load_binary_summaries`.
+
+        :param summaries: The hand history summary/summaries to analyze.
+        :return: The hand history statistics.
+        """
+        statistics = defaultdict[str, list[Statistics]](list)
+
+        for summary in summaries:
+            if summary.players is None:
+                continue
+
+            for player, payoff in zip(summary.players, summary.payoffs):
+                statistics[player].append(Statistics(payoffs=[payoff]))
+
+        return dict(
+            zip(statistics.keys(), starmap(cls.merge, statistics.values())),
+        )
+
     @property
     def sample_count(self) -> int:
         """Return the sample size.
@@ -29,6 +29,7 @@ from pokerkit.state import (
     BettingStructure,
     Mode,
     Opening,
+    RuleTable,
     State,
     Street,
 )
@@ -206,6 +207,21 @@ class Poker(ABC):
             rake=self.rake,
         )
 
+    @property
+    def rule_table(self) -> RuleTable:
+        """Return the rule table compiled from the streets.
+
+        The states created from this game share this table.
+
+        >>> game = NoLimitTexasHoldem((), True, 0, (1, 2), 2)
+        >>> state = game(200, 2)
+        >>> state.rule_table is game.rule_table
+        True
+
+        :return: The rule table.
+        """
+        return RuleTable.compile(self.streets)
+
     @property
     def button_status(self) -> bool:
         """Return whether this game is a button game (i.e., has a
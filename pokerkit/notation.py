@@ -5,19 +5,25 @@ notations.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from codecs import getincrementaldecoder
 from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
 from collections import defaultdict, deque
+from concurrent.futures import Executor
 from copy import deepcopy
 from dataclasses import asdict, dataclass, field, fields, KW_ONLY
 from decimal import Decimal
-from functools import partial
+from enum import IntEnum, unique
+from functools import cache, partial
+from io import BytesIO, IncrementalNewlineDecoder
+from itertools import repeat, takewhile
+from json import dumps as dumps_json, loads as loads_json
 from math import inf
-from operator import add, itemgetter
+from operator import add, itemgetter, sub
+from os import fspath, PathLike
+from os.path import getsize
 from re import (
     compile,
     DOTALL,
-    findall,
-    finditer,
     Match,
     match,
     MULTILINE,
@@ -26,7 +32,7 @@ from re import (
 )
 from string import whitespace
 from tomllib import loads as loads_toml
-from typing import Any, cast, ClassVar, BinaryIO
+from typing import Any, ClassVar, BinaryIO
 from warnings import warn
 import datetime
 
@@ -34,12 +40,14 @@ from pokerkit.state import (
     Automation,
     BoardDealing,
     BringInPosting,
+    CardBurning,
     CheckingOrCalling,
     CompletionBettingOrRaisingTo,
     Folding,
     HoleCardsShowingOrMucking,
     HoleDealing,
     Mode,
+    Operation,
     StandingPatOrDiscarding,
     State,
 )
@@ -64,10 +72,148 @@ from pokerkit.utilities import (
     parse_time,
     parse_value,
     rake,
+    Rank,
     rotated,
+    Suit,
     UNMATCHABLE_PATTERN,
 )
 
+_SECTION_HEADER = compile(
+    rb'[ \t]*\[(?!\[)[ \t]*("[^"]*"|\'[^\']*\'|[^.\]\s]+)',
+)
+_TOML_TOKEN = compile(
+    rb"'''|\"\"\"|\"(?:[^\"\\\n]|\\.)*\"|'[^'\n]*'|#|[][{}]",
+)
+_MULTILINE_STRING_ENDS = {
+    b"'''": compile(rb"'''(?!')"),
+    b'"""': compile(rb'\\.|"""(?!")', DOTALL),
+}
+_WHITESPACE = frozenset(whitespace)
+
+
+def _split_sections(
+        lines: Iterable[bytes],
+        offset: int = 0,
+) -> Iterator[tuple[int, bytes]]:
+    """Split TOML lines into the top-level tables one at a time.
+
+    Lines before the first table header are skipped. Table headers are
+    not recognized inside multi-line strings or multi-line arrays and
+    inline tables.
+
+    >>> s = b'[1]\\na = 1\\n[1.b]\\nc = 2\\n[2]\\na = 3\\n'
+    >>> lines = s.splitlines(keepends=True)
+    >>> for offset, section in _split_sections(lines):
+    ...     offset, section
+    (0, b'[1]\\na = 1\\n[1.b]\\nc = 2\\n')
+    (22, b'[2]\\na = 3\\n')
+    >>> s = b"[1]\\na = [\\n  [1],\\n]\\nb = '''\\n[2]\\n'''\\n"
+    >>> lines = s.splitlines(keepends=True)
+    >>> len(list(_split_sections(lines)))
+    1
+
+    :param lines: The lines, with their line endings.
+    :param offset: The byte offset of the first line, defaults to ``0``.
+    :return: The byte offsets and contents of the tables.
+    """
+    section_offset = offset
+    section_name = None
+    section_lines: list[bytes] = []
+    delimiter = None
+    depth = 0
+
+    for line in lines:
+        if (
+                delimiter is None
+                and not depth
+                and (m := _SECTION_HEADER.match(line))
+        ):
+            name = m[1].strip(b'"\'')
+
+            if name != section_name:
+                if section_lines:
+                    yield section_offset, b''.join(section_lines)
+
+                section_offset = offset
+                section_name = name
+                section_lines = []
+
+        if section_name is not None:
+            section_lines.append(line)
+
+        index = 0
+
+        while True:
+            if delimiter is None:
+                m = _TOML_TOKEN.search(line, index)
+
+                if m is None:
+                    break
+
+                token = m[0]
+
+                if token == b'#':
+                    break
+                elif token in _MULTILINE_STRING_ENDS:
+                    delimiter = token
+                elif token in b'[{':
+                    depth += 1
+                elif token in b']}':
+                    depth = max(depth - 1, 0)
+            else:
+                m = _MULTILINE_STRING_ENDS[delimiter].search(line, index)
+
+                if m is None:
+                    break
+
+                if m[0] == delimiter:
+                    delimiter = None
+
+            index = m.end()
+
+        offset += len(line)
+
+    if section_lines:
+        yield section_offset, b''.join(section_lines)
+
+
+def _dump_key(key: str) -> str:
+    if not _WHITESPACE.isdisjoint(key):
+        key = f'\'{key}\''
+
+    return key
+
+
+def _dump_value(value: Any) -> str:
+    dumped_value: str
+
+    if type(value) is int:
+        dumped_value = repr(value)
+    elif isinstance(value, bool):
+        dumped_value = repr(value).lower()
+    elif isinstance(value, datetime.time):
+        dumped_value = str(value)
+    elif isinstance(value, Decimal):
+        dumped_value = 'inf' if value == inf else str(value)
+    elif isinstance(value, list):
+        dumped_value = '[' + ', '.join(map(_dump_value, value)) + ']'
+    elif isinstance(value, dict):
+        keys = map(_dump_key, value.keys())
+        values = map(_dump_value, value.values())
+        pairs = map(' = '.join, zip(keys, values))
+        dumped_value = '{' + ', '.join(pairs) + '}'
+    elif isinstance(value, str):
+        if '\'' in value:
+            delimiter = '\'\'\''
+        else:
+            delimiter = '\''
+
+        dumped_value = delimiter + value + delimiter
+    else:
+        dumped_value = repr(value)
+
+    return dumped_value
+
 
 @dataclass
 class HandHistory(Iterable[State]):
@@ -413,10 +559,13 @@ class HandHistory(Iterable[State]):
     """The rake function."""
     parse_value: Callable[[str], int] = parse_value
     """The value parsing function."""
+    _compiled_actions: (
+        tuple[list[str], Callable[[str], int], list[_CompiledAction]] | None
+    ) = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def _filter_non_fields(cls, **kwargs: Any) -> dict[str, Any]:
-        field_names = {field.name for field in fields(cls)}
+        field_names = {field.name for field in fields(cls) if field.init}
         filtered_fields = {}
 
         if 'user_defined_fields' in kwargs:
@@ -484,23 +633,59 @@ class HandHistory(Iterable[State]):
     ) -> Iterator[HandHistory]:
         """Load PHHs from a ``str`` object.
 
+        The hands are parsed one at a time, as they are iterated.
+
         :param s: The ``str`` object.
         :param parse_value: The value parsing function.
         :param kwargs: The metadata.
         :return: The hand history object.
         """
-        for raw_phh in loads_toml(s, parse_float=parse_value).values():
-            yield cls(**cls._filter_non_fields(**raw_phh | kwargs))
+        yield from cls.load_all(
+            BytesIO(s.encode()),
+            parse_value=parse_value,
+            **kwargs,
+        )
 
     @classmethod
-    def load_all(cls, fp: BinaryIO, **kwargs: Any) -> Iterator[HandHistory]:
+    def load_all(
+            cls,
+            fp: BinaryIO,
+            *,
+            parse_value: Callable[[str], int] = parse_value,
+            **kwargs: Any,
+    ) -> Iterator[HandHistory]:
         """Load PHHs from a file pointer.
 
+        The file is read incrementally. Only the section (i.e.
+        ``[...]``) of the hand being parsed is held in memory.
+
         :param fp: The file pointer.
+        :param parse_value: The value parsing function.
         :param kwargs: The metadata.
         :return: The hand history object.
         """
-        yield from cls.loads_all(fp.read().decode(), **kwargs)
+        for _, section in _split_sections(fp):
+            yield from cls._load_section(section, parse_value, kwargs)
+
+    @classmethod
+    def _load_section(
+            cls,
+            section: bytes,
+            parse_value: Callable[[str], int],
+            kwargs: dict[str, Any],
+    ) -> Iterator[HandHistory]:
+        raw_phhs = loads_toml(section.decode(), parse_float=parse_value)
+
+        for raw_phh in raw_phhs.values():
+            yield cls(**cls._filter_non_fields(**raw_phh | kwargs))
+
+    @classmethod
+    def _iterate_dumps(cls, phhs: Iterable[HandHistory]) -> Iterator[str]:
+        for i, phh in enumerate(phhs):
+            if i:
+                yield f'\n\n[{i + 1}]\n{phh.dumps()}'
+            else:
+                yield f'[{i + 1}]\n{phh.dumps()}'
 
     @classmethod
     def dumps_all(cls, phhs: Iterable[HandHistory]) -> str:
@@ -508,23 +693,278 @@ class HandHistory(Iterable[State]):
 
         :return: a ``str`` object.
         """
-        raw_phhs = []
+        return ''.join(cls._iterate_dumps(phhs))
 
-        for i, phh in enumerate(phhs):
-            raw_phh = f'[{i + 1}]\n{phh.dumps()}'
+    @classmethod
+    def dump_all(cls, phhs: Iterable[HandHistory], fp: BinaryIO) -> None:
+        """Dump PHH to a file pointer.
 
-            raw_phhs.append(raw_phh)
+        The hands are written one at a time, as they are iterated.
 
-        return '\n\n'.join(raw_phhs)
+        :param fp: The file pointer.
+        :return: ``None``.
+        """
+        for raw_phh in cls._iterate_dumps(phhs):
+            fp.write(raw_phh.encode())
 
     @classmethod
-    def dump_all(cls, phhs: Iterable[HandHistory], fp: BinaryIO) -> None:
-        """Dump PHH to a file pointer.
+    @cache
+    def _get_binary_field_names(cls) -> tuple[str, ...]:
+        field_names = []
 
+        for field_ in fields(cls):
+            if (
+                    field_.init
+                    and field_.name not in _BINARY_UNSERIALIZED_FIELD_NAMES
+            ):
+                field_names.append(field_.name)
+
+        return tuple(field_names)
+
+    @classmethod
+    def dump_binary_all(
+            cls,
+            phhs: Iterable[HandHistory],
+            fp: BinaryIO,
+    ) -> None:
+        """Dump hand histories to a file pointer in a compact binary
+        format.
+
+        Each hand is a length-prefixed record. The variant, hand, player
+        names, starting stacks, and final stacks (replayed if the
+        finishing stacks are not recorded) come first, so
+        :meth:`pokerkit.notation.HandHistory.load_binary_summaries` can
+        skip the rest. The variants and player names are interned across
+        the file, amounts are variable-length integers, and the actions
+        are stored as compact records with one byte per card. Actions
+        that would not be reproduced verbatim are kept as text, so the
+        conversion is lossless.
+
+        >>> hh = HandHistory(
+        ...     variant='NT',
+        ...     antes=[0, 0],
+        ...     blinds_or_straddles=[1, 2],
+        ...     min_bet=2,
+        ...     starting_stacks=[200, 200],
+        ...     actions=['d dh p1 AcAd', 'd dh p2 ????', 'p2 f'],
+        ...     players=['Alice', 'Bob'],
+        ... )
+        >>> fp = BytesIO()
+        >>> HandHistory.dump_binary_all([hh, hh], fp)
+        >>> len(fp.getvalue()) < len(HandHistory.dumps_all([hh, hh]))
+        True
+        >>> _ = fp.seek(0)
+        >>> list(HandHistory.load_binary_all(fp)) == [hh, hh]
+        True
+
+        :param phhs: The hand histories.
         :param fp: The file pointer.
         :return: ``None``.
+        :raises ValueError: If a hand cannot be replayed or a value
+                            cannot be written.
+        """
+        fp.write(_BINARY_MAGIC + bytes((_BINARY_VERSION,)))
+
+        field_names = cls._get_binary_field_names()
+        writer = _BinaryWriter()
+        length_writer = _BinaryWriter()
+
+        for phh in phhs:
+            writer.data = bytearray()
+
+            writer.write_header(phh)
+
+            mask = 0
+            values = []
+
+            for i, name in enumerate(field_names):
+                value = getattr(phh, name)
+
+                if value is not None:
+                    mask |= 1 << i
+
+                    values.append(value)
+
+            writer.write_integer(mask)
+
+            for value in values:
+                writer.write_value(value)
+
+            writer.write_value(phh.user_defined_fields)
+
+            compiled_actions = phh._compile_actions()
+
+            writer.write_integer(len(compiled_actions))
+
+            for compiled_action in compiled_actions:
+                writer.write_action(compiled_action, phh.parse_value)
+
+            length_writer.data = bytearray()
+
+            length_writer.write_integer(len(writer.data))
+            fp.write(length_writer.data)
+            fp.write(writer.data)
+
+    @classmethod
+    def load_binary_all(
+            cls,
+            fp: BinaryIO,
+            **kwargs: Any,
+    ) -> Iterator[HandHistory]:
+        """Load hand histories from a file pointer in the binary format.
+
+        For more information, please refer to
+        :meth:`pokerkit.notation.HandHistory.dump_binary_all`.
+
+        :param fp: The file pointer.
+        :param kwargs: The metadata.
+        :return: The hand history objects.
+        :raises ValueError: If the data is malformed.
+        """
+        field_names = cls._get_binary_field_names()
+        reader = _BinaryReader()
+
+        for _, record in _read_binary_records(fp):
+            reader.data = record
+            reader.offset = 0
+            variant, hand, players, starting_stacks, _ = reader.read_header()
+            values = {
+                'variant': variant,
+                'hand': hand,
+                'players': players,
+                'starting_stacks': starting_stacks,
+            }
+            mask = reader.read_integer()
+
+            for i, name in enumerate(field_names):
+                if mask >> i & 1:
+                    values[name] = reader.read_value()
+
+            values['user_defined_fields'] = reader.read_value()
+            values['actions'] = [
+                reader.read_action() for _ in range(reader.read_integer())
+            ]
+
+            if reader.offset != len(record):
+                raise ValueError('The record has trailing bytes.')
+
+            yield cls(**cls._filter_non_fields(**values | kwargs))
+
+    @classmethod
+    def load_binary_summaries(
+            cls,
+            fp: BinaryIO,
+    ) -> Iterator[HandHistorySummary]:
+        """Load the summaries of hand histories from a file pointer in
+        the binary format.
+
+        Only the headers of the records are decoded. The hand histories
+        are neither created nor replayed.
+
+        >>> hh = HandHistory(
+        ...     variant='NT',
+        ...     antes=[0, 0],
+        ...     blinds_or_straddles=[1, 2],
+        ...     min_bet=2,
+        ...     starting_stacks=[200, 200],
+        ...     actions=['d dh p1 AcAd', 'd dh p2 ????', 'p2 f'],
+        ...     players=['Alice', 'Bob'],
+        ... )
+        >>> fp = BytesIO()
+        >>> HandHistory.dump_binary_all([hh], fp)
+        >>> _ = fp.seek(0)
+        >>> summary, = HandHistory.load_binary_summaries(fp)
+        >>> summary.players
+        ['Alice', 'Bob']
+        >>> summary.payoffs
+        [1, -1]
+
+        :param fp: The file pointer.
+        :return: The summaries.
+        :raises ValueError: If the data is malformed.
+        """
+        name = getattr(fp, 'name', None)
+        path = name if isinstance(name, str) else None
+        reader = _BinaryReader()
+
+        for offset, record in _read_binary_records(fp):
+            reader.data = record
+            reader.offset = 0
+
+            yield HandHistorySummary(path, offset, *reader.read_header())
+
+    @classmethod
+    def load_many(
+            cls,
+            paths: Iterable[str | PathLike[str]],
+            *,
+            executor: Executor | None = None,
+            replay_status: bool = True,
+            shard_size: int = 1 << 24,
+            parse_value: Callable[[str], int] = parse_value,
+            **kwargs: Any,
+    ) -> Iterator[HandHistorySummary]:
+        """Load, replay, and summarize PHHs in bulk.
+
+        Each file is split into byte ranges of roughly ``shard_size``
+        bytes, aligned to the sections (i.e. ``[...]``). The user may
+        supply an executor (e.g.
+        ``concurrent.futures.ProcessPoolExecutor``) to parse and replay
+        the shards in parallel. Only the summaries are sent back from
+        the workers.
+
+        >>> from tempfile import TemporaryDirectory
+        >>> hh = HandHistory(
+        ...     variant='NT',
+        ...     antes=[0, 0],
+        ...     blinds_or_straddles=[1, 2],
+        ...     min_bet=2,
+        ...     starting_stacks=[200, 200],
+        ...     actions=['d dh p1 ????', 'd dh p2 ????', 'p2 f'],
+        ... )
+        >>> with TemporaryDirectory() as directory:
+        ...     path = f'{directory}/hands.phhs'
+        ...     with open(path, 'wb') as file:
+        ...         HandHistory.dump_all([hh, hh], file)
+        ...     summaries = list(HandHistory.load_many([path]))
+        >>> len(summaries)
+        2
+        >>> summaries[0].finishing_stacks
+        [201, 199]
+        >>> summaries[1].payoffs
+        [1, -1]
+
+        :param paths: The paths to the files.
+        :param executor: The optional executor, defaults to ``None``
+                         which means the hands are processed serially.
+        :param replay_status: Whether to replay the hands even if the
+                              finishing stacks are recorded, defaults
+                              to ``True``.
+        :param shard_size: The approximate number of bytes per shard,
+                           defaults to ``16777216``.
+        :param parse_value: The value parsing function.
+        :param kwargs: The metadata.
+        :return: The summaries, in order.
         """
-        fp.write(cls.dumps_all(phhs).encode())
+        shards = []
+
+        for path in paths:
+            size = getsize(path)
+
+            for start in range(0, max(size, 1), shard_size):
+                shards.append((path, start, start + shard_size))
+
+        mapper: Any = map if executor is None else executor.map
+        summarize = partial(
+            _summarize_hand_histories,
+            cls,
+            replay_status,
+            parse_value,
+            kwargs,
+        )
+
+        for summaries in mapper(summarize, shards):
+            yield from summaries
 
     @classmethod
     def from_game_state(
@@ -642,21 +1082,29 @@ class HandHistory(Iterable[State]):
     @classmethod
     def from_absolute_poker(
             cls,
-            s: str,
+            s: str | bytes | Iterable[str] | Iterable[bytes],
             *,
             parse_value: Callable[[str], int] = parse_value,
             error_status: bool = False,
+            error_sink: Callable[[ParsingFailure], Any] | None = None,
     ) -> Generator[HandHistory, None, int]:
         """Parse hand history logs from Absolute Poker.
 
         If an error is encountered, an error is raised if
         ``error_status`` is passed as ``True`` (by default, it is
-        ``False``). If ``False``, only warnings are shown.
+        ``False``). If ``False``, only warnings are shown, unless the
+        failures are passed to ``error_sink``.
 
-        :param s: The hand history logs.
+        :param s: The hand history logs, as a ``str``, ``bytes``, a
+                  text or binary file object, or an iterable of
+                  chunks.
         :param parse_value: The value parser.
         :param error_status: Set ``True`` to raise errors, otherwise
                                   ``False``.
+        :param error_sink: The optional callable that receives a
+                           :class:`pokerkit.notation.ParsingFailure`
+                           for each hand that could not be parsed,
+                           instead of a warning being shown.
         :return: The generator that iterates yields hand histories and
                  returns the total number of hands parsed.
         """
@@ -664,26 +1112,35 @@ class HandHistory(Iterable[State]):
             s,
             parse_value=parse_value,
             error_status=error_status,
+            error_sink=error_sink,
         )
 
     @classmethod
     def from_full_tilt_poker(
             cls,
-            s: str,
+            s: str | bytes | Iterable[str] | Iterable[bytes],
             *,
             parse_value: Callable[[str], int] = parse_value,
             error_status: bool = False,
+            error_sink: Callable[[ParsingFailure], Any] | None = None,
     ) -> Generator[HandHistory, None, int]:
         """Parse hand history logs from Full Tilt Poker.
 
         If an error is encountered, an error is raised if
         ``error_status`` is passed as ``True`` (by default, it is
-        ``False``). If ``False``, only warnings are shown.
+        ``False``). If ``False``, only warnings are shown, unless the
+        failures are passed to ``error_sink``.
 
-        :param s: The hand history logs.
+        :param s: The hand history logs, as a ``str``, ``bytes``, a
+                  text or binary file object, or an iterable of
+                  chunks.
         :param parse_value: The value parser.
         :param error_status: Set ``True`` to raise errors, otherwise
                                   ``False``.
+        :param error_sink: The optional callable that receives a
+                           :class:`pokerkit.notation.ParsingFailure`
+                           for each hand that could not be parsed,
+                           instead of a warning being shown.
         :return: The generator that iterates yields hand histories and
                  returns the total number of hands parsed.
         """
@@ -691,26 +1148,35 @@ class HandHistory(Iterable[State]):
             s,
             parse_value=parse_value,
             error_status=error_status,
+            error_sink=error_sink,
         )
 
     @classmethod
     def from_ipoker_network(
             cls,
-            s: str,
+            s: str | bytes | Iterable[str] | Iterable[bytes],
             *,
             parse_value: Callable[[str], int] = parse_value,
             error_status: bool = False,
+            error_sink: Callable[[ParsingFailure], Any] | None = None,
     ) -> Generator[HandHistory, None, int]:
         """Parse hand history logs from iPoker Network.
 
         If an error is encountered, an error is raised if
         ``error_status`` is passed as ``True`` (by default, it is
-        ``False``). If ``False``, only warnings are shown.
+        ``False``). If ``False``, only warnings are shown, unless the
+        failures are passed to ``error_sink``.
 
-        :param s: The hand history logs.
+        :param s: The hand history logs, as a ``str``, ``bytes``, a
+                  text or binary file object, or an iterable of
+                  chunks.
         :param parse_value: The value parser.
         :param error_status: Set ``True`` to raise errors, otherwise
                                   ``False``.
+        :param error_sink: The optional callable that receives a
+                           :class:`pokerkit.notation.ParsingFailure`
+                           for each hand that could not be parsed,
+                           instead of a warning being shown.
         :return: The generator that iterates yields hand histories and
                  returns the total number of hands parsed.
         """
@@ -718,26 +1184,35 @@ class HandHistory(Iterable[State]):
             s,
             parse_value=parse_value,
             error_status=error_status,
+            error_sink=error_sink,
         )
 
     @classmethod
     def from_ongame_network(
             cls,
-            s: str,
+            s: str | bytes | Iterable[str] | Iterable[bytes],
             *,
             parse_value: Callable[[str], int] = parse_value,
             error_status: bool = False,
+            error_sink: Callable[[ParsingFailure], Any] | None = None,
     ) -> Generator[HandHistory, None, int]:
         """Parse hand history logs from Ongame Network.
 
         If an error is encountered, an error is raised if
         ``error_status`` is passed as ``True`` (by default, it is
-        ``False``). If ``False``, only warnings are shown.
+        ``False``). If ``False``, only warnings are shown, unless the
+        failures are passed to ``error_sink``.
 
-        :param s: The hand history logs.
+        :param s: The hand history logs, as a ``str``, ``bytes``, a
+                  text or binary file object, or an iterable of
+                  chunks.
         :param parse_value: The value parser.
         :param error_status: Set ``True`` to raise errors, otherwise
                                   ``False``.
+        :param error_sink: The optional callable that receives a
+                           :class:`pokerkit.notation.ParsingFailure`
+                           for each hand that could not be parsed,
+                           instead of a warning being shown.
         :return: The generator that iterates yields hand histories and
                  returns the total number of hands parsed.
         """
@@ -745,15 +1220,17 @@ class HandHistory(Iterable[State]):
             s,
             parse_value=parse_value,
             error_status=error_status,
+            error_sink=error_sink,
         )
 
     @classmethod
     def from_partypoker(
             cls,
-            s: str,
+            s: str | bytes | Iterable[str] | Iterable[bytes],
             *,
             parse_value: Callable[[str], int] = parse_value,
             error_status: bool = False,
+            error_sink: Callable[[ParsingFailure], Any] | None = None,
     ) -> Generator[HandHistory, None, int]:
         """Parse hand history logs from PartyPoker.
 
@@ -761,10 +1238,16 @@ class HandHistory(Iterable[State]):
         disabled by setting ``error_status`` to be ``True``. Then,
         errors will be warned.
 
-        :param s: The hand history logs.
+        :param s: The hand history logs, as a ``str``, ``bytes``, a
+                  text or binary file object, or an iterable of
+                  chunks.
         :param parse_value: The value parser.
         :param error_status: Set ``True`` to skip errors, otherwise
                                   ``False``.
+        :param error_sink: The optional callable that receives a
+                           :class:`pokerkit.notation.ParsingFailure`
+                           for each hand that could not be parsed,
+                           instead of a warning being shown.
         :return: The generator that iterates yields hand histories and
                  returns the total number of hands parsed.
         """
@@ -772,26 +1255,35 @@ class HandHistory(Iterable[State]):
             s,
             parse_value=parse_value,
             error_status=error_status,
+            error_sink=error_sink,
         )
 
     @classmethod
     def from_pokerstars(
             cls,
-            s: str,
+            s: str | bytes | Iterable[str] | Iterable[bytes],
             *,
             parse_value: Callable[[str], int] = parse_value,
             error_status: bool = False,
+            error_sink: Callable[[ParsingFailure], Any] | None = None,
     ) -> Generator[HandHistory, None, int]:
         """Parse hand history logs from PokerStars.
 
         If an error is encountered, an error is raised if
         ``error_status`` is passed as ``True`` (by default, it is
-        ``False``). If ``False``, only warnings are shown.
+        ``False``). If ``False``, only warnings are shown, unless the
+        failures are passed to ``error_sink``.
 
-        :param s: The hand history logs.
+        :param s: The hand history logs, as a ``str``, ``bytes``, a
+                  text or binary file object, or an iterable of
+                  chunks.
         :param parse_value: The value parser.
         :param error_status: Set ``True`` to raise errors, otherwise
                                   ``False``.
+        :param error_sink: The optional callable that receives a
+                           :class:`pokerkit.notation.ParsingFailure`
+                           for each hand that could not be parsed,
+                           instead of a warning being shown.
         :return: The generator that iterates yields hand histories and
                  returns the total number of hands parsed.
         """
@@ -799,6 +1291,7 @@ class HandHistory(Iterable[State]):
             s,
             parse_value=parse_value,
             error_status=error_status,
+            error_sink=error_sink,
         )
 
     @classmethod
@@ -806,21 +1299,29 @@ class HandHistory(Iterable[State]):
             cls,
             game: Poker,
             starting_stack: int,
-            s: str,
+            s: str | bytes | Iterable[str] | Iterable[bytes],
             *,
             parse_value: Callable[[str], int] = parse_value,
             error_status: bool = False,
+            error_sink: Callable[[ParsingFailure], Any] | None = None,
     ) -> Generator[HandHistory, None, int]:
         """Parse hand history logs in ACPC Protocol.
 
         If an error is encountered, an error is raised if
         ``error_status`` is passed as ``True`` (by default, it is
-        ``False``). If ``False``, only warnings are shown.
+        ``False``). If ``False``, only warnings are shown, unless the
+        failures are passed to ``error_sink``.
 
-        :param s: The hand history logs.
+        :param s: The hand history logs, as a ``str``, ``bytes``, a
+                  text or binary file object, or an iterable of
+                  chunks.
         :param parse_value: The value parser.
         :param error_status: Set ``True`` to raise errors, otherwise
                                   ``False``.
+        :param error_sink: The optional callable that receives a
+                           :class:`pokerkit.notation.ParsingFailure`
+                           for each hand that could not be parsed,
+                           instead of a warning being shown.
         :return: The generator that iterates yields hand histories and
                  returns the total number of hands parsed.
         """
@@ -828,6 +1329,7 @@ class HandHistory(Iterable[State]):
             s,
             parse_value=parse_value,
             error_status=error_status,
+            error_sink=error_sink,
         )
 
     def __iter__(self) -> Iterator[State]:
@@ -846,64 +1348,164 @@ class HandHistory(Iterable[State]):
         :return: The state actions.
         """
         state = self.create_state()
-        actions = deque(self.actions)
+        compiled_actions = self._compile_actions()
+        action_count = len(compiled_actions)
+        index = 0
         action: str | None
 
         yield state, None
 
-        while state.status or actions:
-            if actions:
-                action = actions.popleft()
+        while state.status or index < action_count:
+            action = None
+
+            if index < action_count:
+                compiled_action = compiled_actions[index]
 
                 try:
-                    parse_action(state, action, self.parse_value)
+                    compiled_action.operate(compiled_action, state)
                 except ValueError:
-                    actions.appendleft(action)
-
-                    action = None
-            else:
-                action = None
+                    pass
+                else:
+                    action = compiled_action.action
+                    index += 1
 
             if action is None:
-                if state.can_post_ante():
-                    state.post_ante()
-                elif state.can_collect_bets():
-                    state.collect_bets()
-                elif state.can_post_blind_or_straddle():
-                    state.post_blind_or_straddle()
-                elif state.can_burn_card():
-                    state.burn_card('??')
-
-                    if Automation.CARD_BURNING in self.automations:
-                        continue
-                elif state.can_deal_hole():
-                    state.deal_hole('??')
+                operation = self._repair(state, index < action_count)
+
+                if operation is None:
+                    break
                 elif (
-                        actions
-                        and not state.checking_or_calling_amount
-                        and state.can_check_or_call()
+                        isinstance(operation, CardBurning)
+                        and Automation.CARD_BURNING in self.automations
                 ):
-                    state.check_or_call()
-                elif actions and state.can_fold():
-                    state.fold()
-                elif state.status and state.can_show_or_muck_hole_cards(()):
-                    state.show_or_muck_hole_cards(())
-                elif state.can_select_runout_count():
-                    state.select_runout_count()
-                elif state.can_kill_hand():
-                    state.kill_hand()
-                elif state.can_push_chips():
-                    state.push_chips()
-                elif state.can_pull_chips():
-                    state.pull_chips()
-                else:
-                    break
+                    continue
 
             yield state, action
 
-        if actions:
+        if index < action_count:
             raise ValueError('Unable to repair the hand history')
 
+    def _compile_actions(self) -> list[_CompiledAction]:
+        compiled_actions = self._compiled_actions
+
+        if (
+                compiled_actions is None
+                or compiled_actions[1] is not self.parse_value
+                or compiled_actions[0] != self.actions
+        ):
+            compiled_actions = (
+                list(self.actions),
+                self.parse_value,
+                [
+                    _compile_action(action, self.parse_value)
+                    for action in self.actions
+                ],
+            )
+            self._compiled_actions = compiled_actions
+
+        return compiled_actions[2]
+
+    def _repair(self, state: State, actions_status: bool) -> Operation | None:
+        operation: Operation | None
+
+        if state.can_post_ante():
+            operation = state.post_ante()
+        elif state.can_collect_bets():
+            operation = state.collect_bets()
+        elif state.can_post_blind_or_straddle():
+            operation = state.post_blind_or_straddle()
+        elif state.can_burn_card():
+            operation = state.burn_card('??')
+        elif state.can_deal_hole():
+            operation = state.deal_hole('??')
+        elif (
+                actions_status
+                and not state.checking_or_calling_amount
+                and state.can_check_or_call()
+        ):
+            operation = state.check_or_call()
+        elif actions_status and state.can_fold():
+            operation = state.fold()
+        elif state.status and state.can_show_or_muck_hole_cards(()):
+            operation = state.show_or_muck_hole_cards(())
+        elif state.can_select_runout_count():
+            operation = state.select_runout_count()
+        elif state.can_kill_hand():
+            operation = state.kill_hand()
+        elif state.can_push_chips():
+            operation = state.push_chips()
+        elif state.can_pull_chips():
+            operation = state.pull_chips()
+        else:
+            operation = None
+
+        return operation
+
+    def create_final_state(self) -> State:
+        """Create the final state.
+
+        The hand is replayed exactly like
+        :attr:`pokerkit.notation.HandHistory.state_actions`, but in one
+        loop without yielding the intermediate states.
+
+        >>> hh = HandHistory(
+        ...     variant='NT',
+        ...     antes=[0, 0],
+        ...     blinds_or_straddles=[1, 2],
+        ...     min_bet=2,
+        ...     starting_stacks=[200, 200],
+        ...     actions=['d dh p1 ????', 'd dh p2 ????', 'p2 f'],
+        ... )
+        >>> state = hh.create_final_state()
+        >>> state.status
+        False
+        >>> state.stacks
+        [201, 199]
+
+        :return: The final state.
+        :raises ValueError: If the hand history cannot be repaired.
+        """
+        state = self.create_state()
+        compiled_actions = self._compile_actions()
+        action_count = len(compiled_actions)
+        index = 0
+
+        while index < action_count or state.status:
+            if index < action_count:
+                compiled_action = compiled_actions[index]
+
+                try:
+                    compiled_action.operate(compiled_action, state)
+                except ValueError:
+                    pass
+                else:
+                    index += 1
+
+                    continue
+
+            if self._repair(state, index < action_count) is None:
+                break
+
+        if index < action_count:
+            raise ValueError('Unable to repair the hand history')
+
+        return state
+
+    @property
+    def final_stacks(self) -> list[int]:
+        """Return the final stacks.
+
+        If the finishing stacks are recorded, they are returned.
+        Otherwise, the hand is replayed with
+        :meth:`pokerkit.notation.HandHistory.create_final_state`.
+
+        :return: The final stacks.
+        """
+        if self.finishing_stacks is None:
+            return list(self.create_final_state().stacks)
+
+        return list(self.finishing_stacks)
+
     @property
     def game_type(self) -> type[Poker]:
         """Return the game type.
@@ -953,61 +1555,36 @@ class HandHistory(Iterable[State]):
             len(self.starting_stacks),
         )
 
+    @classmethod
+    @cache
+    def _get_dumped_field_names(cls, variant: str) -> tuple[str, ...]:
+        field_names = []
+
+        for field_ in fields(cls):
+            if (
+                    field_.name in cls.required_field_names[variant]
+                    or field_.name in cls.optional_field_names
+            ):
+                field_names.append(field_.name)
+
+        return tuple(field_names)
+
     def dumps(self) -> str:
         """Dump PHH as a ``str`` object.
 
         :return: a ``str`` object.
         """
-
-        def clean_key(key: str) -> str:
-            if set(key) & set(whitespace):
-                key = f'\'{key}\''
-
-            return key
-
-        def clean_value(value: Any) -> str:
-            cleaned_value: str
-
-            if isinstance(value, bool):
-                cleaned_value = repr(value).lower()
-            elif isinstance(value, datetime.time):
-                cleaned_value = str(value)
-            elif isinstance(value, Decimal):
-                cleaned_value = 'inf' if value == inf else str(value)
-            elif isinstance(value, list):
-                cleaned_value = '[' + ', '.join(map(clean_value, value)) + ']'
-            elif isinstance(value, dict):
-                keys = map(clean_key, value.keys())
-                values = map(clean_value, value.values())
-                pairs = map(' = '.join, zip(keys, values))
-                cleaned_value = '{' + ', '.join(pairs) + '}'
-            elif isinstance(value, str):
-                if '\'' in value:
-                    delimiter = '\'\'\''
-                else:
-                    delimiter = '\''
-
-                cleaned_value = delimiter + value + delimiter
-            else:
-                cleaned_value = repr(value)
-
-            return cleaned_value
-
         lines = []
 
-        for key, value in asdict(self).items():
-            if (
-                    (
-                        key in self.required_field_names[self.variant]
-                        or key in self.optional_field_names
-                    )
-                    and value is not None
-            ):
-                lines.append(f'{clean_key(key)} = {clean_value(value)}')
+        for key in self._get_dumped_field_names(self.variant):
+            value = getattr(self, key)
+
+            if value is not None:
+                lines.append(f'{_dump_key(key)} = {_dump_value(value)}')
 
         for key, value in self.user_defined_fields.items():
             if value is not None:
-                lines.append(f'{clean_key(key)} = {clean_value(value)}')
+                lines.append(f'{_dump_key(key)} = {_dump_value(value)}')
 
         return '\n'.join(lines)
 
@@ -1221,14 +1798,9 @@ class HandHistory(Iterable[State]):
         hole_cards = '|'.join(map(''.join, raw_hole_cards))
         raw_payoffs = []
 
-        if self.finishing_stacks is None:
-            finishing_stacks = tuple(self)[-1].stacks
-        else:
-            finishing_stacks = self.finishing_stacks
-
         for starting_stack, finishing_stack in zip(
                 self.starting_stacks,
-                finishing_stacks,
+                self.final_stacks,
         ):
             raw_payoffs.append(finishing_stack - starting_stack)
 
@@ -1251,7 +1823,1032 @@ class HandHistory(Iterable[State]):
             f':{players}'
         )
 
-        return match_state
+        return match_state
+
+
+@dataclass
+class HandHistorySummary:
+    """The class for lightweight summaries of hand histories.
+
+    :param path: The path to the file, if any.
+    :param offset: The byte offset of the section or record in the
+                   file.
+    :param variant: The variant name.
+    :param hand: The hand number.
+    :param players: The player names.
+    :param starting_stacks: The starting stacks.
+    :param finishing_stacks: The finishing stacks.
+    """
+
+    path: str | None
+    """The path to the file, if any."""
+    offset: int
+    """The byte offset of the section or record in the file."""
+    variant: str
+    """The variant name."""
+    hand: str | int | None
+    """The hand number."""
+    players: list[str] | None
+    """The player names."""
+    starting_stacks: list[int]
+    """The starting stacks."""
+    finishing_stacks: list[int]
+    """The finishing stacks."""
+
+    @property
+    def payoffs(self) -> list[int]:
+        """Return the payoffs.
+
+        :return: The payoffs.
+        """
+        return list(map(sub, self.finishing_stacks, self.starting_stacks))
+
+
+def _summarize_hand_histories(
+        cls: type[HandHistory],
+        replay_status: bool,
+        parse_value: Callable[[str], int],
+        kwargs: dict[str, Any],
+        shard: tuple[str | PathLike[str], int, int],
+) -> list[HandHistorySummary]:
+    path, start, stop = shard
+    summaries = []
+
+    with open(path, 'rb') as fp:
+        if start:
+            fp.seek(start - 1)
+            fp.readline()
+
+        for offset, section in _split_sections(fp, fp.tell()):
+            if offset >= stop:
+                break
+
+            for hh in cls._load_section(section, parse_value, kwargs):
+                if replay_status:
+                    finishing_stacks = list(hh.create_final_state().stacks)
+                else:
+                    finishing_stacks = hh.final_stacks
+
+                summaries.append(
+                    HandHistorySummary(
+                        fspath(path),
+                        offset,
+                        hh.variant,
+                        hh.hand,
+                        hh.players,
+                        hh.starting_stacks,
+                        finishing_stacks,
+                    ),
+                )
+
+    return summaries
+
+
+@dataclass
+class HandHistoryIndexEntry:
+    """The class for index entries of PHH sections.
+
+    :param key: The section name.
+    :param offset: The byte offset of the section.
+    :param length: The byte length of the section.
+    :param variant: The variant name.
+    :param hand: The hand number.
+    :param table: The table name or number.
+    :param players: The player names.
+    :param year: The year.
+    :param month: The month.
+    :param day: The day.
+    :param time: The time, in the ISO 8601 format.
+    """
+
+    key: str
+    """The section name."""
+    offset: int
+    """The byte offset of the section."""
+    length: int
+    """The byte length of the section."""
+    variant: str | None = None
+    """The variant name."""
+    hand: str | int | None = None
+    """The hand number."""
+    table: str | int | None = None
+    """The table name or number."""
+    players: list[str] | None = None
+    """The player names."""
+    year: int | None = None
+    """The year."""
+    month: int | None = None
+    """The month."""
+    day: int | None = None
+    """The day."""
+    time: str | None = None
+    """The time, in the ISO 8601 format."""
+
+
+@dataclass
+class HandHistoryIndex:
+    """The class for indices of PHH files.
+
+    An index records where each section (i.e. ``[...]``) of a PHH file
+    is and some of its metadata. It can be stored alongside the PHH file
+    to load hands without parsing the unrelated ones.
+
+    >>> hhs = [
+    ...     HandHistory(
+    ...         variant='NT',
+    ...         antes=[0, 0],
+    ...         blinds_or_straddles=[1, 2],
+    ...         min_bet=2,
+    ...         starting_stacks=[200, 200],
+    ...         actions=['d dh p1 ????', 'd dh p2 ????', 'p2 f'],
+    ...         hand=hand,
+    ...         players=players,
+    ...     ) for hand, players in ((1, ['A', 'B']), (2, ['B', 'C']))
+    ... ]
+    >>> fp = BytesIO()
+    >>> HandHistory.dump_all(hhs, fp)
+    >>> index = HandHistoryIndex.build(fp)
+    >>> [entry.key for entry in index.filter(player='C')]
+    ['2']
+    >>> entry, = index.filter(hand=2)
+    >>> index.read(fp, entry) == hhs[1]
+    True
+    >>> index_fp = BytesIO()
+    >>> index.dump(index_fp)
+    >>> HandHistoryIndex.load(index_fp) == index
+    True
+
+    :param entries: The entries.
+    """
+
+    entries: list[HandHistoryIndexEntry]
+    """The entries."""
+
+    @classmethod
+    def build(
+            cls,
+            fp: BinaryIO,
+            *,
+            parse_value: Callable[[str], int] = parse_value,
+    ) -> HandHistoryIndex:
+        """Build the index of a PHH file.
+
+        The file is read from the beginning.
+
+        :param fp: The file pointer.
+        :param parse_value: The value parsing function.
+        :return: The index.
+        """
+        fp.seek(0)
+
+        entries = []
+
+        for offset, section in _split_sections(fp):
+            raw_phhs = loads_toml(section.decode(), parse_float=parse_value)
+
+            for key, raw_phh in raw_phhs.items():
+                time = raw_phh.get('time')
+
+                entries.append(
+                    HandHistoryIndexEntry(
+                        key,
+                        offset,
+                        len(section),
+                        raw_phh.get('variant'),
+                        raw_phh.get('hand'),
+                        raw_phh.get('table'),
+                        raw_phh.get('players'),
+                        raw_phh.get('year'),
+                        raw_phh.get('month'),
+                        raw_phh.get('day'),
+                        None if time is None else time.isoformat(),
+                    ),
+                )
+
+        return cls(entries)
+
+    @classmethod
+    def load(cls, fp: BinaryIO) -> HandHistoryIndex:
+        """Load the index from a file pointer.
+
+        The file is read from the beginning.
+
+        :param fp: The file pointer.
+        :return: The index.
+        """
+        fp.seek(0)
+
+        entries = []
+
+        for line in fp:
+            entries.append(HandHistoryIndexEntry(**loads_json(line)))
+
+        return cls(entries)
+
+    def dump(self, fp: BinaryIO) -> None:
+        """Dump the index to a file pointer.
+
+        Each entry is written as a line of JSON.
+
+        :param fp: The file pointer.
+        :return: ``None``.
+        """
+        for entry in self.entries:
+            fp.write(dumps_json(asdict(entry)).encode())
+            fp.write(b'\n')
+
+    def filter(
+            self,
+            *,
+            hand: str | int | None = None,
+            table: str | int | None = None,
+            player: str | None = None,
+            variant: str | None = None,
+    ) -> Iterator[HandHistoryIndexEntry]:
+        """Iterate through the entries that match the criteria.
+
+        The criteria that are ``None`` are ignored.
+
+        :param hand: The hand number.
+        :param table: The table name or number.
+        :param player: The name of a player in the hand.
+        :param variant: The variant name.
+        :return: The matching entries.
+        """
+        for entry in self.entries:
+            if (
+                    (hand is None or entry.hand == hand)
+                    and (table is None or entry.table == table)
+                    and (
+                        player is None
+                        or (
+                            entry.players is not None
+                            and player in entry.players
+                        )
+                    )
+                    and (variant is None or entry.variant == variant)
+            ):
+                yield entry
+
+    def read(
+            self,
+            fp: BinaryIO,
+            entry: HandHistoryIndexEntry,
+            *,
+            parse_value: Callable[[str], int] = parse_value,
+            **kwargs: Any,
+    ) -> HandHistory:
+        """Load the PHH of an entry from the indexed file.
+
+        Only the section of the entry is read and parsed.
+
+        :param fp: The file pointer of the indexed file.
+        :param entry: The entry.
+        :param parse_value: The value parsing function.
+        :param kwargs: The metadata.
+        :return: The hand history object.
+        """
+        fp.seek(entry.offset)
+
+        section = fp.read(entry.length).decode()
+        raw_phh = loads_toml(section, parse_float=parse_value)[entry.key]
+
+        return HandHistory(
+            **HandHistory._filter_non_fields(**raw_phh | kwargs),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledAction:
+    action: str
+    operate: Callable[[_CompiledAction, State], Any]
+    player: str | None = None
+    player_index: int | None = None
+    cards: tuple[Card, ...] | bool = ()
+    amount: int | None = None
+    commentary: str | None = None
+    error_type: type[Exception] | None = None
+    error_args: tuple[Any, ...] = ()
+
+    def verify_player(self, index: int | None) -> None:
+        if self.player_index != index:
+            raise ValueError(
+                (
+                    f'The player {repr(self.player)} is not a valid player'
+                    f' for the action {repr(self.action)}.'
+                ),
+            )
+
+
+def _raise_error(compiled_action: _CompiledAction, state: State) -> None:
+    assert compiled_action.error_type is not None
+
+    raise compiled_action.error_type(*compiled_action.error_args)
+
+
+def _deal_board(compiled_action: _CompiledAction, state: State) -> None:
+    assert not isinstance(compiled_action.cards, bool)
+
+    state.deal_board(compiled_action.cards)
+
+
+def _deal_hole(compiled_action: _CompiledAction, state: State) -> None:
+    assert not isinstance(compiled_action.cards, bool)
+
+    state.deal_hole(
+        compiled_action.cards,
+        compiled_action.player_index,
+        commentary=compiled_action.commentary,
+    )
+
+
+def _stand_pat_or_discard(
+        compiled_action: _CompiledAction,
+        state: State,
+) -> None:
+    assert not isinstance(compiled_action.cards, bool)
+
+    compiled_action.verify_player(state.stand_patter_or_discarder_index)
+    state.stand_pat_or_discard(
+        compiled_action.cards,
+        commentary=compiled_action.commentary,
+    )
+
+
+def _post_bring_in(compiled_action: _CompiledAction, state: State) -> None:
+    compiled_action.verify_player(state.actor_index)
+    state.post_bring_in(commentary=compiled_action.commentary)
+
+
+def _fold(compiled_action: _CompiledAction, state: State) -> None:
+    compiled_action.verify_player(state.actor_index)
+    state.fold(commentary=compiled_action.commentary)
+
+
+def _check_or_call(compiled_action: _CompiledAction, state: State) -> None:
+    compiled_action.verify_player(state.actor_index)
+    state.check_or_call(commentary=compiled_action.commentary)
+
+
+def _complete_bet_or_raise_to(
+        compiled_action: _CompiledAction,
+        state: State,
+) -> None:
+    compiled_action.verify_player(state.actor_index)
+    state.complete_bet_or_raise_to(
+        compiled_action.amount,
+        commentary=compiled_action.commentary,
+    )
+
+
+def _show_or_muck_hole_cards(
+        compiled_action: _CompiledAction,
+        state: State,
+) -> None:
+    state.show_or_muck_hole_cards(
+        compiled_action.cards,
+        compiled_action.player_index,
+        commentary=compiled_action.commentary,
+    )
+
+
+def _no_operate(compiled_action: _CompiledAction, state: State) -> None:
+    state.no_operate(commentary=compiled_action.commentary)
+
+
+def _compile_action(
+        action: str,
+        parse_value: Callable[[str], int] = parse_value,
+) -> _CompiledAction:
+
+    def get_player_index() -> int:
+        label, parsed_index = player[:1], int(player[1:]) - 1
+
+        if label != 'p':
+            raise ValueError(f'{repr(player)} is not a valid player label.')
+
+        return parsed_index
+
+    commentary = action[action.index('#') + 2:] if '#' in action else None
+    words = action.split()
+
+    if '#' in words:
+        words = words[:words.index('#')]
+
+    try:
+        match words:
+            case 'd', 'db', cards:
+                return _CompiledAction(
+                    action,
+                    _deal_board,
+                    cards=Card.clean(cards),
+                    commentary=commentary,
+                )
+            case 'd', 'dh', player, cards:
+                return _CompiledAction(
+                    action,
+                    _deal_hole,
+                    player,
+                    get_player_index(),
+                    Card.clean(cards),
+                    commentary=commentary,
+                )
+            case player, 'sd':
+                return _CompiledAction(
+                    action,
+                    _stand_pat_or_discard,
+                    player,
+                    get_player_index(),
+                    commentary=commentary,
+                )
+            case player, 'sd', cards:
+                return _CompiledAction(
+                    action,
+                    _stand_pat_or_discard,
+                    player,
+                    get_player_index(),
+                    Card.clean(cards),
+                    commentary=commentary,
+                )
+            case player, 'pb':
+                return _CompiledAction(
+                    action,
+                    _post_bring_in,
+                    player,
+                    get_player_index(),
+                    commentary=commentary,
+                )
+            case player, 'f':
+                return _CompiledAction(
+                    action,
+                    _fold,
+                    player,
+                    get_player_index(),
+                    commentary=commentary,
+                )
+            case player, 'cc':
+                return _CompiledAction(
+                    action,
+                    _check_or_call,
+                    player,
+                    get_player_index(),
+                    commentary=commentary,
+                )
+            case player, 'cbr', amount:
+                return _CompiledAction(
+                    action,
+                    _complete_bet_or_raise_to,
+                    player,
+                    get_player_index(),
+                    amount=parse_value(amount),
+                    commentary=commentary,
+                )
+            case player, 'sm':
+                return _CompiledAction(
+                    action,
+                    _show_or_muck_hole_cards,
+                    player,
+                    get_player_index(),
+                    False,
+                    commentary=commentary,
+                )
+            case player, 'sm', '-':
+                return _CompiledAction(
+                    action,
+                    _show_or_muck_hole_cards,
+                    player,
+                    get_player_index(),
+                    True,
+                    commentary=commentary,
+                )
+            case player, 'sm', cards:
+                return _CompiledAction(
+                    action,
+                    _show_or_muck_hole_cards,
+                    player,
+                    get_player_index(),
+                    Card.clean(cards),
+                    commentary=commentary,
+                )
+            case ():
+                return _CompiledAction(
+                    action,
+                    _no_operate,
+                    commentary=commentary,
+                )
+            case _:
+                raise ValueError(
+                    f'The action {repr(action)} is an invalid action.',
+                )
+    except (KeyError, ValueError) as error:
+        return _CompiledAction(
+            action,
+            _raise_error,
+            error_type=type(error),
+            error_args=error.args,
+        )
+
+
+_BINARY_MAGIC = b'PKHH'
+_BINARY_VERSION = 1
+_BINARY_UNSERIALIZED_FIELD_NAMES = frozenset(
+    {
+        'variant',
+        'hand',
+        'players',
+        'starting_stacks',
+        'actions',
+        'user_defined_fields',
+        'automations',
+        'divmod',
+        'rake',
+        'parse_value',
+    },
+)
+_BINARY_ACTION_CACHE_SIZE = 1 << 16
+_CARDS = tuple(Card(rank, suit) for rank in Rank for suit in Suit)
+_CARD_CODES = {card: i for i, card in enumerate(_CARDS)}
+
+
+@unique
+class _BinaryValueTag(IntEnum):
+    NONE = 0
+    FALSE = 1
+    TRUE = 2
+    INTEGER = 3
+    NEGATIVE_INTEGER = 4
+    DECIMAL = 5
+    STRING = 6
+    TIME = 7
+    LIST = 8
+    TUPLE = 9
+    DICT = 10
+
+
+@unique
+class _BinaryActionKind(IntEnum):
+    RAW = 0
+    BOARD_DEALING = 1
+    HOLE_DEALING = 2
+    STANDING_PAT_OR_DISCARDING = 3
+    BRING_IN_POSTING = 4
+    FOLDING = 5
+    CHECKING_OR_CALLING = 6
+    COMPLETION_BETTING_OR_RAISING_TO = 7
+    HOLE_CARDS_SHOWING_OR_MUCKING = 8
+    NO_OPERATION = 9
+
+
+_BINARY_ACTION_KINDS: dict[Any, _BinaryActionKind] = {
+    _deal_board: _BinaryActionKind.BOARD_DEALING,
+    _deal_hole: _BinaryActionKind.HOLE_DEALING,
+    _stand_pat_or_discard: _BinaryActionKind.STANDING_PAT_OR_DISCARDING,
+    _post_bring_in: _BinaryActionKind.BRING_IN_POSTING,
+    _fold: _BinaryActionKind.FOLDING,
+    _check_or_call: _BinaryActionKind.CHECKING_OR_CALLING,
+    _complete_bet_or_raise_to: (
+        _BinaryActionKind.COMPLETION_BETTING_OR_RAISING_TO
+    ),
+    _show_or_muck_hole_cards: (
+        _BinaryActionKind.HOLE_CARDS_SHOWING_OR_MUCKING
+    ),
+    _no_operate: _BinaryActionKind.NO_OPERATION,
+}
+_BINARY_ACTION_WORDS = {
+    _BinaryActionKind.STANDING_PAT_OR_DISCARDING: 'sd',
+    _BinaryActionKind.BRING_IN_POSTING: 'pb',
+    _BinaryActionKind.FOLDING: 'f',
+    _BinaryActionKind.CHECKING_OR_CALLING: 'cc',
+    _BinaryActionKind.COMPLETION_BETTING_OR_RAISING_TO: 'cbr',
+    _BinaryActionKind.HOLE_CARDS_SHOWING_OR_MUCKING: 'sm',
+}
+
+
+def _render_action(
+        kind: _BinaryActionKind,
+        player_index: int | None,
+        cards: tuple[Card, ...] | bool,
+        amount: int | None,
+        commentary: str | None,
+) -> str:
+    words = []
+
+    if kind in (
+            _BinaryActionKind.BOARD_DEALING,
+            _BinaryActionKind.HOLE_DEALING,
+    ):
+        words.append('d')
+        words.append('db' if kind == _BinaryActionKind.BOARD_DEALING else 'dh')
+
+    if player_index is not None:
+        words.append(f'p{player_index + 1}')
+
+    if kind in _BINARY_ACTION_WORDS:
+        words.append(_BINARY_ACTION_WORDS[kind])
+
+    if cards is True:
+        words.append('-')
+    elif cards is not False and cards:
+        words.append(''.join(map(repr, cards)))
+
+    if amount is not None:
+        words.append(str(amount))
+
+    if commentary is not None:
+        words.append(f'# {commentary}')
+
+    return ' '.join(words)
+
+
+class _BinaryWriter:
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.string_indices: dict[str, int] = {}
+        self.action_data: dict[tuple[str, Any], bytes] = {}
+
+    def write_integer(self, value: int) -> None:
+        while value >= 0x80:
+            self.data.append(value & 0x7F | 0x80)
+
+            value >>= 7
+
+        self.data.append(value)
+
+    def write_bytes(self, value: bytes) -> None:
+        self.write_integer(len(value))
+        self.data.extend(value)
+
+    def write_interned_string(self, value: str) -> None:
+        if value in self.string_indices:
+            self.write_integer(self.string_indices[value] + 1)
+        else:
+            self.string_indices[value] = len(self.string_indices)
+
+            self.write_integer(0)
+            self.write_bytes(value.encode())
+
+    def write_cards(self, cards: tuple[Card, ...]) -> None:
+        self.write_integer(len(cards))
+        self.data.extend(map(_CARD_CODES.__getitem__, cards))
+
+    def write_value(self, value: Any) -> None:
+        if type(value) is int and value >= 0:
+            self.data.append(_BinaryValueTag.INTEGER)
+            self.write_integer(value)
+        elif value is None:
+            self.data.append(_BinaryValueTag.NONE)
+        elif isinstance(value, bool):
+            if value:
+                self.data.append(_BinaryValueTag.TRUE)
+            else:
+                self.data.append(_BinaryValueTag.FALSE)
+        elif isinstance(value, int):
+            if value >= 0:
+                self.data.append(_BinaryValueTag.INTEGER)
+                self.write_integer(value)
+            else:
+                self.data.append(_BinaryValueTag.NEGATIVE_INTEGER)
+                self.write_integer(-value)
+        elif isinstance(value, Decimal):
+            self.data.append(_BinaryValueTag.DECIMAL)
+            self.write_bytes(str(value).encode())
+        elif isinstance(value, str):
+            self.data.append(_BinaryValueTag.STRING)
+            self.write_bytes(value.encode())
+        elif isinstance(value, datetime.time):
+            self.data.append(_BinaryValueTag.TIME)
+            self.write_bytes(value.isoformat().encode())
+        elif isinstance(value, (list, tuple)):
+            if isinstance(value, list):
+                self.data.append(_BinaryValueTag.LIST)
+            else:
+                self.data.append(_BinaryValueTag.TUPLE)
+
+            self.write_integer(len(value))
+
+            for sub_value in value:
+                self.write_value(sub_value)
+        elif isinstance(value, dict):
+            self.data.append(_BinaryValueTag.DICT)
+            self.write_integer(len(value))
+
+            for key, sub_value in value.items():
+                self.write_value(key)
+                self.write_value(sub_value)
+        else:
+            raise ValueError(
+                f'The value {repr(value)} cannot be written as binary.',
+            )
+
+    def write_header(self, hh: HandHistory) -> None:
+        self.write_interned_string(hh.variant)
+        self.write_value(hh.hand)
+
+        if hh.players is None:
+            self.write_integer(0)
+        else:
+            self.write_integer(len(hh.players) + 1)
+
+            for player in hh.players:
+                self.write_interned_string(player)
+
+        self.write_value(hh.starting_stacks)
+        self.write_value(hh.final_stacks)
+
+    def write_action(
+            self,
+            compiled_action: _CompiledAction,
+            parse_value: Callable[[str], int],
+    ) -> None:
+        key = compiled_action.action, parse_value
+        data = self.action_data.get(key)
+
+        if data is None:
+            if len(self.action_data) >= _BINARY_ACTION_CACHE_SIZE:
+                self.action_data.clear()
+
+            start = len(self.data)
+
+            self._write_action(compiled_action)
+
+            self.action_data[key] = bytes(self.data[start:])
+        else:
+            self.data.extend(data)
+
+    def _write_action(self, compiled_action: _CompiledAction) -> None:
+        kind = _BINARY_ACTION_KINDS.get(
+            compiled_action.operate,
+            _BinaryActionKind.RAW,
+        )
+
+        if (
+                kind != _BinaryActionKind.RAW
+                and _render_action(
+                    kind,
+                    compiled_action.player_index,
+                    compiled_action.cards,
+                    compiled_action.amount,
+                    compiled_action.commentary,
+                ) != compiled_action.action
+        ):
+            kind = _BinaryActionKind.RAW
+
+        if kind == _BinaryActionKind.RAW:
+            self.data.append(kind)
+            self.write_bytes(compiled_action.action.encode())
+
+            return
+
+        cards = compiled_action.cards
+        commentary = compiled_action.commentary
+
+        if isinstance(cards, bool):
+            flags = 2 + cards
+        elif cards:
+            flags = 1
+        else:
+            flags = 0
+
+        if commentary is not None:
+            flags |= 4
+
+        self.data.append(kind | flags << 4)
+
+        if compiled_action.player_index is not None:
+            self.write_integer(compiled_action.player_index)
+
+        if flags & 3 == 1:
+            assert not isinstance(cards, bool)
+
+            self.write_cards(cards)
+
+        if kind == _BinaryActionKind.COMPLETION_BETTING_OR_RAISING_TO:
+            self.write_value(compiled_action.amount)
+
+        if commentary is not None:
+            self.write_bytes(commentary.encode())
+
+
+class _BinaryReader:
+    def __init__(self) -> None:
+        self.data = b''
+        self.offset = 0
+        self.strings: list[str] = []
+        self.actions: dict[bytes, str] = {}
+
+    def read_integer(self) -> int:
+        byte = self.data[self.offset]
+
+        if byte < 0x80:
+            self.offset += 1
+
+            return byte
+
+        value = 0
+        shift = 0
+
+        while True:
+            byte = self.data[self.offset]
+            self.offset += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+
+            if byte < 0x80:
+                return value
+
+    def read_bytes(self) -> bytes:
+        length = self.read_integer()
+        value = self.data[self.offset:self.offset + length]
+
+        if len(value) != length:
+            raise ValueError('The data is truncated.')
+
+        self.offset += length
+
+        return value
+
+    def read_interned_string(self) -> str:
+        index = self.read_integer()
+
+        if index:
+            return self.strings[index - 1]
+
+        value = self.read_bytes().decode()
+
+        self.strings.append(value)
+
+        return value
+
+    def read_card_codes(self) -> bytes:
+        count = self.read_integer()
+        codes = self.data[self.offset:self.offset + count]
+
+        if len(codes) != count:
+            raise ValueError('The data is truncated.')
+
+        self.offset += count
+
+        return codes
+
+    def read_value(self) -> Any:
+        tag = self.data[self.offset]
+        self.offset += 1
+        value: Any
+
+        if tag == _BinaryValueTag.INTEGER:
+            return self.read_integer()
+
+        match tag:
+            case _BinaryValueTag.NONE:
+                value = None
+            case _BinaryValueTag.FALSE:
+                value = False
+            case _BinaryValueTag.TRUE:
+                value = True
+            case _BinaryValueTag.INTEGER:
+                value = self.read_integer()
+            case _BinaryValueTag.NEGATIVE_INTEGER:
+                value = -self.read_integer()
+            case _BinaryValueTag.DECIMAL:
+                value = Decimal(self.read_bytes().decode())
+            case _BinaryValueTag.STRING:
+                value = self.read_bytes().decode()
+            case _BinaryValueTag.TIME:
+                value = datetime.time.fromisoformat(self.read_bytes().decode())
+            case _BinaryValueTag.LIST:
+                value = [self.read_value() for _ in range(self.read_integer())]
+            case _BinaryValueTag.TUPLE:
+                value = tuple(
+                    self.read_value() for _ in range(self.read_integer())
+                )
+            case _BinaryValueTag.DICT:
+                value = {}
+
+                for _ in range(self.read_integer()):
+                    key = self.read_value()
+                    value[key] = self.read_value()
+            case _:
+                raise ValueError(f'The value tag {tag} is unknown.')
+
+        return value
+
+    def read_header(
+            self,
+    ) -> tuple[str, str | int | None, list[str] | None, Any, Any]:
+        variant = self.read_interned_string()
+        hand = self.read_value()
+        player_count = self.read_integer()
+        players = None
+
+        if player_count:
+            players = [
+                self.read_interned_string() for _ in range(player_count - 1)
+            ]
+
+        starting_stacks = self.read_value()
+        final_stacks = self.read_value()
+
+        return variant, hand, players, starting_stacks, final_stacks
+
+    def read_action(self) -> str:
+        start = self.offset
+        byte = self.data[self.offset]
+        self.offset += 1
+        kind = _BinaryActionKind(byte & 0x0F)
+        flags = byte >> 4
+
+        if kind == _BinaryActionKind.RAW:
+            return self.read_bytes().decode()
+
+        player_index = None
+        codes = b''
+        amount = None
+
+        if kind not in (
+                _BinaryActionKind.BOARD_DEALING,
+                _BinaryActionKind.NO_OPERATION,
+        ):
+            player_index = self.read_integer()
+
+        if flags & 3 == 1:
+            codes = self.read_card_codes()
+
+        if kind == _BinaryActionKind.COMPLETION_BETTING_OR_RAISING_TO:
+            amount = self.read_value()
+
+        if flags & 4:
+            commentary = self.read_bytes().decode()
+        else:
+            commentary = None
+
+        key = self.data[start:self.offset]
+        action = self.actions.get(key)
+
+        if action is None:
+            cards: tuple[Card, ...] | bool
+
+            if flags & 3 == 1:
+                cards = tuple(map(_CARDS.__getitem__, codes))
+            elif flags & 3:
+                cards = bool((flags & 3) - 2)
+            else:
+                cards = ()
+
+            if len(self.actions) >= _BINARY_ACTION_CACHE_SIZE:
+                self.actions.clear()
+
+            action = _render_action(
+                kind,
+                player_index,
+                cards,
+                amount,
+                commentary,
+            )
+            self.actions[key] = action
+
+        return action
+
+
+def _read_binary_records(fp: BinaryIO) -> Iterator[tuple[int, bytes]]:
+    if fp.read(len(_BINARY_MAGIC)) != _BINARY_MAGIC:
+        raise ValueError('The data is not a binary hand history.')
+
+    version = fp.read(1)
+
+    if version != bytes((_BINARY_VERSION,)):
+        raise ValueError(
+            f'The binary hand history version {repr(version)} is unsupported.',
+        )
+
+    offset = len(_BINARY_MAGIC) + 1
+
+    while raw_byte := fp.read(1):
+        record_offset = offset
+        length = 0
+        shift = 0
+
+        while True:
+            byte = raw_byte[0]
+            offset += 1
+            length |= (byte & 0x7F) << shift
+            shift += 7
+
+            if byte < 0x80:
+                break
+
+            raw_byte = fp.read(1)
+
+            if not raw_byte:
+                raise ValueError('The data is truncated.')
+
+        record = fp.read(length)
+
+        if len(record) != length:
+            raise ValueError('The data is truncated.')
+
+        offset += length
+
+        yield record_offset, record
 
 
 def parse_action(
@@ -1266,104 +2863,319 @@ def parse_action(
     :param parse_value: The value parsing function.
     :return: ``None``.
     """
+    compiled_action = _compile_action(action, parse_value)
 
-    def get_player_index() -> int:
-        label, parsed_index = player[:1], int(player[1:]) - 1
+    compiled_action.operate(compiled_action, state)
 
-        if label != 'p':
-            raise ValueError(f'{repr(player)} is not a valid player label.')
 
-        return parsed_index
+_PARSER_CHUNK_SIZE = 1 << 16
+_PARSER_BUFFER_SIZE = 1 << 22
+_PARSER_GAP_SIZE = 1 << 16
 
-    def verify_player(index: int | None) -> None:
-        if get_player_index() != index:
-            raise ValueError(
-                (
-                    f'The player {repr(player)} is not a valid player for the'
-                    f' action {repr(action)}.'
-                ),
-            )
 
-    commentary = action[action.index('#') + 2:] if '#' in action else None
-    words = action.split()
+def _iterate_text(
+        s: str | bytes | Iterable[str] | Iterable[bytes],
+        chunk_size: int = _PARSER_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Iterate through the text of hand history logs in chunks.
 
-    if '#' in words:
-        words = words[:words.index('#')]
+    Bytes are decoded as UTF-8 with universal newlines, even when a
+    character or a line break is split between chunks. File objects
+    are read ``chunk_size`` characters or bytes at a time.
 
-    match words:
-        case 'd', 'db', cards:
-            state.deal_board(cards)
-        case 'd', 'dh', player, cards:
-            state.deal_hole(
-                cards,
-                get_player_index(),
-                commentary=commentary,
-            )
-        case player, 'sd':
-            verify_player(state.stand_patter_or_discarder_index)
-            state.stand_pat_or_discard(commentary=commentary)
-        case player, 'sd', cards:
-            verify_player(state.stand_patter_or_discarder_index)
-            state.stand_pat_or_discard(cards, commentary=commentary)
-        case player, 'pb':
-            verify_player(state.actor_index)
-            state.post_bring_in(commentary=commentary)
-        case player, 'f':
-            verify_player(state.actor_index)
-            state.fold(commentary=commentary)
-        case player, 'cc':
-            verify_player(state.actor_index)
-            state.check_or_call(commentary=commentary)
-        case player, 'cbr', amount:
-            verify_player(state.actor_index)
-            state.complete_bet_or_raise_to(
-                parse_value(amount),
-                commentary=commentary,
-            )
-        case player, 'sm':
-            state.show_or_muck_hole_cards(
-                False,
-                get_player_index(),
-                commentary=commentary,
-            )
-        case player, 'sm', '-':
-            state.show_or_muck_hole_cards(
-                True,
-                get_player_index(),
-                commentary=commentary,
-            )
-        case player, 'sm', cards:
-            state.show_or_muck_hole_cards(
-                cards,
-                get_player_index(),
-                commentary=commentary,
-            )
-        case ():
-            state.no_operate(commentary=commentary)
-        case _:
-            raise ValueError(
-                f'The action {repr(action)} is an invalid action.',
-            )
+    >>> list(_iterate_text('Hand #1'))
+    ['Hand #1']
+    >>> ''.join(_iterate_text([b'Hand #1\\r', b'\\n\\xe2\\x82', b'\\xac1']))
+    'Hand #1\\n\\u20ac1'
+    >>> list(_iterate_text(BytesIO(b'Hand #1'), 4))
+    ['Hand', ' #1']
+
+    :param s: The hand history logs, as a ``str``, ``bytes``, a text
+              or binary file object, or an iterable of chunks.
+    :param chunk_size: The chunk size of file objects, defaults to
+                       ``65536``.
+    :return: The chunks of the text.
+    """
+    if isinstance(s, str):
+        yield s
+
+        return
+
+    chunks: Iterable[str | bytes]
+
+    if isinstance(s, bytes):
+        chunks = (s,)
+    elif (read := getattr(s, 'read', None)) is not None:
+        chunks = takewhile(bool, map(read, repeat(chunk_size)))
+    else:
+        chunks = s
+
+    decoder = IncrementalNewlineDecoder(
+        getincrementaldecoder('utf-8')(),
+        True,
+    )
+
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            yield chunk
+        elif text := decoder.decode(chunk):
+            yield text
+
+    if text := decoder.decode(b'', True):
+        yield text
+
+
+def _iterate_matches(
+        patterns: Iterable[Pattern[str]],
+        chunks: Iterable[str],
+) -> Iterator[tuple[int, str, Match[str]]]:
+    """Find the matches of the patterns in text read in chunks.
+
+    Each match is yielded once the text after it is read, in order
+    of position. Only the text from the start of the last match is
+    kept between scans, and the text is scanned again only once its
+    size doubles. While nothing matches, at most ``4194304`` characters
+    are kept, so a match must be shorter than half of that to be
+    found. Likewise, only the last ``65536`` characters of the
+    unmatched text are yielded.
+
+    >>> pattern = compile(r'^<.+?>', DOTALL | MULTILINE)
+    >>> chunks = ['#\\n<a', '>\\n<b\\n', '>']
+    >>> for offset, gap, m in _iterate_matches((pattern,), chunks):
+    ...     offset, gap, m[0]
+    (2, '#\\n', '<a>')
+    (6, '\\n', '<b\\n>')
+
+    :param patterns: The patterns.
+    :param chunks: The chunks of the text.
+    :return: The offsets in the text, the unmatched text before, and
+             the matches.
+    """
+    patterns = tuple(patterns)
+
+    def find_all() -> list[Match[str]]:
+        matches: list[Match[str]] = []
+
+        for pattern in patterns:
+            matches.extend(pattern.finditer(buffer, start))
+
+        if len(patterns) > 1:
+            matches.sort(key=Match.start)
+
+        return matches
+
+    buffer = ''
+    offset = 0
+    gap = ''
+    start = 0
+    scan_size = 0
+    pending_chunks: list[str] = []
+    pending_size = 0
+
+    for chunk in chunks:
+        pending_chunks.append(chunk)
+
+        pending_size += len(chunk)
+
+        if len(buffer) + pending_size < scan_size:
+            continue
+
+        buffer += ''.join(pending_chunks)
+        pending_size = 0
+
+        pending_chunks.clear()
+
+        matches = find_all()
+
+        if not matches:
+            if len(buffer) > _PARSER_BUFFER_SIZE:
+                # The character before the kept text is kept too (but
+                # not scanned) so that anchors like ``^`` still work.
+                index = len(buffer) - _PARSER_BUFFER_SIZE // 2
+                gap = (gap + buffer[start:index])[-_PARSER_GAP_SIZE:]
+                offset += index - 1
+                buffer = buffer[index - 1:]
+                start = 1
+
+            scan_size = max(2 * len(buffer), _PARSER_CHUNK_SIZE)
+
+            continue
+
+        last_match = matches.pop()
+
+        for m in matches:
+            gap += buffer[start:m.start()]
+
+            yield offset + m.start(), gap[-_PARSER_GAP_SIZE:], m
+
+            gap = ''
+            start = m.end()
+
+        gap = (gap + buffer[start:last_match.start()])[-_PARSER_GAP_SIZE:]
+        offset += last_match.start()
+        buffer = buffer[last_match.start():]
+        start = 0
+        scan_size = max(2 * len(buffer), _PARSER_CHUNK_SIZE)
+
+    buffer += ''.join(pending_chunks)
+
+    for m in find_all():
+        gap += buffer[start:m.start()]
+
+        yield offset + m.start(), gap[-_PARSER_GAP_SIZE:], m
+
+        gap = ''
+        start = m.end()
+
+
+_LEADING_WILDCARD = compile(r'(\(\?P<\w+>)?\.\+(?(1)\))(?![?*+{])')
+_BACKREFERENCE = compile(r'\(\?P=|\\[1-9]')
+
+
+@cache
+def _get_line_searcher(
+        pattern: Pattern[str],
+) -> Callable[[str], Match[str] | None]:
+    """Return the function that searches a line for the pattern.
+
+    A pattern beginning with a greedy wildcard (like
+    ``(?P<player>.+)``) that matches somewhere in a line without
+    line breaks also matches at its start, so it is matched there
+    instead of being retried at every position.
+
+    >>> pattern = compile(r'(?P<player>.+): folds')
+    >>> _get_line_searcher(pattern) == pattern.match
+    True
+    >>> _get_line_searcher(pattern)('Alice: folds')['player']
+    'Alice'
+    >>> pattern = compile(r'Seat (?P<seat>\\d+): ')
+    >>> _get_line_searcher(pattern) == pattern.search
+    True
+    >>> pattern = compile(r'(?P<player>.+): folds|Folded')
+    >>> _get_line_searcher(pattern) == pattern.search
+    True
+
+    :param pattern: The pattern.
+    :return: The search function.
+    """
+    source = pattern.pattern
+
+    if not _LEADING_WILDCARD.match(source) or _BACKREFERENCE.search(source):
+        return pattern.search
+
+    depth = 0
+    escape_status = False
+    character_class_status = False
+
+    for character in source:
+        if escape_status:
+            escape_status = False
+        elif character == '\\':
+            escape_status = True
+        elif character_class_status:
+            character_class_status = character != ']'
+        elif character == '[':
+            character_class_status = True
+        elif character == '(':
+            depth += 1
+        elif character == ')':
+            depth -= 1
+        elif character == '|' and not depth:
+            return pattern.search
+
+    return pattern.match
+
+
+@dataclass(slots=True)
+class _ScannedHand:
+    seats: dict[str, int] = field(default_factory=dict)
+    players: set[str] = field(default_factory=set)
+    antes: defaultdict[str, int] = field(
+        default_factory=partial(defaultdict, int),
+    )
+    blinds_or_straddles: defaultdict[str, int] = field(
+        default_factory=partial(defaultdict, int),
+    )
+    starting_stacks: dict[str, int] = field(default_factory=dict)
+    actions: list[Match[str]] = field(default_factory=list)
+    player_variables: dict[str, defaultdict[str, Any]] = field(
+        default_factory=dict,
+    )
+
+
+@dataclass(frozen=True)
+class ParsingFailure:
+    """The class for failures to parse hands in hand history logs.
+
+    :param index: The index of the hand among the hands found in the
+                  logs.
+    :param offset: The offset of the hand in the text of the logs.
+    :param text: The text of the hand.
+    :param error: The error.
+    """
+
+    index: int
+    """The index of the hand among the hands found in the logs."""
+    offset: int
+    """The offset of the hand in the text of the logs."""
+    text: str
+    """The text of the hand."""
+    error: Exception
+    """The error."""
 
 
 @dataclass
 class Parser(ABC):
     """An abstract base class for hand history parser.
 
-    Parsers, when called with raw hand history log string, return a
-    generator of poker hand histories.
+    Parsers, when called with raw hand history logs, return a
+    generator of poker hand histories. The logs can be a ``str``,
+    ``bytes`` (decoded as UTF-8), a text or binary file object, or an
+    iterable of chunks, and are split into hands as they are read.
+
+    Hands that cannot be parsed are reported as
+    :class:`pokerkit.notation.ParsingFailure` instances to
+    ``error_sink``, if supplied, and otherwise warned about. If
+    ``error_status`` is ``True``, an error is raised.
+
+    >>> failures = []
+    >>> hhs = PokerStarsParser()(
+    ...     'PokerStars Hand #1: ???\\n\\n\\n',
+    ...     error_sink=failures.append,
+    ... )
+    >>> list(hhs)
+    []
+    >>> failures[0].index, failures[0].offset, failures[0].text
+    (0, 0, 'PokerStars Hand #1: ???\\n')
     """
 
     @abstractmethod
     def __call__(
             self,
-            s: str,
+            s: str | bytes | Iterable[str] | Iterable[bytes],
             *,
             parse_value: Callable[[str], int] = parse_value,
             error_status: bool = False,
+            error_sink: Callable[[ParsingFailure], Any] | None = None,
     ) -> Generator[HandHistory, None, int]:
         pass
 
+    def _report_failure(
+            self,
+            failure: ParsingFailure,
+            error_status: bool,
+            error_sink: Callable[[ParsingFailure], Any] | None,
+    ) -> None:
+        message = f'Unable to parse {repr(failure.text)}.'
+
+        if error_sink is not None:
+            error_sink(failure)
+
+        if error_status:
+            raise ValueError(message) from failure.error
+        elif error_sink is None:
+            warn(message)
+
 
 @dataclass
 class REParser(Parser, ABC):
@@ -1417,50 +3229,75 @@ class REParser(Parser, ABC):
         ],
     ]
     """Player variables."""
+    replay_status: bool = True
+    """The replay status.
+
+    If ``True`` (the default), each parsed hand is replayed and
+    converted back into a hand history, which validates it and
+    spells out every dealing and showdown. If ``False``, the hand
+    history is emitted directly from the parsed actions. Such hand
+    histories are validated only when they are replayed (e.g. with
+    :meth:`pokerkit.notation.HandHistory.create_final_state`, which
+    raises a :class:`ValueError` on an invalid hand).
+    """
 
     def __call__(
             self,
-            s: str,
+            s: str | bytes | Iterable[str] | Iterable[bytes],
             *,
             parse_value: Callable[[str], int] = parse_value,
             error_status: bool = False,
+            error_sink: Callable[[ParsingFailure], Any] | None = None,
     ) -> Generator[HandHistory, None, int]:
-        ss = findall(self.HAND, s)
+        count = 0
+        variables = {}
+
+        for offset, gap, m in _iterate_matches((self.HAND,), _iterate_text(s)):
+            variables.update(self._parse_preceding_variables(gap, parse_value))
 
-        for s in ss:
             try:
-                hh = self._parse(s, parse_value)
-            except (KeyError, ValueError):
-                from traceback import print_exc
-                print_exc()
-                message = f'Unable to parse {repr(s)}.'
-
-                if error_status:
-                    raise ValueError(message)
-                else:
-                    warn(message)
+                hh = self._parse(m[0], parse_value)
+            except (KeyError, ValueError) as error:
+                self._report_failure(
+                    ParsingFailure(count, offset, m[0], error),
+                    error_status,
+                    error_sink,
+                )
             else:
+                for key, value in variables.items():
+                    if getattr(hh, key, None) is None:
+                        setattr(hh, key, value)
+
                 yield hh
 
-        return len(ss)
+            count += 1
+
+        return count
+
+    def _parse_preceding_variables(
+            self,
+            s: str,
+            parse_value: Callable[[str], Any],
+    ) -> dict[str, Any]:
+        return {}
 
     def _parse(self, s: str, parse_value: Callable[[str], int]) -> HandHistory:
         final_seat = self._parse_final_seat(s)
-        parsed_seats = self._parse_seats(s)
-        parsed_players = self._parse_players(s)
         variant = self._parse_variant(s)
-        parsed_antes = self._parse_antes(s, parse_value)
-        parsed_blinds_or_straddles = self._parse_blinds_or_straddles(
+        scanned_hand = self._scan(s, parse_value)
+        parsed_seats = scanned_hand.seats
+        parsed_antes = scanned_hand.antes
+        parsed_blinds_or_straddles = scanned_hand.blinds_or_straddles
+        parsed_starting_stacks = self._parse_starting_stacks(
             s,
+            scanned_hand,
             parse_value,
         )
-        parsed_starting_stacks = self._parse_starting_stacks(s, parse_value)
-        players = sorted(parsed_players, key=parsed_seats.__getitem__)
+        players = sorted(scanned_hand.players, key=parsed_seats.__getitem__)
         seats = list(map(parsed_seats.__getitem__, players))
         players = self._get_ordered_players(
-            s,
+            scanned_hand,
             final_seat,
-            parsed_blinds_or_straddles,
             players,
             seats,
         )
@@ -1484,129 +3321,187 @@ class REParser(Parser, ABC):
         starting_stacks = list(
             map(parsed_starting_stacks.__getitem__, players),
         )
-        actions = self._parse_actions(s, parse_value, players)
-        hh = HandHistory(
-            variant=variant,
-            antes=antes,
-            blinds_or_straddles=blinds_or_straddles,
-            min_bet=max(blinds_or_straddles[:2]),
-            starting_stacks=starting_stacks,
-            actions=actions,
+        actions = self._parse_actions(
+            scanned_hand.actions,
+            parse_value,
+            players,
         )
-        game = hh.create_game()
-        state = tuple(hh)[-1]
-        hh = HandHistory.from_game_state(
-            game,
-            state,
-            seats=seats,
-            players=players,
+        kwargs = {
+            'seats': seats,
+            'players': players,
             **self.CONSTANTS,
             **self._parse_variables(s, parse_value),
             **{
-                key: cast(Any, list(map(value.__getitem__, players)))
-                for key, value
-                in self._parse_player_variables(s, parse_value).items()
+                key: list(map(value.__getitem__, players))
+                for key, value in scanned_hand.player_variables.items()
             },
-        )
+        }
 
-        return hh
+        if self.replay_status:
+            hh = HandHistory(
+                variant=variant,
+                antes=antes,
+                blinds_or_straddles=blinds_or_straddles,
+                min_bet=max(blinds_or_straddles[:2]),
+                starting_stacks=starting_stacks,
+                actions=actions,
+            )
+            game = hh.create_game()
+            state = hh.create_final_state()
+            hh = HandHistory.from_game_state(game, state, **kwargs)
+        else:
+            hh = HandHistory(
+                **HandHistory._filter_non_fields(
+                    variant=variant,
+                    antes=antes,
+                    blinds_or_straddles=blinds_or_straddles,
+                    min_bet=max(blinds_or_straddles[:2]),
+                    starting_stacks=starting_stacks,
+                    actions=actions,
+                    **kwargs,
+                ),
+            )
 
-    def _parse_final_seat(self, s: str) -> int:
-        m = search(self.FINAL_SEAT, s)
+        return hh
 
-        if m is None:
-            raise ValueError('Unable to parse final seat.')
+    def _scan(
+            self,
+            s: str,
+            parse_value: Callable[[str], int],
+    ) -> _ScannedHand:
+        scanned_hand = _ScannedHand()
+        seats = scanned_hand.seats
+        players = scanned_hand.players
+        antes = scanned_hand.antes
+        blinds_or_straddles = scanned_hand.blinds_or_straddles
+        starting_stacks = scanned_hand.starting_stacks
+        actions = scanned_hand.actions
+        search_seats = _get_line_searcher(self.SEATS)
+        search_starting_stacks = _get_line_searcher(self.STARTING_STACKS)
+        search_ante_posting = _get_line_searcher(self.ANTE_POSTING)
+        search_blind_or_straddle_posting = _get_line_searcher(
+            self.BLIND_OR_STRADDLE_POSTING,
+        )
+        search_hole_dealing = _get_line_searcher(self.HOLE_DEALING)
+        search_board_dealing = _get_line_searcher(self.BOARD_DEALING)
+        search_folding = _get_line_searcher(self.FOLDING)
+        search_checking_or_calling = _get_line_searcher(
+            self.CHECKING_OR_CALLING,
+        )
+        search_completion_betting_or_raising = _get_line_searcher(
+            self.COMPLETION_BETTING_OR_RAISING,
+        )
+        search_hole_cards_showing = _get_line_searcher(
+            self.HOLE_CARDS_SHOWING,
+        )
+        player_variables = []
 
-        return int(m['final_seat'])
+        for (
+                key,
+                (pattern, parse_pattern, default_value_factory, merge),
+        ) in self.PLAYER_VARIABLES.items():
+            if parse_pattern is None:
+                parse_pattern = parse_value
 
-    def _parse_seats(self, s: str) -> dict[str, int]:
-        seats = {}
+            player_variables.append(
+                (
+                    key,
+                    _get_line_searcher(pattern),
+                    parse_pattern,
+                    merge,
+                    defaultdict[str, Any](default_value_factory),
+                ),
+            )
 
         for line in s.splitlines():
-            if m := search(self.SEATS, line):
+            if m := search_seats(line):
                 seats[m['player']] = int(m['seat'])
 
-        return seats
+            if m := search_starting_stacks(line):
+                starting_stacks[m['player']] = parse_value(m['starting_stack'])
 
-    def _parse_players(self, s: str) -> set[str]:
-        players = set()
+            if m := search_ante_posting(line):
+                players.add(m['player'])
 
-        for line in s.splitlines():
-            for pattern in (
-                    self.ANTE_POSTING,
-                    self.BLIND_OR_STRADDLE_POSTING,
-                    self.FOLDING,
-                    self.CHECKING_OR_CALLING,
-                    self.COMPLETION_BETTING_OR_RAISING,
-                    self.HOLE_CARDS_SHOWING,
-            ):
-                if m := search(pattern, line):
-                    players.add(m['player'])
+                antes[m['player']] = parse_value(m['ante'])
 
-        return players
+            if m := search_blind_or_straddle_posting(line):
+                players.add(m['player'])
+                actions.append(m)
 
-    def _parse_variant(self, s: str) -> str:
-        m = search(self.VARIANT, s)
+                blinds_or_straddles[m['player']] = parse_value(
+                    m['blind_or_straddle'],
+                )
+            elif (
+                    (m := search_hole_dealing(line))
+                    or (m := search_board_dealing(line))
+            ):
+                actions.append(m)
+            elif (
+                    (m := search_folding(line))
+                    or (m := search_checking_or_calling(line))
+                    or (m := search_completion_betting_or_raising(line))
+                    or (m := search_hole_cards_showing(line))
+            ):
+                players.add(m['player'])
+                actions.append(m)
+
+            for (
+                    key,
+                    search_player_variable,
+                    parse_pattern,
+                    merge,
+                    sub_player_variables,
+            ) in player_variables:
+                if m := search_player_variable(line):
+                    player = m['player']
+                    sub_player_variables[player] = merge(
+                        sub_player_variables[player],
+                        parse_pattern(m[key]),
+                    )
 
-        if m is None:
-            raise ValueError('Unable to parse variant.')
+        for key, _, _, _, sub_player_variables in player_variables:
+            if sub_player_variables:
+                scanned_hand.player_variables[key] = sub_player_variables
 
-        return self.VARIANTS[m['variant']]
+        return scanned_hand
 
-    def _parse_antes(
-            self,
-            s: str,
-            parse_value: Callable[[str], int],
-    ) -> defaultdict[str, int]:
-        antes = defaultdict(int)
+    def _parse_final_seat(self, s: str) -> int:
+        m = search(self.FINAL_SEAT, s)
 
-        for line in s.splitlines():
-            if m := search(self.ANTE_POSTING, line):
-                antes[m['player']] = parse_value(m['ante'])
+        if m is None:
+            raise ValueError('Unable to parse final seat.')
 
-        return antes
+        return int(m['final_seat'])
 
-    def _parse_blinds_or_straddles(
-            self,
-            s: str,
-            parse_value: Callable[[str], int],
-    ) -> defaultdict[str, int]:
-        blinds_or_straddles = defaultdict(int)
+    def _parse_variant(self, s: str) -> str:
+        m = search(self.VARIANT, s)
 
-        for line in s.splitlines():
-            if m := search(self.BLIND_OR_STRADDLE_POSTING, line):
-                blinds_or_straddles[m['player']] = parse_value(
-                    m['blind_or_straddle'],
-                )
+        if m is None:
+            raise ValueError('Unable to parse variant.')
 
-        return blinds_or_straddles
+        return self.VARIANTS[m['variant']]
 
     def _parse_starting_stacks(
             self,
             s: str,
+            scanned_hand: _ScannedHand,
             parse_value: Callable[[str], int],
     ) -> dict[str, int]:
-        starting_stacks = {}
-
-        for line in s.splitlines():
-            if m := search(self.STARTING_STACKS, line):
-                starting_stacks[m['player']] = parse_value(m['starting_stack'])
-
-        return starting_stacks
+        return scanned_hand.starting_stacks
 
     def _get_ordered_players(
             self,
-            s: str,
+            scanned_hand: _ScannedHand,
             final_seat: int,
-            parsed_blinds_or_straddles: defaultdict[str, int],
             players: list[str],
             seats: list[int],
     ) -> list[str]:
         if final_seat in seats:
             final_player_index = seats.index(final_seat)
         else:
-            if parsed_blinds_or_straddles:
-                initial_player = next(iter(parsed_blinds_or_straddles))
+            if scanned_hand.blinds_or_straddles:
+                initial_player = next(iter(scanned_hand.blinds_or_straddles))
                 initial_player_index = players.index(initial_player)
 
                 if len(players) == 2:
@@ -1620,7 +3515,7 @@ class REParser(Parser, ABC):
 
     def _parse_actions(
             self,
-            s: str,
+            matches: Iterable[Match[str]],
             parse_value: Callable[[str], int],
             players: Sequence[str],
     ) -> list[str]:
@@ -1633,26 +3528,26 @@ class REParser(Parser, ABC):
         bets = defaultdict(int)
         actions = []
 
-        for line in s.splitlines():
+        for m in matches:
             action = None
 
-            if m := search(self.BLIND_OR_STRADDLE_POSTING, line):
+            if m.re is self.BLIND_OR_STRADDLE_POSTING:
                 bets[format_player(m)] = parse_value(m['blind_or_straddle'])
-            elif m := search(self.HOLE_DEALING, line):
+            elif m.re is self.HOLE_DEALING:
                 action = (
                     f'd dh {format_player(m)} {self._format_cards(m)}'
                 )
-            elif m := search(self.BOARD_DEALING, line):
+            elif m.re is self.BOARD_DEALING:
                 action = f'd db {self._format_cards(m)}'
 
                 bets.clear()
-            elif m := search(self.FOLDING, line):
+            elif m.re is self.FOLDING:
                 action = f'{format_player(m)} f'
-            elif m := search(self.CHECKING_OR_CALLING, line):
+            elif m.re is self.CHECKING_OR_CALLING:
                 formatted_player = format_player(m)
                 action = f'{formatted_player} cc'
                 bets[formatted_player] = max(bets.values(), default=0)
-            elif m := search(self.COMPLETION_BETTING_OR_RAISING, line):
+            elif m.re is self.COMPLETION_BETTING_OR_RAISING:
                 formatted_player = format_player(m)
                 max_bet = max(bets.values(), default=0)
                 bets[formatted_player] = (
@@ -1660,7 +3555,7 @@ class REParser(Parser, ABC):
                         bets,
                         formatted_player,
                         parse_value(m['amount']),
-                        line,
+                        m.string,
                     )
                 )
 
@@ -1668,7 +3563,7 @@ class REParser(Parser, ABC):
                     action = f'{formatted_player} cc'
                 else:
                     action = f'{formatted_player} cbr {bets[formatted_player]}'
-            elif m := search(self.HOLE_CARDS_SHOWING, line):
+            elif m.re is self.HOLE_CARDS_SHOWING:
                 action = f'{format_player(m)} sm {self._format_cards(m)}'
 
             if action is not None:
@@ -1697,45 +3592,20 @@ class REParser(Parser, ABC):
             parse_value: Callable[[str], Any],
     ) -> dict[str, Any]:
         variables = {}
+        matches: dict[Pattern[str], Match[str] | None] = {}
 
         for key, (pattern, parse_pattern) in self.VARIABLES.items():
             if parse_pattern is None:
                 parse_pattern = parse_value
 
-            if (m := search(pattern, s)) and key in m.groupdict():
+            if pattern not in matches:
+                matches[pattern] = search(pattern, s)
+
+            if (m := matches[pattern]) and key in m.groupdict():
                 variables[key] = parse_pattern(m[key])
 
         return variables
 
-    def _parse_player_variables(
-            self,
-            s: str,
-            parse_value: Callable[[str], Any],
-    ) -> dict[str, defaultdict[str, Any]]:
-        player_variables = {}
-
-        for (
-                key,
-                (pattern, parse_pattern, default_value_factory, merge),
-        ) in self.PLAYER_VARIABLES.items():
-            sub_player_variables = defaultdict[str, Any](default_value_factory)
-
-            if parse_pattern is None:
-                parse_pattern = parse_value
-
-            for line in s.splitlines():
-                if m := search(pattern, line):
-                    player = m['player']
-                    sub_player_variables[player] = merge(
-                        sub_player_variables[player],
-                        parse_pattern(m[key]),
-                    )
-
-            if sub_player_variables:
-                player_variables[key] = sub_player_variables
-
-        return player_variables
-
 
 @dataclass
 class AbsolutePokerParser(REParser):
@@ -1961,9 +3831,14 @@ class FullTiltPokerParser(REParser):
     def _parse_starting_stacks(
             self,
             s: str,
+            scanned_hand: _ScannedHand,
             parse_value: Callable[[str], int],
     ) -> dict[str, int]:
-        starting_stacks = super()._parse_starting_stacks(s, parse_value)
+        starting_stacks = super()._parse_starting_stacks(
+            s,
+            scanned_hand,
+            parse_value,
+        )
         cap = self._cap_starting_stacks(s, parse_value)
 
         if cap is not None:
@@ -2093,41 +3968,24 @@ class IPokerNetworkParser(REParser):
     }
     PLACEHOLDER_STARTING_STACK: ClassVar[int] = 10000000
 
-    def __call__(
+    def _parse_preceding_variables(
             self,
             s: str,
-            *,
-            parse_value: Callable[[str], int] = parse_value,
-            error_status: bool = False,
-    ) -> Generator[HandHistory, None, int]:
-        variables = self._parse_variables(s, parse_value)
-        it = super().__call__(
-            s,
-            parse_value=parse_value,
-            error_status=error_status,
-        )
-        return_value = None
-
-        while return_value is None:
-            try:
-                hh = next(it)
-            except StopIteration as e:
-                return_value = e.value
-            else:
-                for key, value in variables.items():
-                    if getattr(hh, key, None) is None:
-                        setattr(hh, key, value)
-
-                yield hh
-
-        return return_value
+            parse_value: Callable[[str], Any],
+    ) -> dict[str, Any]:
+        return self._parse_variables(s, parse_value)
 
     def _parse_starting_stacks(
             self,
             s: str,
+            scanned_hand: _ScannedHand,
             parse_value: Callable[[str], int],
     ) -> dict[str, int]:
-        starting_stacks = super()._parse_starting_stacks(s, parse_value)
+        starting_stacks = super()._parse_starting_stacks(
+            s,
+            scanned_hand,
+            parse_value,
+        )
 
         for key, value in starting_stacks.items():
             if value == self.PLACEHOLDER_STARTING_STACK:
@@ -2137,35 +3995,31 @@ class IPokerNetworkParser(REParser):
 
     def _get_ordered_players(
             self,
-            s: str,
+            scanned_hand: _ScannedHand,
             final_seat: int,
-            parsed_blinds_or_straddles: defaultdict[str, int],
             players: list[str],
             seats: list[int],
     ) -> list[str]:
         players = super()._get_ordered_players(
-            s,
+            scanned_hand,
             final_seat,
-            parsed_blinds_or_straddles,
             players,
             seats,
         )
         players = players[:2]
+        patterns = (
+            self.FOLDING,
+            self.CHECKING_OR_CALLING,
+            self.COMPLETION_BETTING_OR_RAISING,
+        )
 
-        for line in s.splitlines():
-            player = None
+        for m in scanned_hand.actions:
+            if m.re not in patterns:
+                continue
 
-            for pattern in (
-                    self.FOLDING,
-                    self.CHECKING_OR_CALLING,
-                    self.COMPLETION_BETTING_OR_RAISING,
-            ):
-                if m := search(pattern, line):
-                    player = m['player']
+            player = m['player']
 
-            if player is None:
-                continue
-            elif player in players:
+            if player in players:
                 break
 
             players.append(player)
@@ -2623,28 +4477,27 @@ class ACPCProtocolParser(Parser):
 
     def __call__(
             self,
-            s: str,
+            s: str | bytes | Iterable[str] | Iterable[bytes],
             *,
             parse_value: Callable[[str], int] = parse_value,
             error_status: bool = False,
+            error_sink: Callable[[ParsingFailure], Any] | None = None,
     ) -> Generator[HandHistory, None, int]:
         count = 0
 
-        for pattern in self.HAND:
-            for m in finditer(pattern, s):
-                count += 1
+        for offset, _, m in _iterate_matches(self.HAND, _iterate_text(s)):
+            try:
+                hh = self._parse(m, parse_value)
+            except (KeyError, ValueError) as error:
+                self._report_failure(
+                    ParsingFailure(count, offset, m[0], error),
+                    error_status,
+                    error_sink,
+                )
+            else:
+                yield hh
 
-                try:
-                    hh = self._parse(m, parse_value)
-                except (KeyError, ValueError):
-                    message = f'Unable to parse {repr(m[0])}.'
-
-                    if error_status:
-                        raise ValueError(message)
-                    else:
-                        warn(message)
-                else:
-                    yield hh
+            count += 1
 
         return count
 
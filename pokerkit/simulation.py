@@ -0,0 +1,777 @@
+""":mod:`pokerkit.simulation` implements classes related to simulating
+many hands of self-play.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, MutableSequence, Sequence
+from dataclasses import dataclass, field
+from enum import IntEnum, unique
+from itertools import accumulate
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from typing import Any
+
+from pokerkit.games import Poker
+from pokerkit.state import State
+from pokerkit.utilities import ValuesLike
+
+Policy = Callable[[State], Any]
+"""The type of policies.
+
+A policy is called with a state in which the seat it is responsible for
+must make a decision. The policy is expected to perform exactly one
+operation (e.g. :meth:`pokerkit.state.State.check_or_call`) on the
+state. Its return value is ignored.
+"""
+
+
+def get_decision_maker_index(state: State) -> int | None:
+    """Return the index of the player who must make a decision.
+
+    A decision is either standing pat/discarding, betting (folding,
+    checking/calling, posting the bring-in, or completing/betting/
+    raising), or showing/mucking the hole cards.
+
+    >>> from pokerkit import *
+    >>> state = NoLimitTexasHoldem.create_state(
+    ...     tuple(Automation),
+    ...     False,
+    ...     0,
+    ...     (1, 2),
+    ...     2,
+    ...     200,
+    ...     3,
+    ... )
+    >>> get_decision_maker_index(state)
+    2
+    >>> state.fold()
+    Folding(commentary=None, player_index=2)
+    >>> get_decision_maker_index(state)
+    0
+    >>> state.fold()
+    Folding(commentary=None, player_index=0)
+    >>> get_decision_maker_index(state) is None
+    True
+
+    :param state: The state.
+    :return: The decision maker index if any, otherwise ``None``.
+    """
+    player_index = state.stand_patter_or_discarder_index
+
+    if player_index is None:
+        player_index = state.actor_index
+
+    if player_index is None:
+        player_index = state.showdown_index
+
+    return player_index
+
+
+def encode_observations(
+        states: Sequence[State],
+        player_indices: Sequence[int],
+        buffer: MutableSequence[float] | None = None,
+) -> MutableSequence[float]:
+    """Encode the observations of many states into a single buffer.
+
+    The observation of each state (see
+    :meth:`pokerkit.state.State.encode_observation`) from the
+    perspective of the corresponding player is written contiguously, in
+    order. The states must have the same observation size, which is the
+    case if they are of the same game and number of players.
+
+    >>> from pokerkit import *
+    >>> game = NoLimitTexasHoldem(tuple(Automation), False, 0, (1, 2), 2)
+    >>> states = [game(200, 2), game(200, 2), game(200, 2)]
+    >>> buffer = encode_observations(states, (0, 1, 0))
+    >>> len(buffer)
+    522
+    >>> buffer[174:348] == states[1].encode_observation(1)
+    True
+    >>> encode_observations(states, (0, 1))
+    Traceback (most recent call last):
+        ...
+    ValueError: The numbers of states 3 and player indices 2 differ.
+
+    :param states: The states.
+    :param player_indices: The player index of each state.
+    :param buffer: The optional buffer, defaults to a new
+                   :class:`array.array` of ``float``.
+    :return: The buffer.
+    :raises ValueError: If the arguments are invalid or the buffer is
+                        too small.
+    """
+    if len(states) != len(player_indices):
+        raise ValueError(
+            (
+                f'The numbers of states {len(states)} and player indices'
+                f' {len(player_indices)} differ.'
+            ),
+        )
+    elif not states:
+        return array('d') if buffer is None else buffer
+
+    observation_size = states[0].observation_size
+
+    for state in states:
+        if state.observation_size != observation_size:
+            raise ValueError('The observation sizes of the states differ.')
+
+    if buffer is None:
+        buffer = array('d', bytes(8 * observation_size * len(states)))
+
+    for i, (state, player_index) in enumerate(zip(states, player_indices)):
+        state.encode_observation(player_index, buffer, i * observation_size)
+
+    return buffer
+
+
+def simulate(
+        game: Poker,
+        raw_starting_stacks: ValuesLike,
+        player_count: int,
+        policies: Sequence[Policy],
+        *,
+        hand_count: int,
+        table_count: int = 1,
+) -> list[int]:
+    """Simulate hands of self-play and return the aggregated payoffs.
+
+    Up to ``table_count`` tables are played in lockstep: on each pass,
+    every table with an unfinished hand advances by a single decision.
+    Whenever a hand at a table finishes, its payoffs are accumulated
+    and, if more hands are to be played, a new hand is started at that
+    table by resetting its state (see
+    :meth:`pokerkit.state.State.reset`). Therefore, the policies should
+    not hold on to the states or their attributes across hands.
+
+    Every pending operation that is not a decision (see
+    :func:`pokerkit.simulation.get_decision_maker_index`) is carried
+    out with :meth:`pokerkit.state.State.advance_until_decision`, if the
+    game does not automate it. Runout count selections are decisions
+    that are not passed on to the policies. Therefore, the game must
+    either automate them or not allow them.
+
+    >>> from pokerkit import *
+    >>> game = NoLimitTexasHoldem(
+    ...     (Automation.HOLE_CARDS_SHOWING_OR_MUCKING,),
+    ...     False,
+    ...     0,
+    ...     (1, 2),
+    ...     2,
+    ... )
+    >>> def call(state):
+    ...     state.check_or_call()
+    ...
+    >>> def fold(state):
+    ...     if state.can_fold():
+    ...         state.fold()
+    ...     else:
+    ...         state.check_or_call()
+    ...
+    >>> simulate(game, 200, 2, (call, fold), hand_count=10, table_count=4)
+    [10, -10]
+    >>> sum(simulate(game, 200, 2, (call, call), hand_count=10))
+    0
+
+    :param game: The game.
+    :param raw_starting_stacks: The starting stacks.
+    :param player_count: The number of players.
+    :param policies: The policies of each player.
+    :param hand_count: The number of hands to play.
+    :param table_count: The number of tables to play in lockstep,
+                        defaults to ``1``.
+    :return: The sum of payoffs of each player.
+    :raises ValueError: If the arguments are invalid or a policy or the
+                        game fails to make progress.
+    """
+    if len(policies) != player_count:
+        raise ValueError(
+            (
+                f'The number of policies {len(policies)} does not match the'
+                f' number of players {player_count}.'
+            ),
+        )
+    elif hand_count < 0:
+        raise ValueError(f'The hand count {hand_count} is negative.')
+    elif table_count <= 0:
+        raise ValueError(f'The table count {table_count} is not positive.')
+
+    payoffs = [0] * player_count
+    states: list[State | None] = []
+
+    while len(states) < min(table_count, hand_count):
+        states.append(game(raw_starting_stacks, player_count))
+
+    started_hand_count = len(states)
+
+    while any(states):
+        for i, state in enumerate(states):
+            if state is None:
+                continue
+
+            state.advance_until_decision()
+
+            if state.status:
+                player_index = get_decision_maker_index(state)
+
+                if player_index is None:
+                    raise ValueError(
+                        (
+                            'The state awaits an operation that is not a'
+                            ' decision. All such operations must be'
+                            ' automated.'
+                        ),
+                    )
+
+                operation_count = len(state.operations)
+
+                policies[player_index](state)
+
+                if len(state.operations) == operation_count:
+                    raise ValueError(
+                        (
+                            f'The policy of the player {player_index} did'
+                            ' not act.'
+                        ),
+                    )
+            else:
+                for j, payoff in enumerate(state.payoffs):
+                    payoffs[j] += payoff
+
+                if started_hand_count < hand_count:
+                    state.reset()
+
+                    started_hand_count += 1
+                else:
+                    states[i] = None
+
+    return payoffs
+
+
+@unique
+class Action(IntEnum):
+    """The enum class for the actions of vectorized environments.
+
+    The value of each member is the position of the corresponding item
+    in the legal action mask of the observations (see
+    :meth:`pokerkit.state.State.encode_observation`).
+
+    >>> Action.FOLDING
+    <Action.FOLDING: 0>
+    >>> Action.HOLE_CARDS_SHOWING
+    <Action.HOLE_CARDS_SHOWING: 5>
+    """
+
+    FOLDING = 0
+    """The folding."""
+    CHECKING_OR_CALLING = 1
+    """The checking or calling."""
+    COMPLETION_BETTING_OR_RAISING = 2
+    """The completion, betting, or raising.
+
+    The amount is the completion, betting, or raising to amount. If no
+    amount is supplied, the minimum is used.
+    """
+    BRING_IN_POSTING = 3
+    """The bring-in posting."""
+    STANDING_PAT = 4
+    """The standing pat (discarding nothing)."""
+    HOLE_CARDS_SHOWING = 5
+    """The hole cards showing."""
+
+
+@dataclass(frozen=True)
+class Batch:
+    """The class for batches returned by vectorized environments.
+
+    Each array is contiguous and holds the items of each table, in
+    order.
+
+    :param observations: The observations of the players in turn.
+    :param masks: The legal action masks of the players in turn.
+    :param rewards: The payoffs of the hands that ended.
+    :param terminal_statuses: Whether the hands ended.
+    :param player_indices: The indices of the players in turn.
+    """
+
+    observations: array[float]
+    """The observations of the players in turn.
+
+    Each table has :attr:`pokerkit.state.State.observation_size` items
+    (see :meth:`pokerkit.state.State.encode_observation`).
+    """
+    masks: array[int]
+    """The legal action masks of the players in turn.
+
+    Each table has an item for each :class:`Action`.
+    """
+    rewards: array[float]
+    """The payoffs of the hands that ended during the step.
+
+    Each table has an item for each player. The payoffs are zeros for
+    the tables whose hands did not end.
+    """
+    terminal_statuses: array[int]
+    """Whether the hand of each table ended during the step.
+
+    The tables whose hands ended were reset automatically.
+    """
+    player_indices: array[int]
+    """The indices of the players in turn at each table."""
+
+    @classmethod
+    def concatenate(cls, batches: Iterable[Batch]) -> Batch:
+        """Concatenate the batches of consecutive tables.
+
+        :param batches: The batches.
+        :return: The concatenated batch.
+        """
+        observations = array('d')
+        masks = array('b')
+        rewards = array('d')
+        terminal_statuses = array('b')
+        player_indices = array('q')
+
+        for batch in batches:
+            observations.extend(batch.observations)
+            masks.extend(batch.masks)
+            rewards.extend(batch.rewards)
+            terminal_statuses.extend(batch.terminal_statuses)
+            player_indices.extend(batch.player_indices)
+
+        return cls(
+            observations,
+            masks,
+            rewards,
+            terminal_statuses,
+            player_indices,
+        )
+
+
+def apply_action(
+        state: State,
+        action: int,
+        amount: int | None = None,
+) -> None:
+    """Apply the action to the state.
+
+    This is the action dispatcher shared by the vectorized environments
+    and the game trees (see :mod:`pokerkit.trees`).
+
+    >>> from pokerkit import Automation, KuhnPoker
+    >>> state = KuhnPoker.create_state(tuple(Automation))
+    >>> apply_action(state, Action.COMPLETION_BETTING_OR_RAISING, 1)
+    >>> apply_action(state, Action.FOLDING)
+    >>> state.stacks
+    [3, 1]
+
+    :param state: The state.
+    :param action: The action (see :class:`Action`).
+    :param amount: The optional completion, betting, or raising to
+                   amount, defaults to ``None``, in which case the
+                   minimum is used.
+    :return: ``None``.
+    :raises ValueError: If the action is invalid or cannot be applied.
+    """
+    match action:
+        case Action.FOLDING:
+            state.fold()
+        case Action.CHECKING_OR_CALLING:
+            state.check_or_call()
+        case Action.COMPLETION_BETTING_OR_RAISING:
+            state.complete_bet_or_raise_to(amount)
+        case Action.BRING_IN_POSTING:
+            state.post_bring_in()
+        case Action.STANDING_PAT:
+            state.stand_pat_or_discard()
+        case Action.HOLE_CARDS_SHOWING:
+            state.show_or_muck_hole_cards(True)
+        case _:
+            raise ValueError(f'The action {action} is invalid.')
+
+
+def _verify_action(state: State, action: int, amount: int | None) -> None:
+    match action:
+        case Action.FOLDING:
+            state.verify_folding()
+        case Action.CHECKING_OR_CALLING:
+            state.verify_checking_or_calling()
+        case Action.COMPLETION_BETTING_OR_RAISING:
+            state.verify_completion_betting_or_raising_to(amount)
+        case Action.BRING_IN_POSTING:
+            state.verify_bring_in_posting()
+        case Action.STANDING_PAT:
+            state.verify_standing_pat_or_discarding()
+        case Action.HOLE_CARDS_SHOWING:
+            state.verify_hole_cards_showing_or_mucking(True)
+        case _:
+            raise ValueError(f'The action {action} is invalid.')
+
+
+class _Tables:
+    def __init__(
+            self,
+            game: Poker,
+            raw_starting_stacks: ValuesLike,
+            player_count: int,
+            table_count: int,
+    ) -> None:
+        self.player_count = player_count
+        self.states = [
+            game(raw_starting_stacks, player_count)
+            for _ in range(table_count)
+        ]
+
+    def reset(self) -> Batch:
+        for state in self.states:
+            state.reset()
+
+        return self._advance()
+
+    def verify(
+            self,
+            actions: Sequence[int],
+            amounts: Sequence[int | None],
+    ) -> None:
+        for state, action, amount in zip(self.states, actions, amounts):
+            _verify_action(state, action, amount)
+
+    def step(
+            self,
+            actions: Sequence[int],
+            amounts: Sequence[int | None],
+    ) -> Batch:
+        self.verify(actions, amounts)
+
+        for state, action, amount in zip(self.states, actions, amounts):
+            apply_action(state, action, amount)
+
+        return self._advance()
+
+    def _advance(self) -> Batch:
+        table_count = len(self.states)
+        observation_size = self.states[0].observation_size
+        action_count = len(Action)
+        observations = array('d', bytes(8 * table_count * observation_size))
+        masks = array('b', bytes(table_count * action_count))
+        rewards = array('d', bytes(8 * table_count * self.player_count))
+        terminal_statuses = array('b', bytes(table_count))
+        player_indices = array('q', bytes(8 * table_count))
+
+        for i, state in enumerate(self.states):
+            state.advance_until_decision()
+
+            if not state.status:
+                for j, payoff in enumerate(state.payoffs):
+                    rewards[i * self.player_count + j] = payoff
+
+                terminal_statuses[i] = True
+
+                state.reset()
+                state.advance_until_decision()
+
+                if not state.status:
+                    raise ValueError('The hand ended without any decision.')
+
+            player_index = state.turn_index
+
+            if player_index is None:
+                raise ValueError(
+                    'The state awaits an operation that is not an action.',
+                )
+
+            offset = i * observation_size
+
+            state.encode_observation(player_index, observations, offset)
+
+            offset += observation_size - action_count
+            player_indices[i] = player_index
+
+            for j in range(action_count):
+                masks[i * action_count + j] = int(observations[offset + j])
+
+        return Batch(
+            observations,
+            masks,
+            rewards,
+            terminal_statuses,
+            player_indices,
+        )
+
+
+def _serve(
+        connection: Connection,
+        game: Poker,
+        raw_starting_stacks: ValuesLike,
+        player_count: int,
+        table_count: int,
+) -> None:
+    tables = _Tables(game, raw_starting_stacks, player_count, table_count)
+
+    while (message := connection.recv()) is not None:
+        name, args = message
+
+        try:
+            result = getattr(tables, name)(*args)
+        except Exception as error:
+            # The error is re-raised in the parent process. Should it
+            # not be picklable, its representation is sent instead.
+            try:
+                connection.send(error)
+            except Exception:
+                connection.send(RuntimeError(repr(error)))
+        else:
+            connection.send(result)
+
+    connection.close()
+
+
+@dataclass
+class VectorEnvironment:
+    """The class for vectorized environments.
+
+    A vectorized environment steps many tables of a game in lockstep.
+    On each step, an action is applied to each table on behalf of the
+    player in turn. Then, the pending operations that are not actions
+    are carried out (see
+    :meth:`pokerkit.state.State.advance_until_decision`). The tables
+    whose hands end are reset automatically (see
+    :meth:`pokerkit.state.State.reset`).
+
+    If the process count is positive, the tables are split among that
+    many worker processes, which step their tables concurrently. The
+    game must then be picklable. The environment should be closed after
+    use, which can be done by using it as a context manager.
+
+    >>> from pokerkit import *
+    >>> game = NoLimitTexasHoldem(tuple(Automation), False, 0, (1, 2), 2)
+    >>> with VectorEnvironment(game, 200, 2, 3) as environment:
+    ...     batch = environment.reset()
+    ...     batch.player_indices.tolist()
+    ...     batch.masks.tolist()[:6]
+    ...     batch = environment.step(
+    ...         (Action.FOLDING, Action.CHECKING_OR_CALLING, Action.FOLDING),
+    ...     )
+    ...     batch.terminal_statuses.tolist()
+    ...     batch.rewards.tolist()
+    ...
+    [1, 1, 1]
+    [1, 1, 1, 0, 0, 0]
+    [1, 0, 1]
+    [1.0, -1.0, 0.0, 0.0, 1.0, -1.0]
+
+    :param game: The game.
+    :param raw_starting_stacks: The starting stacks.
+    :param player_count: The number of players.
+    :param table_count: The number of tables.
+    :param process_count: The number of worker processes, defaults to
+                          ``0`` (no worker process).
+    :raises ValueError: If the table count is not positive or the
+                        process count is negative.
+    """
+
+    game: Poker
+    """The game."""
+    raw_starting_stacks: ValuesLike
+    """The starting stacks."""
+    player_count: int
+    """The number of players."""
+    table_count: int
+    """The number of tables."""
+    process_count: int = 0
+    """The number of worker processes.
+
+    If ``0``, the tables are stepped in the calling process.
+    """
+    _tables: _Tables | None = field(default=None, init=False, repr=False)
+    _connections: list[Connection] = field(
+        default_factory=list,
+        init=False,
+        repr=False,
+    )
+    _processes: list[Process] = field(
+        default_factory=list,
+        init=False,
+        repr=False,
+    )
+    _table_counts: list[int] = field(
+        default_factory=list,
+        init=False,
+        repr=False,
+    )
+
+    def __post_init__(self) -> None:
+        if self.table_count <= 0:
+            raise ValueError(
+                f'The table count {self.table_count} is not positive.',
+            )
+        elif self.process_count < 0:
+            raise ValueError(
+                f'The process count {self.process_count} is negative.',
+            )
+
+        if not self.process_count:
+            self._tables = _Tables(
+                self.game,
+                self.raw_starting_stacks,
+                self.player_count,
+                self.table_count,
+            )
+
+            return
+
+        process_count = min(self.process_count, self.table_count)
+        quotient, remainder = divmod(self.table_count, process_count)
+
+        for i in range(process_count):
+            table_count = quotient + (i < remainder)
+            connection, child_connection = Pipe()
+            process = Process(
+                target=_serve,
+                args=(
+                    child_connection,
+                    self.game,
+                    self.raw_starting_stacks,
+                    self.player_count,
+                    table_count,
+                ),
+                daemon=True,
+            )
+
+            process.start()
+            child_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+            self._table_counts.append(table_count)
+
+    def __enter__(self) -> VectorEnvironment:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _verify_openness(self) -> None:
+        if self._tables is None and not self._connections:
+            raise ValueError('The environment is closed.')
+
+    def _send(
+            self,
+            name: str,
+            actions: Sequence[int],
+            amounts: Sequence[int | None],
+    ) -> None:
+        for connection, i, j in zip(
+                self._connections,
+                accumulate(self._table_counts, initial=0),
+                accumulate(self._table_counts),
+        ):
+            connection.send(
+                (name, (tuple(actions[i:j]), tuple(amounts[i:j]))),
+            )
+
+    def _receive(self) -> list[Any]:
+        results = []
+        error = None
+
+        for connection in self._connections:
+            result = connection.recv()
+
+            if isinstance(result, Exception):
+                error = result
+            else:
+                results.append(result)
+
+        if error is not None:
+            raise error
+
+        return results
+
+    def _gather(self) -> Batch:
+        return Batch.concatenate(self._receive())
+
+    def reset(self) -> Batch:
+        """Reset every table to start new hands.
+
+        :return: The batch.
+        :raises ValueError: If the environment is closed or a hand
+                            awaits an operation that is not an action.
+        """
+        self._verify_openness()
+
+        if self._tables is not None:
+            return self._tables.reset()
+
+        for connection in self._connections:
+            connection.send(('reset', ()))
+
+        return self._gather()
+
+    def step(
+            self,
+            actions: Sequence[int],
+            amounts: Sequence[int | None] | None = None,
+    ) -> Batch:
+        """Apply an action to each table.
+
+        :param actions: The actions (see :class:`Action`) of each table.
+        :param amounts: The optional completion, betting, or raising to
+                        amounts of each table, defaults to ``None``, in
+                        which case the minimums are used.
+        :return: The batch.
+        :raises ValueError: If the environment is closed, the arguments
+                            are invalid, an action cannot be applied (in
+                            which case no table acts), or a hand awaits
+                            an operation that is not an action.
+        """
+        self._verify_openness()
+
+        if len(actions) != self.table_count:
+            raise ValueError(
+                (
+                    f'The number of actions {len(actions)} does not match'
+                    f' the number of tables {self.table_count}.'
+                ),
+            )
+
+        if amounts is None:
+            amounts = (None,) * self.table_count
+        elif len(amounts) != self.table_count:
+            raise ValueError(
+                (
+                    f'The number of amounts {len(amounts)} does not match'
+                    f' the number of tables {self.table_count}.'
+                ),
+            )
+
+        if self._tables is not None:
+            return self._tables.step(actions, amounts)
+
+        # Every table is verified before any acts so that an invalid
+        # action leaves all tables untouched.
+        self._send('verify', actions, amounts)
+        self._receive()
+        self._send('step', actions, amounts)
+
+        return self._gather()
+
+    def close(self) -> None:
+        """Close the environment.
+
+        The worker processes, if any, are stopped.
+
+        :return: ``None``.
+        """
+        for connection in self._connections:
+            connection.send(None)
+            connection.close()
+
+        for process in self._processes:
+            process.join()
+
+        self._tables = None
+        self._connections.clear()
+        self._processes.clear()
+        self._table_counts.clear()
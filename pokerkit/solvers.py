@@ -0,0 +1,530 @@
+""":mod:`pokerkit.solvers` implements classes related to game solving.
+
+The solvers here are reference implementations for small games like
+Kuhn poker and Rhode Island hold'em. They operate directly on
+:class:`pokerkit.state.State` and thereby double as benchmarks of the
+state engine.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field, KW_ONLY
+from itertools import filterfalse, permutations
+from random import sample
+from time import perf_counter
+
+from pokerkit.games import Poker
+from pokerkit.simulation import apply_action
+from pokerkit.state import Automation, BoardDealing, HoleDealing, State
+from pokerkit.trees import BetSizer, get_actions, get_min_and_max_bet_sizes
+from pokerkit.utilities import Card, ValuesLike
+
+
+def _advance(
+        state: State,
+        hole_cards: tuple[Card, ...],
+        board_cards: tuple[Card, ...],
+) -> tuple[tuple[Card, ...], tuple[Card, ...]]:
+    while state.status:
+        operations = state.advance_until_decision(board_cards, hole_cards)
+
+        for operation in operations:
+            if isinstance(operation, HoleDealing):
+                hole_cards = hole_cards[len(operation.cards):]
+            elif isinstance(operation, BoardDealing):
+                board_cards = board_cards[len(operation.cards):]
+
+        if state.can_stand_pat_or_discard():
+            state.stand_pat_or_discard()
+        elif state.can_select_runout_count():
+            state.select_runout_count()
+        elif state.can_show_or_muck_hole_cards(True):
+            state.show_or_muck_hole_cards(True)
+        else:
+            break
+
+    return hole_cards, board_cards
+
+
+def _match_regrets(regrets: list[float]) -> list[float]:
+    positive_regrets = [max(regret, 0.0) for regret in regrets]
+    total = sum(positive_regrets)
+
+    if total > 0:
+        return [regret / total for regret in positive_regrets]
+
+    return [1 / len(regrets)] * len(regrets)
+
+
+@dataclass
+class _Node:
+    actor_index: int | None
+    key: bytes | None
+    children: list[_Node]
+    payoffs: list[int]
+
+
+@dataclass
+class CFRSolver:
+    """The class for counterfactual regret minimization (CFR) solvers.
+
+    The solver finds approximate Nash equilibria of two-player games
+    whose betting is abstracted through the bet sizer (see
+    :mod:`pokerkit.trees`). Drawing decisions are resolved by standing
+    pat, and the hole cards are always shown. The information sets are
+    keyed by :meth:`pokerkit.state.State.get_info_set_key`.
+
+    Each iteration updates the regrets of both players in turn
+    (alternating updates). By default, every deal is enumerated in each
+    iteration (vanilla CFR). When ``sampling_status`` is ``True``, a
+    single random deal is traversed per iteration instead (chance
+    sampling), which is the only practical option for games like
+    Rhode Island hold'em. When ``plus_status`` is ``True``, CFR+ is
+    used: negative regrets are floored at zero and the average strategy
+    is weighted linearly by the iteration.
+
+    The game must not automate the hole and board dealings as the
+    solver deals the cards of each deal by itself.
+
+    >>> from pokerkit import KuhnPoker
+    >>> game = KuhnPoker(
+    ...     (
+    ...         Automation.ANTE_POSTING,
+    ...         Automation.BET_COLLECTION,
+    ...         Automation.BLIND_OR_STRADDLE_POSTING,
+    ...         Automation.CARD_BURNING,
+    ...         Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
+    ...         Automation.HAND_KILLING,
+    ...         Automation.CHIPS_PUSHING,
+    ...         Automation.CHIPS_PULLING,
+    ...     ),
+    ... )
+    >>> solver = CFRSolver(game, 2, 2, plus_status=True)
+    >>> len(list(solver.iterate_deals()))
+    6
+    >>> solver.solve(100)
+    >>> solver.iteration_count
+    100
+    >>> len(solver.iteration_times)
+    100
+    >>> len(solver.regrets)
+    12
+    >>> solver.compute_exploitability() < 0.01
+    True
+    >>> state = game(2, 2)
+    >>> state.deal_hole('Qs')  # doctest: +ELLIPSIS
+    HoleDealing(commentary=None, player_index=0, cards=(Qs,), statuses=(F...
+    >>> state.deal_hole('Ks')  # doctest: +ELLIPSIS
+    HoleDealing(commentary=None, player_index=1, cards=(Ks,), statuses=(F...
+    >>> state.check_or_call()
+    CheckingOrCalling(commentary=None, player_index=0, amount=0)
+    >>> strategy = solver.get_average_strategy(state.get_info_set_key(1))
+    >>> [round(probability, 2) for probability in strategy]
+    [0.0, 1.0]
+
+    :param game: The game.
+    :param raw_starting_stacks: The "raw" starting stacks.
+    :param player_count: The number of players.
+    :param bet_sizer: The bet sizer, defaults to
+                      :func:`pokerkit.trees.get_min_and_max_bet_sizes`.
+    :param plus_status: Whether to use CFR+, defaults to ``False``.
+    :param sampling_status: Whether to sample a single deal per
+                            iteration, defaults to ``False``.
+    :raises ValueError: If the arguments are invalid.
+    """
+
+    game: Poker
+    """The game."""
+    raw_starting_stacks: ValuesLike
+    """The "raw" starting stacks."""
+    player_count: int
+    """The number of players."""
+    _: KW_ONLY
+    bet_sizer: BetSizer = get_min_and_max_bet_sizes
+    """The bet sizer."""
+    plus_status: bool = False
+    """Whether to use CFR+."""
+    sampling_status: bool = False
+    """Whether to sample a single deal per iteration."""
+    regrets: dict[bytes, list[float]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    """The cumulative regrets of each information set."""
+    strategy_sums: dict[bytes, list[float]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    """The cumulative strategies of each information set."""
+    iteration_count: int = field(default=0, init=False)
+    """The number of iterations carried out."""
+    iteration_times: list[float] = field(default_factory=list, init=False)
+    """The wall-clock durations of the iterations in seconds."""
+    _root: State = field(init=False, repr=False)
+    _strategies: list[dict[bytes, list[float]]] = field(
+        default_factory=list,
+        init=False,
+        repr=False,
+    )
+    _deal_count: int = field(init=False, repr=False)
+    _hole_card_count: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.player_count != 2:
+            raise ValueError(
+                (
+                    f'The number of players {self.player_count} is not'
+                    ' supported. Only two-player games can be solved.'
+                ),
+            )
+        elif (
+                Automation.HOLE_DEALING in self.game.automations
+                or Automation.BOARD_DEALING in self.game.automations
+        ):
+            raise ValueError(
+                'The hole and board dealings must not be automated.',
+            )
+
+        self._root = self.game(self.raw_starting_stacks, self.player_count)
+
+        for _ in self._root.player_indices:
+            self._strategies.append({})
+
+        self._hole_card_count = sum(
+            len(street.hole_dealing_statuses) * self.player_count
+            for street in self._root.streets
+        )
+        self._deal_count = self._hole_card_count + sum(
+            street.board_dealing_count for street in self._root.streets
+        )
+
+        if self._deal_count > len(self._root.deck_cards):
+            raise ValueError('There are not enough cards to be dealt.')
+
+    def iterate_deals(self) -> Iterator[tuple[Card, ...]]:
+        """Iterate through the deals.
+
+        A deal is the sequence of the hole cards (in the order they are
+        dealt) followed by the board cards. Each deal is equally
+        likely.
+
+        :return: The deals.
+        """
+        yield from permutations(self._root.deck_cards, self._deal_count)
+
+    def _create_state(
+            self,
+            deal: tuple[Card, ...],
+    ) -> tuple[State, tuple[Card, ...], tuple[Card, ...]]:
+        state = self._root.clone()
+        cards = set(deal)
+        state.deck_cards = deque(
+            filterfalse(cards.__contains__, state.deck_cards),
+        )
+
+        state.deck_cards.extend(deal)
+
+        hole_cards, board_cards = _advance(
+            state,
+            deal[:self._hole_card_count],
+            deal[self._hole_card_count:],
+        )
+
+        return state, hole_cards, board_cards
+
+    def _traverse(
+            self,
+            state: State,
+            hole_cards: tuple[Card, ...],
+            board_cards: tuple[Card, ...],
+            player_index: int,
+            reach_probability: float,
+            counterfactual_reach_probability: float,
+    ) -> float:
+        if not state.status:
+            return state.payoffs[player_index]
+
+        actor_index = state.actor_index
+
+        assert actor_index is not None
+
+        key = state.get_info_set_key(actor_index)
+        actions = get_actions(state, self.bet_sizer)
+
+        if key not in self.regrets:
+            self.regrets[key] = [0.0] * len(actions)
+            self.strategy_sums[key] = [0.0] * len(actions)
+
+        regrets = self.regrets[key]
+
+        strategies = self._strategies[actor_index]
+
+        if key not in strategies:
+            strategies[key] = _match_regrets(regrets)
+
+        strategy = strategies[key]
+        values = []
+
+        for i, (action, amount) in enumerate(actions):
+            child = state if i == len(actions) - 1 else state.clone()
+
+            apply_action(child, action, amount)
+
+            child_hole_cards, child_board_cards = _advance(
+                child,
+                hole_cards,
+                board_cards,
+            )
+
+            if actor_index == player_index:
+                value = self._traverse(
+                    child,
+                    child_hole_cards,
+                    child_board_cards,
+                    player_index,
+                    reach_probability * strategy[i],
+                    counterfactual_reach_probability,
+                )
+            else:
+                value = self._traverse(
+                    child,
+                    child_hole_cards,
+                    child_board_cards,
+                    player_index,
+                    reach_probability,
+                    counterfactual_reach_probability * strategy[i],
+                )
+
+            values.append(value)
+
+        node_value = sum(map(float.__mul__, strategy, values))
+
+        if actor_index == player_index:
+            strategy_sums = self.strategy_sums[key]
+            weight = self.iteration_count + 1 if self.plus_status else 1
+
+            for i, value in enumerate(values):
+                regrets[i] += counterfactual_reach_probability * (
+                    value - node_value
+                )
+                strategy_sums[i] += weight * reach_probability * strategy[i]
+
+        return node_value
+
+    def iterate(self) -> float:
+        """Carry out an iteration.
+
+        :return: The duration of the iteration in seconds.
+        """
+        start_time = perf_counter()
+
+        if self.sampling_status:
+            deals: tuple[tuple[Card, ...], ...] = (
+                tuple(sample(self._root.deck_cards, self._deal_count)),
+            )
+            chance_probability = 1.0
+        else:
+            deals = tuple(self.iterate_deals())
+            chance_probability = 1 / len(deals)
+
+        for player_index in self._root.player_indices:
+            for deal in deals:
+                state, hole_cards, board_cards = self._create_state(deal)
+
+                self._traverse(
+                    state,
+                    hole_cards,
+                    board_cards,
+                    player_index,
+                    1.0,
+                    chance_probability,
+                )
+
+            if self.plus_status:
+                for key in self._strategies[player_index]:
+                    regrets = self.regrets[key]
+                    regrets[:] = (max(regret, 0.0) for regret in regrets)
+
+            for strategies in self._strategies:
+                strategies.clear()
+
+        self.iteration_count += 1
+        duration = perf_counter() - start_time
+
+        self.iteration_times.append(duration)
+
+        return duration
+
+    def solve(self, iteration_count: int) -> None:
+        """Carry out the iterations.
+
+        :param iteration_count: The number of iterations.
+        :return: ``None``.
+        """
+        for _ in range(iteration_count):
+            self.iterate()
+
+    def get_average_strategy(self, key: bytes) -> list[float]:
+        """Return the average strategy of the information set.
+
+        The probabilities are in the order of the actions returned by
+        :func:`pokerkit.trees.get_actions`.
+
+        :param key: The information set key.
+        :return: The action probabilities.
+        :raises KeyError: If the information set was never visited.
+        """
+        strategy_sums = self.strategy_sums[key]
+        total = sum(strategy_sums)
+
+        if total > 0:
+            return [strategy_sum / total for strategy_sum in strategy_sums]
+
+        return [1 / len(strategy_sums)] * len(strategy_sums)
+
+    def _build(
+            self,
+            state: State,
+            hole_cards: tuple[Card, ...],
+            board_cards: tuple[Card, ...],
+    ) -> _Node:
+        if not state.status:
+            return _Node(None, None, [], list(state.payoffs))
+
+        actor_index = state.actor_index
+
+        assert actor_index is not None
+
+        node = _Node(
+            actor_index,
+            state.get_info_set_key(actor_index),
+            [],
+            [],
+        )
+        actions = get_actions(state, self.bet_sizer)
+
+        for i, (action, amount) in enumerate(actions):
+            child = state if i == len(actions) - 1 else state.clone()
+
+            apply_action(child, action, amount)
+
+            child_hole_cards, child_board_cards = _advance(
+                child,
+                hole_cards,
+                board_cards,
+            )
+
+            node.children.append(
+                self._build(
+                    child,
+                    child_hole_cards,
+                    child_board_cards,
+                ),
+            )
+
+        return node
+
+    def _get_strategy(self, key: bytes, action_count: int) -> list[float]:
+        if key in self.strategy_sums:
+            return self.get_average_strategy(key)
+
+        return [1 / action_count] * action_count
+
+    def _compute_best_response_value(
+            self,
+            roots: list[_Node],
+            player_index: int,
+    ) -> float:
+        info_sets: dict[bytes, list[tuple[_Node, float]]] = {}
+        nodes = [(root, 1 / len(roots)) for root in roots]
+
+        while nodes:
+            node, probability = nodes.pop()
+
+            if node.actor_index == player_index:
+                assert node.key is not None
+
+                info_sets.setdefault(node.key, []).append((node, probability))
+                nodes.extend((child, probability) for child in node.children)
+            elif node.actor_index is not None:
+                assert node.key is not None
+
+                strategy = self._get_strategy(node.key, len(node.children))
+
+                nodes.extend(
+                    (child, probability * child_probability)
+                    for child, child_probability in zip(
+                        node.children,
+                        strategy,
+                    )
+                )
+
+        best_action_indices: dict[bytes, int] = {}
+        values: dict[int, float] = {}
+
+        def get_best_action_index(key: bytes) -> int:
+            if key not in best_action_indices:
+                totals = [0.0] * len(info_sets[key][0][0].children)
+
+                for node, probability in info_sets[key]:
+                    for i, child in enumerate(node.children):
+                        totals[i] += probability * get_value(child)
+
+                best_action_indices[key] = totals.index(max(totals))
+
+            return best_action_indices[key]
+
+        def get_value(node: _Node) -> float:
+            if id(node) not in values:
+                if node.actor_index is None:
+                    value = float(node.payoffs[player_index])
+                elif node.actor_index == player_index:
+                    assert node.key is not None
+
+                    value = get_value(
+                        node.children[get_best_action_index(node.key)],
+                    )
+                else:
+                    assert node.key is not None
+
+                    strategy = self._get_strategy(
+                        node.key,
+                        len(node.children),
+                    )
+                    value = sum(
+                        probability * get_value(child)
+                        for child, probability in zip(
+                            node.children,
+                            strategy,
+                        )
+                    )
+
+                values[id(node)] = value
+
+            return values[id(node)]
+
+        return sum(get_value(root) for root in roots) / len(roots)
+
+    def compute_exploitability(self) -> float:
+        """Compute the exploitability of the average strategy profile.
+
+        The exploitability is the mean of the values of the best
+        responses of each player against the average strategy of the
+        other. It is zero at a Nash equilibrium.
+
+        Every deal is enumerated regardless of ``sampling_status``, so
+        this is only practical for very small games like Kuhn poker.
+
+        :return: The exploitability in chips.
+        """
+        roots = []
+
+        for deal in self.iterate_deals():
+            roots.append(self._build(*self._create_state(deal)))
+
+        return sum(
+            self._compute_best_response_value(roots, i)
+            for i in self._root.player_indices
+        ) / self.player_count
@@ -3,15 +3,31 @@
 from __future__ import annotations
 
 from abc import ABC
-from collections.abc import Callable, Iterable, Iterator
+from array import array
+from collections.abc import Callable, Iterable, Iterator, MutableSequence
 from collections import Counter, deque
-from dataclasses import InitVar, dataclass, field, KW_ONLY
-from enum import StrEnum, unique
-from functools import partial
-from itertools import chain, filterfalse, islice, starmap
-from operator import getitem, gt, sub
+from dataclasses import (
+    dataclass,
+    field,
+    fields,
+    InitVar,
+    is_dataclass,
+    KW_ONLY,
+    MISSING,
+)
+from enum import Enum, IntEnum, StrEnum, unique
+from functools import cache, lru_cache, partial
+from importlib import import_module
+from itertools import accumulate, chain, filterfalse, islice, starmap
+from operator import getitem, gt, itemgetter, sub
+from os.path import dirname
+from pickle import dumps, loads, UnpicklingError
 from random import shuffle
+from sys import modules
+from types import BuiltinFunctionType, FunctionType
+from typing import Any
 from warnings import warn
+from zlib import crc32
 
 from pokerkit.hands import Hand
 from pokerkit.lookups import Label, Lookup
@@ -25,6 +41,7 @@ from pokerkit.utilities import (
     min_or_none,
     rake,
     RankOrder,
+    rotated,
     shuffled,
     sign,
     Suit,
@@ -185,7 +202,7 @@ class _HighHandOpeningLookup(Lookup):
         self._add_multisets(Counter({4: 1}), (False,), Label.FOUR_OF_A_KIND)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Street:
     """The class for streets.
 
@@ -326,6 +343,97 @@ class Street:
             )
 
 
+@dataclass(frozen=True, slots=True)
+class RuleTable:
+    """The class for compiled rule tables.
+
+    A rule table holds the per-street facts that are derived from the
+    streets so that the states need not recompute them during each
+    operation. Each item of the tuples corresponds to the street at the
+    same index.
+
+    Rule tables should be created with
+    :meth:`pokerkit.state.RuleTable.compile`, which returns the same
+    table for equal streets. Therefore, the table is shared by all
+    states of a game.
+
+    >>> from pokerkit import NoLimitTexasHoldem
+    >>> game = NoLimitTexasHoldem((), True, 0, (1, 2), 2)
+    >>> rule_table = RuleTable.compile(game.streets)
+    >>> rule_table.board_dealing_counts
+    (0, 3, 1, 1)
+    >>> rule_table.board_dealing_offsets
+    (0, 0, 3, 4, 5)
+    >>> rule_table.draw_statuses
+    (False, False, False, False)
+    >>> rule_table.later_board_dealing_statuses
+    (True, True, True, False)
+    >>> RuleTable.compile(game.streets) is rule_table
+    True
+
+    :param board_dealing_counts: The number of board cards dealt on each
+                                 street.
+    :param board_dealing_offsets: The number of board cards dealt before
+                                  each street and, lastly, in total.
+    :param draw_statuses: The draw statuses of each street.
+    :param later_board_dealing_statuses: Whether board cards are dealt
+                                         after each street.
+    """
+
+    board_dealing_counts: tuple[int, ...]
+    """The number of board cards dealt on each street."""
+    board_dealing_offsets: tuple[int, ...]
+    """The number of board cards dealt before each street.
+
+    This has one more item than there are streets, which is the total
+    number of board cards dealt for each board.
+    """
+    draw_statuses: tuple[bool, ...]
+    """The draw statuses of each street."""
+    later_board_dealing_statuses: tuple[bool, ...]
+    """Whether board cards are dealt in a later street."""
+
+    @classmethod
+    def compile(cls, streets: Iterable[Street]) -> RuleTable:
+        """Compile the rule table of the streets.
+
+        The compiled tables are cached by the per-street facts rather
+        than by the streets, which need not be hashable. So, equal
+        streets share the same table.
+
+        :param streets: The streets.
+        :return: The rule table.
+        """
+        streets = tuple(streets)
+
+        return cls._compile(
+            tuple(street.board_dealing_count for street in streets),
+            tuple(street.draw_status for street in streets),
+        )
+
+    @classmethod
+    @cache
+    def _compile(
+            cls,
+            board_dealing_counts: tuple[int, ...],
+            draw_statuses: tuple[bool, ...],
+    ) -> RuleTable:
+        board_dealing_offsets = tuple(
+            accumulate(board_dealing_counts, initial=0),
+        )
+        later_board_dealing_statuses = tuple(
+            offset < board_dealing_offsets[-1]
+            for offset in board_dealing_offsets[1:]
+        )
+
+        return cls(
+            board_dealing_counts,
+            board_dealing_offsets,
+            draw_statuses,
+            later_board_dealing_statuses,
+        )
+
+
 @unique
 class Automation(StrEnum):
     """The enum class for automations.
@@ -493,7 +601,7 @@ class Pot:
         return self.raked_amount + self.unraked_amount
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Operation(ABC):
     """The abstract base class for operations.
 
@@ -506,7 +614,7 @@ class Operation(ABC):
     """The optional commentary (i.e., comments)."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AntePosting(Operation):
     """The class for ante postings."""
 
@@ -516,7 +624,7 @@ class AntePosting(Operation):
     """The amount."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BetCollection(Operation):
     """The class for bet collections."""
 
@@ -536,7 +644,7 @@ class BetCollection(Operation):
         return sum(self.bets)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlindOrStraddlePosting(Operation):
     """The class for blind or straddle postings."""
 
@@ -546,7 +654,7 @@ class BlindOrStraddlePosting(Operation):
     """The amount."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CardBurning(Operation):
     """The class for card burnings."""
 
@@ -554,7 +662,7 @@ class CardBurning(Operation):
     """The card."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HoleDealing(Operation):
     """The class for hole dealings."""
 
@@ -566,7 +674,7 @@ class HoleDealing(Operation):
     """The statuses."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BoardDealing(Operation):
     """The class for board dealings."""
 
@@ -574,7 +682,7 @@ class BoardDealing(Operation):
     """The cards."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StandingPatOrDiscarding(Operation):
     """The class for standing pat or discardings."""
 
@@ -584,7 +692,7 @@ class StandingPatOrDiscarding(Operation):
     """The discarded cards, empty if stood pat."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Folding(Operation):
     """The class for foldings."""
 
@@ -592,7 +700,7 @@ class Folding(Operation):
     """The player index."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckingOrCalling(Operation):
     """The class for checking or callings."""
 
@@ -602,7 +710,7 @@ class CheckingOrCalling(Operation):
     """The amount."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BringInPosting(Operation):
     """The class for bring-in postings."""
 
@@ -612,7 +720,7 @@ class BringInPosting(Operation):
     """The amount."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompletionBettingOrRaisingTo(Operation):
     """The class for completion, betting, or raising tos."""
 
@@ -622,7 +730,7 @@ class CompletionBettingOrRaisingTo(Operation):
     """The amount."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunoutCountSelection(Operation):
     """The class for runout-count selection."""
 
@@ -632,7 +740,7 @@ class RunoutCountSelection(Operation):
     """The runout-count."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HoleCardsShowingOrMucking(Operation):
     """The class for hole cards showing or muckings."""
 
@@ -642,7 +750,7 @@ class HoleCardsShowingOrMucking(Operation):
     """The hole cards."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HandKilling(Operation):
     """The class for hand killings."""
 
@@ -650,7 +758,7 @@ class HandKilling(Operation):
     """The player index."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChipsPushing(Operation):
     """The class for chips pushings."""
 
@@ -684,7 +792,7 @@ class ChipsPushing(Operation):
         return sum(self.amounts)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChipsPulling(Operation):
     """The class for chips pullings."""
 
@@ -694,13 +802,522 @@ class ChipsPulling(Operation):
     """The amount."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NoOperation(Operation):
     """The class for no-operations."""
 
     pass
 
 
+_OPERATION_TYPES: tuple[type[Operation], ...] = (
+    AntePosting,
+    BetCollection,
+    BlindOrStraddlePosting,
+    CardBurning,
+    HoleDealing,
+    BoardDealing,
+    StandingPatOrDiscarding,
+    Folding,
+    CheckingOrCalling,
+    BringInPosting,
+    CompletionBettingOrRaisingTo,
+    RunoutCountSelection,
+    HoleCardsShowingOrMucking,
+    HandKilling,
+    ChipsPushing,
+    ChipsPulling,
+    NoOperation,
+)
+_OPERATION_TAGS = {
+    operation_type: i for i, operation_type in enumerate(_OPERATION_TYPES)
+}
+
+
+@cache
+def _get_card_indices(deck: Deck) -> dict[Card, int]:
+    return {card: i for i, card in enumerate(deck)}
+
+
+def _encode_integer(key: bytearray, value: int) -> None:
+    assert value >= 0
+
+    while value >= 0x80:
+        key.append(value & 0x7F | 0x80)
+
+        value >>= 7
+
+    key.append(value)
+
+
+def _clone(value: Any) -> Any:
+    if isinstance(value, list):
+        return list(map(_clone, value))
+    elif isinstance(value, deque):
+        return deque(map(_clone, value))
+    elif isinstance(value, bytearray):
+        return bytearray(value)
+    elif isinstance(value, dict):
+        return dict(zip(value, map(_clone, value.values())))
+    elif isinstance(value, Pot):
+        return Pot(
+            value.raked_amount,
+            value.unraked_amount,
+            value.player_indices,
+        )
+
+    return value
+
+
+@unique
+class _ValueTag(IntEnum):
+    NONE = 0
+    FALSE = 1
+    TRUE = 2
+    INTEGER = 3
+    NEGATIVE_INTEGER = 4
+    STRING = 5
+    CARD = 6
+    FOREIGN_CARD = 7
+    LIST = 8
+    DEQUE = 9
+    TUPLE = 10
+    SET = 11
+    DICT = 12
+    POT = 13
+    OPERATION = 14
+    HAND = 15
+    ENUM_MEMBER = 16
+    REFERENCE = 17
+    DATACLASS = 18
+    PICKLE = 19
+
+
+_PACKAGE_DIRECTORY = dirname(__file__)
+
+
+def _is_trusted_module_name(module_name: str) -> bool:
+    if module_name == 'pokerkit' or module_name.startswith('pokerkit.'):
+        return True
+
+    # A module of this package may be imported under another name (like
+    # by :mod:`doctest`).
+    module = modules.get(module_name)
+
+    return (
+        module is not None
+        and dirname(getattr(module, '__file__', None) or '')
+        == _PACKAGE_DIRECTORY
+    )
+
+
+def _get_reference(value: Any) -> str:
+    return f'{value.__module__}:{value.__qualname__}'
+
+
+@cache
+def _resolve_reference(reference: str) -> Any:
+    module_name, _, qualified_name = reference.partition(':')
+    value = import_module(module_name)
+
+    for name in qualified_name.split('.'):
+        value = getattr(value, name)
+
+    return value
+
+
+class _ValueWriter:
+    def __init__(self, deck: Deck | None = None) -> None:
+        self.data = bytearray()
+        self.card_indices = {} if deck is None else _get_card_indices(deck)
+        self.string_indices: dict[str, int] = {}
+
+    def write_integer(self, value: int) -> None:
+        _encode_integer(self.data, value)
+
+    def write_string(self, value: str) -> None:
+        if value in self.string_indices:
+            self.write_integer(self.string_indices[value] + 1)
+        else:
+            self.string_indices[value] = len(self.string_indices)
+            encoded_value = value.encode()
+
+            self.write_integer(0)
+            self.write_integer(len(encoded_value))
+            self.data.extend(encoded_value)
+
+    def write_reference(self, value: Any) -> None:
+        reference = _get_reference(value)
+
+        try:
+            resolved_value = _resolve_reference(reference)
+        except (AttributeError, ImportError):
+            resolved_value = None
+
+        if resolved_value is not value:
+            raise ValueError(f'The object {repr(value)} is not importable.')
+
+        self.write_string(reference)
+
+    def write_values(self, values: Iterable[Any]) -> None:
+        values = tuple(values)
+
+        self.write_integer(len(values))
+
+        for value in values:
+            _VALUE_WRITERS.get(type(value), _ValueWriter.write_object)(
+                self,
+                value,
+            )
+
+    def write_value(self, value: Any) -> None:
+        _VALUE_WRITERS.get(type(value), _ValueWriter.write_object)(
+            self,
+            value,
+        )
+
+    def write_none(self, value: None) -> None:
+        self.data.append(_ValueTag.NONE)
+
+    def write_bool(self, value: bool) -> None:
+        self.data.append(_ValueTag.TRUE if value else _ValueTag.FALSE)
+
+    def write_int(self, value: int) -> None:
+        if value >= 0:
+            self.data.append(_ValueTag.INTEGER)
+            self.write_integer(value)
+        else:
+            self.data.append(_ValueTag.NEGATIVE_INTEGER)
+            self.write_integer(-value)
+
+    def write_str(self, value: str) -> None:
+        self.data.append(_ValueTag.STRING)
+        self.write_string(value)
+
+    def write_card(self, value: Card) -> None:
+        index = self.card_indices.get(value)
+
+        if index is not None:
+            self.data.append(_ValueTag.CARD)
+            self.write_integer(index)
+        else:
+            self.data.append(_ValueTag.FOREIGN_CARD)
+            self.write_string(repr(value))
+
+    def write_list(self, value: list[Any]) -> None:
+        self.data.append(_ValueTag.LIST)
+        self.write_values(value)
+
+    def write_deque(self, value: deque[Any]) -> None:
+        self.data.append(_ValueTag.DEQUE)
+        self.write_values(value)
+
+    def write_tuple(self, value: tuple[Any, ...]) -> None:
+        self.data.append(_ValueTag.TUPLE)
+        self.write_values(value)
+
+    def write_set(self, value: set[Any]) -> None:
+        self.data.append(_ValueTag.SET)
+        self.write_values(value)
+
+    def write_dict(self, value: dict[Any, Any]) -> None:
+        self.data.append(_ValueTag.DICT)
+        self.write_values(chain.from_iterable(value.items()))
+
+    def write_pot(self, value: Pot) -> None:
+        self.data.append(_ValueTag.POT)
+        self.write_value(value.raked_amount)
+        self.write_value(value.unraked_amount)
+        self.write_value(value.player_indices)
+
+    def write_operation(self, value: Operation) -> None:
+        type_ = type(value)
+
+        self.data.append(_ValueTag.OPERATION)
+        self.write_integer(_OPERATION_TAGS[type_])
+        self.write_value(value.commentary)
+        names: tuple[str, ...] = type_.__match_args__
+
+        self.write_values(getattr(value, name) for name in names)
+
+    def write_object(self, value: Any) -> None:
+        type_ = type(value)
+
+        if isinstance(value, Hand):
+            self.data.append(_ValueTag.HAND)
+            self.write_reference(type_)
+            self.write_values(value.cards)
+        elif isinstance(value, Enum):
+            self.data.append(_ValueTag.ENUM_MEMBER)
+            self.write_reference(type_)
+            self.write_string(value.name)
+        elif isinstance(
+                value,
+                (type, FunctionType, BuiltinFunctionType),
+        ):
+            self.data.append(_ValueTag.REFERENCE)
+            self.write_reference(value)
+        elif is_dataclass(value) and all(
+                field_.init for field_ in fields(value)
+        ):
+            self.data.append(_ValueTag.DATACLASS)
+            self.write_reference(type_)
+            self.write_values(
+                getattr(value, field_.name) for field_ in fields(value)
+            )
+        else:
+            encoded_value = dumps(value)
+
+            self.data.append(_ValueTag.PICKLE)
+            self.write_integer(len(encoded_value))
+            self.data.extend(encoded_value)
+
+
+_VALUE_WRITERS: dict[type[Any], Callable[[_ValueWriter, Any], None]] = {
+    type(None): _ValueWriter.write_none,
+    bool: _ValueWriter.write_bool,
+    int: _ValueWriter.write_int,
+    str: _ValueWriter.write_str,
+    Card: _ValueWriter.write_card,
+    list: _ValueWriter.write_list,
+    deque: _ValueWriter.write_deque,
+    tuple: _ValueWriter.write_tuple,
+    set: _ValueWriter.write_set,
+    dict: _ValueWriter.write_dict,
+    Pot: _ValueWriter.write_pot,
+}
+
+for _operation_type in _OPERATION_TAGS:
+    _VALUE_WRITERS[_operation_type] = _ValueWriter.write_operation
+
+
+class _ValueReader:
+    def __init__(
+            self,
+            data: bytes,
+            deck: Deck | None = None,
+            trusted: bool = False,
+    ) -> None:
+        self.data = data
+        self.offset = 0
+        self.deck = deck
+        self.trusted = trusted
+        self.strings: list[str] = []
+
+    def read_integer(self) -> int:
+        byte = self.data[self.offset]
+        self.offset += 1
+
+        if byte < 0x80:
+            return byte
+
+        value = byte & 0x7F
+        shift = 7
+
+        while True:
+            byte = self.data[self.offset]
+            self.offset += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+
+            if byte < 0x80:
+                return value
+
+    def read_bytes(self) -> bytes:
+        length = self.read_integer()
+        value = self.data[self.offset:self.offset + length]
+
+        if len(value) != length:
+            raise ValueError('The data is truncated.')
+
+        self.offset += length
+
+        return value
+
+    def read_string(self) -> str:
+        index = self.read_integer()
+
+        if index:
+            return self.strings[index - 1]
+
+        value = self.read_bytes().decode()
+
+        self.strings.append(value)
+
+        return value
+
+    def read_reference(self) -> Any:
+        reference = self.read_string()
+        module_name, _, _ = reference.partition(':')
+
+        if not self.trusted and not _is_trusted_module_name(module_name):
+            raise ValueError(f'The reference {repr(reference)} is untrusted.')
+
+        value = _resolve_reference(reference)
+
+        # The names imported into the modules of this package (like
+        # ``pickle.loads``) are not canonical and hence not reachable.
+        if not self.trusted and _get_reference(value) != reference:
+            raise ValueError(f'The reference {repr(reference)} is untrusted.')
+
+        return value
+
+    def read_type(self, base: type[Any]) -> Any:
+        type_ = self.read_reference()
+
+        if not isinstance(type_, type) or not issubclass(type_, base):
+            raise ValueError(f'The object {repr(type_)} is not a valid type.')
+
+        return type_
+
+    def read_values(self) -> list[Any]:
+        return [self.read_value() for _ in range(self.read_integer())]
+
+    def read_value(self) -> Any:
+        tag = self.data[self.offset]
+        self.offset += 1
+
+        if tag >= len(_VALUE_READERS):
+            raise ValueError(f'The value tag {tag} is unknown.')
+
+        return _VALUE_READERS[tag](self)
+
+    def read_none(self) -> None:
+        return None
+
+    def read_false(self) -> bool:
+        return False
+
+    def read_true(self) -> bool:
+        return True
+
+    def read_negative_integer(self) -> int:
+        return -self.read_integer()
+
+    def read_card(self) -> Card:
+        assert self.deck is not None
+
+        return self.deck[self.read_integer()]
+
+    def read_foreign_card(self) -> Card:
+        card, = Card.parse(self.read_string())
+
+        return card
+
+    def read_list(self) -> list[Any]:
+        return self.read_values()
+
+    def read_deque(self) -> deque[Any]:
+        return deque(self.read_values())
+
+    def read_tuple(self) -> tuple[Any, ...]:
+        return tuple(self.read_values())
+
+    def read_set(self) -> set[Any]:
+        return set(self.read_values())
+
+    def read_dict(self) -> dict[Any, Any]:
+        values = iter(self.read_values())
+
+        return dict(zip(values, values))
+
+    def read_pot(self) -> Pot:
+        return Pot(self.read_value(), self.read_value(), self.read_value())
+
+    def read_operation(self) -> Operation:
+        type_: Any = _OPERATION_TYPES[self.read_integer()]
+        commentary = self.read_value()
+        operation: Operation = type_(
+            *self.read_values(),
+            commentary=commentary,
+        )
+
+        return operation
+
+    def read_hand(self) -> Hand:
+        type_ = self.read_type(Hand)
+        hand: Hand = type_(tuple(self.read_values()))
+
+        return hand
+
+    def read_enum_member(self) -> Enum:
+        type_ = self.read_type(Enum)
+        member: Enum = type_[self.read_string()]
+
+        return member
+
+    def read_dataclass(self) -> Any:
+        type_ = self.read_type(object)
+
+        if not is_dataclass(type_) or not isinstance(type_, type):
+            raise ValueError(f'The object {repr(type_)} is not a dataclass.')
+
+        return type_(*self.read_values())
+
+    def read_pickle(self) -> Any:
+        if not self.trusted:
+            raise ValueError('The pickled value is untrusted.')
+
+        return loads(self.read_bytes())
+
+
+_VALUE_READERS: tuple[Callable[[_ValueReader], Any], ...] = (
+    _ValueReader.read_none,
+    _ValueReader.read_false,
+    _ValueReader.read_true,
+    _ValueReader.read_integer,
+    _ValueReader.read_negative_integer,
+    _ValueReader.read_string,
+    _ValueReader.read_card,
+    _ValueReader.read_foreign_card,
+    _ValueReader.read_list,
+    _ValueReader.read_deque,
+    _ValueReader.read_tuple,
+    _ValueReader.read_set,
+    _ValueReader.read_dict,
+    _ValueReader.read_pot,
+    _ValueReader.read_operation,
+    _ValueReader.read_hand,
+    _ValueReader.read_enum_member,
+    _ValueReader.read_reference,
+    _ValueReader.read_dataclass,
+    _ValueReader.read_pickle,
+)
+
+assert len(_VALUE_READERS) == len(_ValueTag)
+
+
+_STATE_MAGIC = b'PKST'
+_STATE_VERSION = 1
+
+
+def _dump_state_configuration(configuration: tuple[Any, ...]) -> bytes:
+    writer = _ValueWriter()
+
+    writer.write_values(configuration)
+
+    return bytes(writer.data)
+
+
+_STATE_CONFIGURATION_CACHE_SIZE = 256
+_dump_cached_state_configuration = lru_cache(
+    _STATE_CONFIGURATION_CACHE_SIZE,
+)(_dump_state_configuration)
+
+
+@lru_cache(_STATE_CONFIGURATION_CACHE_SIZE)
+def _load_state_configuration(
+        data: bytes,
+        trusted: bool,
+) -> tuple[Any, ...]:
+    reader = _ValueReader(data, trusted=trusted)
+    configuration = tuple(reader.read_values())
+
+    if reader.offset != len(data):
+        raise ValueError('The configuration data is malformed.')
+
+    return configuration
+
+
 @dataclass
 class State:
     """The class for poker states.
@@ -1104,174 +1721,1109 @@ class State:
     hole_cards: list[list[Card]] = field(default_factory=list, init=False)
     """The player hole cards.
 
-    In PokerKit, the concept of hole cards is slightly warped as it
-    includes both up and down cards (traditionally, only down cards are
-    called interchangeably with hole cards).
-    """
-    hole_card_statuses: list[list[bool]] = field(
-        default_factory=list,
-        init=False,
-    )
-    """The player hole card statuses.
+    In PokerKit, the concept of hole cards is slightly warped as it
+    includes both up and down cards (traditionally, only down cards are
+    called interchangeably with hole cards).
+    """
+    hole_card_statuses: list[list[bool]] = field(
+        default_factory=list,
+        init=False,
+    )
+    """The player hole card statuses.
+
+    The corresponding hole card is an up card if ``True``, and down if
+    ``False``.
+    """
+    discarded_cards: list[list[Card]] = field(
+        default_factory=list,
+        init=False,
+    )
+    """The discards.
+
+    The discarded cards are added here. They may be used to replenish
+    the deck when it runs out.
+    """
+    street_index: int | None = field(default=None, init=False)
+    """The street index.
+
+    If it is not ``None``, it denotes what street the state is at
+    currently. The actual street instance can be accessed through
+    :attr:`pokerkit.state.State.street`.
+    """
+    street_return_index: int | None = field(default=None, init=False)
+    """The street return index.
+
+    This is not ``None`` if and only if multiple runouts are
+    performed/performing.
+    """
+    street_return_count: int | None = field(default=0, init=False)
+    """The street return count.
+
+    This is non-zero if there are pending runouts not underway already.
+
+    This value gets decremented before the start of each runout.
+    """
+    all_in_status: bool = field(default=False, init=False)
+    """The all-in status.
+
+    Simply put, are all active players all-in? ``True`` if yes,
+    ``False`` otherwise.
+    """
+    folded_status: bool = field(default=False, init=False)
+    """The folded status.
+
+    Simply put, did everyone except one fold? ``True`` if yes, ``False``
+    otherwise.
+    """
+    status: bool = field(default=True, init=False)
+    """The game status.
+
+    ``True`` if the state is not terminal. If it is not terminal, some
+    operation can still be performed.
+    """
+    operations: list[Operation] = field(default_factory=list, init=False)
+    """The operations that were applied to this state.
+
+    Each subsequent operation appends to this list.
+    """
+    _pot_cache: tuple[Pot, ...] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _hand_cache: dict[tuple[int, int, int, bool], Hand | None] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _info_set_keys: list[bytearray] = field(
+        default_factory=list,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _info_set_hashes: list[int] = field(
+        default_factory=list,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _info_set_operation_counts: list[int] = field(
+        default_factory=list,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    rule_table: RuleTable = field(init=False, repr=False, compare=False)
+    """The rule table compiled from the streets.
+
+    This is shared with the other states that have equal streets. For
+    more details, please consult :class:`pokerkit.state.RuleTable`.
+    """
+
+    def __post_init__(
+            self,
+            raw_antes: ValuesLike,
+            raw_blinds_or_straddles: ValuesLike,
+            raw_starting_stacks: ValuesLike,
+    ) -> None:
+        self.antes = clean_values(raw_antes, self.player_count)
+        self.blinds_or_straddles = clean_values(
+            raw_blinds_or_straddles,
+            self.player_count,
+        )
+        self.starting_stacks = clean_values(
+            raw_starting_stacks,
+            self.player_count,
+        )
+
+        if not self.streets:
+            raise ValueError('The streets are empty.')
+        elif not self.streets[0].hole_dealing_statuses:
+            raise ValueError('The first street must be of hole dealing.')
+        elif min(self.antes) < 0 or self.bring_in < 0:
+            raise ValueError('Negative antes or bring-in was supplied.')
+        elif (
+                not any(self.antes)
+                and not any(self.blinds_or_straddles)
+                and not self.bring_in
+        ):
+            raise ValueError(
+                'No antes, blinds, straddles, or bring-in was supplied.',
+            )
+        elif min(self.starting_stacks) <= 0:
+            raise ValueError('Non-positive starting stacks was supplied.')
+        elif (
+                any(map(partial(gt, 0), self.blinds_or_straddles))
+                and self.bring_in
+        ):
+            raise ValueError(
+                (
+                    'Only one of bring-in or (blinds or straddles) must'
+                    ' specified, but both were.'
+                ),
+            )
+        elif (
+                self.bring_in
+                >= self.streets[0].min_completion_betting_or_raising_amount
+        ):
+            raise ValueError('The bring-in must be less than the min bet.')
+        elif self.player_count < 2:
+            raise ValueError(
+                (
+                    'There must be at least 2 players (currently'
+                    f' {self.player_count}).'
+                ),
+            )
+        elif self.starting_board_count <= 0:
+            raise ValueError(
+                (
+                    f'The starting board count {self.starting_board_count}'
+                    ' must be positive.'
+                ),
+            )
+
+        self.rule_table = RuleTable.compile(self.streets)
+
+        self._setup()
+        self._begin()
+
+    def _setup(self) -> None:
+        self.deck_cards.extend(self.deck)
+
+        shuffle(self.deck_cards)
+
+        for i in self.player_indices:
+            self.statuses.append(True)
+            self.bets.append(0)
+            self.stacks.append(self.starting_stacks[i])
+            self.payoffs.append(0)
+            self.hole_cards.append([])
+            self.hole_card_statuses.append([])
+
+        for _ in self.street_indices:
+            self.discarded_cards.append([])
+
+        self._setup_info_sets()
+        self._setup_ante_posting()
+        self._setup_bet_collection()
+        self._setup_blind_or_straddle_posting()
+        self._setup_dealing()
+        self._setup_betting()
+        self._setup_showdown()
+        self._setup_hand_killing()
+        self._setup_chips_pushing()
+        self._setup_chips_pulling()
+
+    def _setup_info_sets(self) -> None:
+        for i in self.player_indices:
+            self._info_set_keys.append(bytearray())
+            _encode_integer(self._info_set_keys[i], i)
+            self._info_set_hashes.append(hash(i))
+            self._info_set_operation_counts.append(0)
+
+    def _begin(self) -> None:
+        self._begin_ante_posting()
+
+        self._update()
+
+    def _update(self, operation: Operation | None = None) -> None:
+        self._pot_cache = None
+
+        if operation is not None:
+            self.operations.append(operation)
+
+    def _end(self) -> None:
+        self.status = False
+
+    def reset(self, raw_starting_stacks: ValuesLike | None = None) -> None:
+        """Reset the state to play a new hand.
+
+        The per-hand attributes are reinitialized in place, and the
+        game configuration (the deck, streets, antes, blinds or
+        straddles, and so on) is retained without being cleaned or
+        validated again. This is meant for loops that play the same
+        table configuration over and over.
+
+        If the starting stacks are not given, the previous ones are
+        reused.
+
+        Note that the containers of the per-hand attributes (e.g.
+        :attr:`pokerkit.state.State.operations`) are cleared in place
+        instead of being replaced.
+
+        >>> from pokerkit import NoLimitTexasHoldem
+        >>> state = NoLimitTexasHoldem.create_state(
+        ...     tuple(Automation),
+        ...     False,
+        ...     0,
+        ...     (1, 2),
+        ...     2,
+        ...     200,
+        ...     3,
+        ... )
+        >>> state.fold()
+        Folding(commentary=None, player_index=2)
+        >>> state.fold()
+        Folding(commentary=None, player_index=0)
+        >>> state.status
+        False
+        >>> state.stacks
+        [199, 201, 200]
+        >>> state.reset()
+        >>> state.status
+        True
+        >>> state.stacks
+        [199, 198, 200]
+        >>> state.reset((100, 200, 300))
+        >>> state.starting_stacks
+        (100, 200, 300)
+        >>> state.stacks
+        [99, 198, 300]
+        >>> state.reset(0)
+        Traceback (most recent call last):
+            ...
+        ValueError: Non-positive starting stacks was supplied.
+
+        :param raw_starting_stacks: The optional starting stacks.
+        :return: ``None``.
+        :raises ValueError: If the starting stacks are invalid.
+        """
+        if raw_starting_stacks is not None:
+            starting_stacks = clean_values(
+                raw_starting_stacks,
+                self.player_count,
+            )
+
+            if min(starting_stacks) <= 0:
+                raise ValueError('Non-positive starting stacks was supplied.')
+
+            self.starting_stacks = starting_stacks
+
+        for field_ in fields(self):
+            if field_.init:
+                continue
+            elif field_.default_factory is not MISSING:
+                getattr(self, field_.name).clear()
+            elif field_.default is not MISSING:
+                setattr(self, field_.name, field_.default)
+
+        self._setup()
+        self._begin()
+
+    def rotate_button(self) -> None:
+        """Reset the state to play a new hand after moving the button.
+
+        The button is moved to the next player and the final stacks are
+        carried over as the next starting stacks. In other words, the
+        stack of the player at index ``i`` becomes the starting stack of
+        the player at index ``i - 1`` (and the stack of the first player
+        becomes that of the last player, the new button).
+
+        >>> from pokerkit import NoLimitTexasHoldem
+        >>> state = NoLimitTexasHoldem.create_state(
+        ...     tuple(Automation),
+        ...     False,
+        ...     0,
+        ...     (1, 2),
+        ...     2,
+        ...     200,
+        ...     3,
+        ... )
+        >>> state.rotate_button()
+        Traceback (most recent call last):
+            ...
+        ValueError: The hand is not over yet.
+        >>> state.fold()
+        Folding(commentary=None, player_index=2)
+        >>> state.fold()
+        Folding(commentary=None, player_index=0)
+        >>> state.stacks
+        [199, 201, 200]
+        >>> state.rotate_button()
+        >>> state.starting_stacks
+        (201, 200, 199)
+
+        :return: ``None``.
+        :raises ValueError: If the hand is not over or a player is out
+                            of chips.
+        """
+        if self.status:
+            raise ValueError('The hand is not over yet.')
+
+        self.reset(rotated(self.stacks, -1))
+
+    def clone(self) -> State:
+        """Return an independent copy of the state.
+
+        Unlike :func:`copy.deepcopy`, only the mutable containers (and
+        the pots) are copied. The immutable values like the cards, the
+        operations, and the game configuration are shared.
+
+        >>> from pokerkit import NoLimitTexasHoldem
+        >>> state = NoLimitTexasHoldem.create_state(
+        ...     tuple(Automation),
+        ...     False,
+        ...     0,
+        ...     (1, 2),
+        ...     2,
+        ...     200,
+        ...     2,
+        ... )
+        >>> clone = state.clone()
+        >>> clone.fold()
+        Folding(commentary=None, player_index=1)
+        >>> clone.status
+        False
+        >>> state.status
+        True
+        >>> state.stacks
+        [198, 199]
+
+        :return: The copy.
+        """
+        state = object.__new__(type(self))
+
+        for key, value in vars(self).items():
+            setattr(state, key, _clone(value))
+
+        state._pot_cache = None
+
+        return state
+
+    _UNSERIALIZED_FIELD_NAMES = frozenset(
+        {
+            '_pot_cache',
+            '_hand_cache',
+            '_info_set_keys',
+            '_info_set_hashes',
+            '_info_set_operation_counts',
+            'rule_table',
+        },
+    )
+
+    @classmethod
+    @cache
+    def _get_serialized_field_names(
+            cls,
+    ) -> tuple[tuple[str, ...], tuple[str, ...], int]:
+        configuration_field_names = []
+        body_field_names = []
+
+        for field_ in fields(cls):
+            if field_.init:
+                configuration_field_names.append(field_.name)
+            elif field_.name not in cls._UNSERIALIZED_FIELD_NAMES:
+                body_field_names.append(field_.name)
+
+        fingerprint = crc32(
+            ' '.join(
+                chain(configuration_field_names, body_field_names),
+            ).encode(),
+        )
+
+        return (
+            tuple(configuration_field_names),
+            tuple(body_field_names),
+            fingerprint,
+        )
+
+    def to_bytes(self) -> bytes:
+        """Serialize the state into compact bytes.
+
+        The game configuration (the deck, streets, and so on) is
+        written once as a header, and the per-hand values follow it
+        with the cards written as indices into the deck. The headers of
+        the recently used configurations are cached, so serializing
+        many states of the same table is cheap. The caches (like the
+        pots and the information-set keys) are not written and are
+        rebuilt on load. The values with no compact encoding (like
+        :func:`functools.partial` objects) are pickled and can only be
+        loaded as trusted data.
+
+        The data begins with the magic bytes ``b'PKST'`` followed by a
+        format version and a fingerprint of the layout of the state,
+        so stale data is rejected by
+        :meth:`pokerkit.state.State.from_bytes` rather than being
+        misread.
+
+        >>> from pokerkit import NoLimitTexasHoldem, State
+        >>> state = NoLimitTexasHoldem.create_state(
+        ...     tuple(Automation),
+        ...     False,
+        ...     0,
+        ...     (1, 2),
+        ...     2,
+        ...     200,
+        ...     2,
+        ... )
+        >>> data = state.to_bytes()
+        >>> data[:4]
+        b'PKST'
+        >>> len(data) < 1000
+        True
+        >>> State.from_bytes(data) == state
+        True
+
+        :return: The serialized state.
+        :raises ValueError: If the state contains a value that cannot
+                            be serialized (like a locally defined
+                            function).
+        """
+        configuration_field_names, body_field_names, fingerprint = (
+            self._get_serialized_field_names()
+        )
+        configuration_values = tuple(
+            getattr(self, name) for name in configuration_field_names
+        )
+
+        try:
+            configuration = _dump_cached_state_configuration(
+                configuration_values,
+            )
+        except TypeError:  # unhashable (e.g. streets in a list)
+            configuration = _dump_state_configuration(configuration_values)
+        writer = _ValueWriter(self.deck)
+
+        writer.data.extend(_STATE_MAGIC)
+        writer.write_integer(_STATE_VERSION)
+        writer.data.extend(fingerprint.to_bytes(4, 'little'))
+        writer.write_integer(len(configuration))
+        writer.data.extend(configuration)
+
+        for name in body_field_names:
+            writer.write_value(getattr(self, name))
+
+        return bytes(writer.data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, trusted: bool = False) -> State:
+        """Deserialize the state from the bytes.
+
+        The bytes must have been created by
+        :meth:`pokerkit.state.State.to_bytes`. The loaded state is
+        equal to, and can be played independently of, the original.
+
+        By default, the data may only refer to the objects of this
+        package, and the values that were pickled while serializing
+        (like :func:`functools.partial` objects) are rejected. Like
+        :mod:`pickle`, trusted data can refer to arbitrary importable
+        objects and embed pickled values, so only pass
+        ``trusted=True`` for data from trusted sources.
+
+        >>> from pokerkit import NoLimitTexasHoldem, State
+        >>> state = NoLimitTexasHoldem.create_state(
+        ...     tuple(Automation),
+        ...     False,
+        ...     0,
+        ...     (1, 2),
+        ...     2,
+        ...     200,
+        ...     2,
+        ... )
+        >>> state.fold()
+        Folding(commentary=None, player_index=1)
+        >>> state = State.from_bytes(state.to_bytes())
+        >>> state.status
+        False
+        >>> state.stacks
+        [201, 199]
+        >>> State.from_bytes(b'PKST')
+        Traceback (most recent call last):
+            ...
+        ValueError: The data is malformed.
+
+        :param data: The serialized state.
+        :param trusted: The trustedness of the data, defaults to
+                        ``False``, in which case only the objects of
+                        this package can be referred to and no pickled
+                        value is loaded.
+        :return: The state.
+        :raises ValueError: If the data is malformed, is of a different
+                            format version, was created with a different
+                            layout of the state, or is untrusted but
+                            refers to a foreign object or embeds a
+                            pickled value.
+        """
+        configuration_field_names, body_field_names, fingerprint = (
+            cls._get_serialized_field_names()
+        )
+        data = bytes(data)
+
+        if not data.startswith(_STATE_MAGIC):
+            raise ValueError('The data is not a serialized state.')
+
+        reader = _ValueReader(data, trusted=trusted)
+        reader.offset = len(_STATE_MAGIC)
+
+        try:
+            version = reader.read_integer()
+
+            if version != _STATE_VERSION:
+                raise ValueError(
+                    f'The format version {version} is not supported.',
+                )
+
+            raw_fingerprint = data[reader.offset:reader.offset + 4]
+            reader.offset += 4
+
+            if int.from_bytes(raw_fingerprint, 'little') != fingerprint:
+                raise ValueError(
+                    'The data was created with a different layout.',
+                )
+
+            configuration = _load_state_configuration(
+                reader.read_bytes(),
+                trusted,
+            )
+
+            if len(configuration) != len(configuration_field_names):
+                raise ValueError('The configuration data is malformed.')
+
+            state = object.__new__(cls)
+
+            for name, value in zip(configuration_field_names, configuration):
+                setattr(state, name, value)
+
+            reader.deck = state.deck
+
+            for name in body_field_names:
+                setattr(state, name, reader.read_value())
+        except (
+                AttributeError,
+                EOFError,
+                ImportError,
+                IndexError,
+                KeyError,
+                TypeError,
+                UnicodeDecodeError,
+                UnpicklingError,
+        ) as error:
+            raise ValueError('The data is malformed.') from error
+
+        if reader.offset != len(data):
+            raise ValueError('The data has trailing bytes.')
+
+        state._pot_cache = None
+        state._hand_cache = {}
+        state._info_set_keys = []
+        state._info_set_hashes = []
+        state._info_set_operation_counts = []
+        state.rule_table = RuleTable.compile(state.streets)
+
+        state._setup_info_sets()
+
+        return state
+
+    def advance_until_decision(
+            self,
+            board_cards: CardsLike = (),
+            hole_cards: CardsLike = (),
+    ) -> list[Operation]:
+        """Carry out the pending operations until a decision is pending
+        or the state is terminal.
+
+        The operations that are carried out are the ones that no player
+        decides on: ante postings, bet collections, blind or straddle
+        postings, card burnings, hole dealings, board dealings, hand
+        killings, chips pushings, and chips pullings. The decisions are
+        standing pat/discarding, betting (folding, checking/calling,
+        posting the bring-in, or completing/betting/raising), selecting
+        the runout count, and showing/mucking the hole cards.
+
+        The board is dealt from the supplied board cards, in order,
+        before it is dealt from the deck. Likewise, the hole cards are
+        dealt one at a time from the supplied hole cards before they are
+        dealt from the deck. Supplied cards that are not dealt by the
+        time this method returns are disregarded. The burnt cards are
+        always dealt from the deck.
+
+        >>> from pokerkit import NoLimitTexasHoldem
+        >>> state = NoLimitTexasHoldem.create_state(
+        ...     (Automation.HOLE_CARDS_SHOWING_OR_MUCKING,),
+        ...     False,
+        ...     0,
+        ...     (1, 2),
+        ...     2,
+        ...     200,
+        ...     2,
+        ... )
+        >>> len(state.advance_until_decision())
+        6
+        >>> state.actor_index
+        1
+        >>> state.complete_bet_or_raise_to(200)  # doctest: +ELLIPSIS
+        CompletionBettingOrRaisingTo(commentary=None, player_index=1, amou...
+        >>> state.check_or_call()
+        CheckingOrCalling(commentary=None, player_index=0, amount=198)
+        >>> operations = state.advance_until_decision('AsKsQsJsTs')
+        >>> state.status
+        False
+        >>> state.board_cards
+        [[As], [Ks], [Qs], [Js], [Ts]]
+        >>> state.stacks
+        [200, 200]
+        >>> state.advance_until_decision()
+        []
+
+        The hole cards can be supplied as well.
+
+        >>> state = NoLimitTexasHoldem.create_state(
+        ...     (),
+        ...     False,
+        ...     0,
+        ...     (1, 2),
+        ...     2,
+        ...     200,
+        ...     2,
+        ... )
+        >>> operations = state.advance_until_decision((), 'AsKsAhKh')
+        >>> state.hole_cards
+        [[As, Ah], [Ks, Kh]]
+
+        :param board_cards: The optional board cards to be dealt,
+                            defaults to ``()``.
+        :param hole_cards: The optional hole cards to be dealt, defaults
+                           to ``()``.
+        :return: The operations that were applied, including the
+                 automated ones.
+        :raises ValueError: If the cards cannot be dealt.
+        """
+        operation_count = len(self.operations)
+        cards = deque(Card.clean(board_cards))
+        dealt_hole_cards = deque(Card.clean(hole_cards))
+
+        while self.status:
+            # The next operation is picked from the phase state directly
+            # (in the order of the verifiers) rather than by probing every
+            # ``can_*`` method, each of which raises and catches an error.
+            hole_dealing_status = any(self.hole_dealing_statuses)
+            board_dealing_status = any(self.board_dealing_counts)
+
+            if any(self.ante_posting_statuses):
+                self.post_ante()
+            elif self.bet_collection_status:
+                self.collect_bets()
+            elif any(self.blind_or_straddle_posting_statuses):
+                self.post_blind_or_straddle()
+            elif any(self.standing_pat_or_discarding_statuses):
+                break
+            elif self.card_burning_status and not (
+                    hole_dealing_status and board_dealing_status
+            ):
+                self.burn_card()
+            elif hole_dealing_status:
+                if dealt_hole_cards:
+                    self.deal_hole((dealt_hole_cards.popleft(),))
+                else:
+                    self.deal_hole()
+            elif board_dealing_status:
+                assert self.board_dealing_count is not None
+
+                count = min(self.board_dealing_count, len(cards))
+
+                if count:
+                    self.deal_board(
+                        tuple(cards.popleft() for _ in range(count)),
+                    )
+                else:
+                    self.deal_board()
+            elif any(self.hand_killing_statuses):
+                self.kill_hand()
+            elif self._sub_pots:
+                self.push_chips()
+            elif any(self.chips_pulling_statuses):
+                self.pull_chips()
+            else:
+                break
+
+        return self.operations[operation_count:]
+
+    @property
+    def observation_size(self) -> int:
+        """Return the size of the encoded observations.
+
+        For the layout of the observations, please consult
+        :meth:`pokerkit.state.State.encode_observation`.
+
+        >>> from pokerkit import NoLimitTexasHoldem
+        >>> state = NoLimitTexasHoldem.create_state(
+        ...     (),
+        ...     True,
+        ...     0,
+        ...     (1, 2),
+        ...     2,
+        ...     200,
+        ...     2,
+        ... )
+        >>> state.observation_size
+        174
+
+        :return: The observation size.
+        """
+        return (
+            3 * len(self.deck)
+            + 3 * self.player_count
+            + 1
+            + self.street_count
+            + 1
+            + 6
+        )
+
+    def encode_observation(
+            self,
+            player_index: int,
+            buffer: MutableSequence[float] | None = None,
+            offset: int = 0,
+    ) -> MutableSequence[float]:
+        """Encode what the player observes into a fixed-layout feature
+        vector.
+
+        The features are written into the buffer, starting at the
+        offset, in the following order.
+
+        1. For each card in the deck, whether it is a hole card of the
+           player.
+        2. For each card in the deck, whether it is a board card.
+        3. For each card in the deck, whether it is an up card of an
+           opponent.
+        4. For each player, starting from the player and in the order of
+           the player indices, the stack, the bet, and the status. The
+           stacks and bets are divided by the total starting stack.
+        5. The total pot amount (including the bets) divided by the
+           total starting stack.
+        6. For each street, whether it is the current street, followed
+           by whether there is no street (the showdown or after).
+        7. If the player is in turn, whether folding, checking/calling,
+           completing/betting/raising, posting the bring-in, standing
+           pat/discarding, and showing/mucking the hole cards can be
+           done. Otherwise, zeros.
+
+        The buffer can be any mutable sequence of numbers (e.g.
+        ``list``, :class:`array.array`, or a NumPy array) with at least
+        ``offset +`` :attr:`pokerkit.state.State.observation_size`
+        items. The features are written in place, and no other item is
+        modified.
+
+        >>> from pokerkit import NoLimitTexasHoldem
+        >>> state = NoLimitTexasHoldem.create_state(
+        ...     (
+        ...         Automation.ANTE_POSTING,
+        ...         Automation.BET_COLLECTION,
+        ...         Automation.BLIND_OR_STRADDLE_POSTING,
+        ...     ),
+        ...     True,
+        ...     0,
+        ...     (1, 2),
+        ...     2,
+        ...     200,
+        ...     2,
+        ... )
+        >>> state.deal_hole('AcAd')  # doctest: +ELLIPSIS
+        HoleDealing(commentary=None, player_index=0, cards=(Ac, Ad), statu...
+        >>> state.deal_hole('KsKh')  # doctest: +ELLIPSIS
+        HoleDealing(commentary=None, player_index=1, cards=(Ks, Kh), statu...
+        >>> observation = state.encode_observation(1)
+        >>> len(observation)
+        174
+        >>> sum(observation[:52])
+        2.0
+        >>> observation[156:162].tolist()
+        [0.4975, 0.0025, 1.0, 0.495, 0.005, 1.0]
+        >>> observation[162]
+        0.0075
+        >>> observation[163:168].tolist()
+        [1.0, 0.0, 0.0, 0.0, 0.0]
+        >>> observation[168:].tolist()
+        [1.0, 1.0, 1.0, 0.0, 0.0, 0.0]
+        >>> buffer = [None] * 180
+        >>> buffer is state.encode_observation(0, buffer, 5)
+        True
+        >>> buffer[:5]
+        [None, None, None, None, None]
+        >>> buffer[-7:]
+        [0, 0, 0, 0, 0, 0, None]
+        >>> state.encode_observation(0, buffer, 7)
+        Traceback (most recent call last):
+            ...
+        ValueError: The buffer is too small for 174 features at 7.
+
+        :param player_index: The player index.
+        :param buffer: The optional buffer, defaults to a new
+                       :class:`array.array` of ``float``.
+        :param offset: The offset of the features in the buffer,
+                       defaults to ``0``.
+        :return: The buffer.
+        :raises ValueError: If the player index is invalid or the buffer
+                            is too small.
+        """
+        observation_size = self.observation_size
+
+        if buffer is None:
+            buffer = array('d', bytes(8 * (offset + observation_size)))
+
+        if player_index not in self.player_indices:
+            raise ValueError(f'The player index {player_index} is invalid.')
+        elif not 0 <= offset <= len(buffer) - observation_size:
+            raise ValueError(
+                (
+                    f'The buffer is too small for {observation_size} features'
+                    f' at {offset}.'
+                ),
+            )
+
+        for i in range(offset, offset + observation_size):
+            buffer[i] = 0
 
-    The corresponding hole card is an up card if ``True``, and down if
-    ``False``.
-    """
-    discarded_cards: list[list[Card]] = field(
-        default_factory=list,
-        init=False,
-    )
-    """The discards.
+        card_indices = _get_card_indices(self.deck)
 
-    The discarded cards are added here. They may be used to replenish
-    the deck when it runs out.
-    """
-    street_index: int | None = field(default=None, init=False)
-    """The street index.
+        for card in self.hole_cards[player_index]:
+            if card in card_indices:
+                buffer[offset + card_indices[card]] = 1
 
-    If it is not ``None``, it denotes what street the state is at
-    currently. The actual street instance can be accessed through
-    :attr:`pokerkit.state.State.street`.
-    """
-    street_return_index: int | None = field(default=None, init=False)
-    """The street return index.
+        offset += len(self.deck)
 
-    This is not ``None`` if and only if multiple runouts are
-    performed/performing.
-    """
-    street_return_count: int | None = field(default=0, init=False)
-    """The street return count.
+        for cards in self.board_cards:
+            for card in cards:
+                if card in card_indices:
+                    buffer[offset + card_indices[card]] = 1
 
-    This is non-zero if there are pending runouts not underway already.
+        offset += len(self.deck)
 
-    This value gets decremented before the start of each runout.
-    """
-    all_in_status: bool = field(default=False, init=False)
-    """The all-in status.
+        for i in self.player_indices:
+            if i != player_index:
+                for card in self.get_up_cards(i):
+                    if card in card_indices:
+                        buffer[offset + card_indices[card]] = 1
 
-    Simply put, are all active players all-in? ``True`` if yes,
-    ``False`` otherwise.
-    """
-    folded_status: bool = field(default=False, init=False)
-    """The folded status.
+        offset += len(self.deck)
+        total_starting_stack = sum(self.starting_stacks)
 
-    Simply put, did everyone except one fold? ``True`` if yes, ``False``
-    otherwise.
-    """
-    status: bool = field(default=True, init=False)
-    """The game status.
+        for i in chain(
+                range(player_index, self.player_count),
+                range(player_index),
+        ):
+            buffer[offset] = self.stacks[i] / total_starting_stack
+            buffer[offset + 1] = self.bets[i] / total_starting_stack
+            buffer[offset + 2] = int(self.statuses[i])
+            offset += 3
 
-    ``True`` if the state is not terminal. If it is not terminal, some
-    operation can still be performed.
-    """
-    operations: list[Operation] = field(default_factory=list, init=False)
-    """The operations that were applied to this state.
+        buffer[offset] = self.total_pot_amount / total_starting_stack
+        offset += 1
 
-    Each subsequent operation appends to this list.
-    """
+        if self.street_index is None:
+            buffer[offset + self.street_count] = 1
+        else:
+            buffer[offset + self.street_index] = 1
 
-    def __post_init__(
+        offset += self.street_count + 1
+
+        if self.turn_index == player_index:
+            buffer[offset] = int(self.can_fold())
+            buffer[offset + 1] = int(self.can_check_or_call())
+            buffer[offset + 2] = int(self.can_complete_bet_or_raise_to())
+            buffer[offset + 3] = int(self.can_post_bring_in())
+            buffer[offset + 4] = int(self.can_stand_pat_or_discard())
+            buffer[offset + 5] = int(self.can_show_or_muck_hole_cards())
+
+        return buffer
+
+    def _encode_operation(
             self,
-            raw_antes: ValuesLike,
-            raw_blinds_or_straddles: ValuesLike,
-            raw_starting_stacks: ValuesLike,
+            key: bytearray,
+            player_index: int,
+            operation: Operation,
     ) -> None:
-        self.antes = clean_values(raw_antes, self.player_count)
-        self.blinds_or_straddles = clean_values(
-            raw_blinds_or_straddles,
-            self.player_count,
-        )
-        self.starting_stacks = clean_values(
-            raw_starting_stacks,
-            self.player_count,
-        )
+        card_indices = _get_card_indices(self.deck)
+        foreign_card_code = len(card_indices) + 1
 
-        if not self.streets:
-            raise ValueError('The streets are empty.')
-        elif not self.streets[0].hole_dealing_statuses:
-            raise ValueError('The first street must be of hole dealing.')
-        elif min(self.antes) < 0 or self.bring_in < 0:
-            raise ValueError('Negative antes or bring-in was supplied.')
-        elif (
-                not any(self.antes)
-                and not any(self.blinds_or_straddles)
-                and not self.bring_in
-        ):
-            raise ValueError(
-                'No antes, blinds, straddles, or bring-in was supplied.',
-            )
-        elif min(self.starting_stacks) <= 0:
-            raise ValueError('Non-positive starting stacks was supplied.')
-        elif (
-                any(map(partial(gt, 0), self.blinds_or_straddles))
-                and self.bring_in
-        ):
-            raise ValueError(
-                (
-                    'Only one of bring-in or (blinds or straddles) must'
-                    ' specified, but both were.'
-                ),
-            )
-        elif (
-                self.bring_in
-                >= self.streets[0].min_completion_betting_or_raising_amount
-        ):
-            raise ValueError('The bring-in must be less than the min bet.')
-        elif self.player_count < 2:
-            raise ValueError(
-                (
-                    'There must be at least 2 players (currently'
-                    f' {self.player_count}).'
-                ),
-            )
-        elif self.starting_board_count <= 0:
-            raise ValueError(
-                (
-                    f'The starting board count {self.starting_board_count}'
-                    ' must be positive.'
-                ),
-            )
+        def encode_cards(cards: Iterable[Card | None]) -> None:
+            for card in cards:
+                if card is None:
+                    key.append(0)
+                elif card in card_indices:
+                    _encode_integer(key, card_indices[card] + 1)
+                else:  # unknown or not in the deck
+                    encoded_card = repr(card).encode()
+
+                    _encode_integer(key, foreign_card_code)
+                    _encode_integer(key, len(encoded_card))
+                    key.extend(encoded_card)
+
+        key.append(_OPERATION_TAGS[type(operation)])
+
+        match operation:
+            case (
+                    AntePosting(i, amount)
+                    | BlindOrStraddlePosting(i, amount)
+                    | CheckingOrCalling(i, amount)
+                    | BringInPosting(i, amount)
+                    | CompletionBettingOrRaisingTo(i, amount)
+                    | ChipsPulling(i, amount)
+            ):
+                _encode_integer(key, i)
+                _encode_integer(key, amount)
+            case BetCollection(bets):
+                for bet in bets:
+                    _encode_integer(key, bet)
+            case HoleDealing(i, cards, statuses):
+                _encode_integer(key, i)
+                _encode_integer(key, len(cards))
+                encode_cards(
+                    card if i == player_index or status else None
+                    for card, status in zip(cards, statuses)
+                )
+                key.extend(statuses)
+            case BoardDealing(cards):
+                _encode_integer(key, len(cards))
+                encode_cards(cards)
+            case StandingPatOrDiscarding(i, cards):
+                _encode_integer(key, i)
+                _encode_integer(key, len(cards))
+                encode_cards(
+                    card if i == player_index else None for card in cards
+                )
+            case Folding(i) | HandKilling(i):
+                _encode_integer(key, i)
+            case RunoutCountSelection(i, runout_count):
+                _encode_integer(key, i)
+                _encode_integer(key, runout_count or 0)
+            case HoleCardsShowingOrMucking(i, hole_cards):
+                _encode_integer(key, i)
+                _encode_integer(key, len(hole_cards))
+                encode_cards(hole_cards)
+            case ChipsPushing(
+                    amounts,
+                    pot_index,
+                    board_index,
+                    hand_type_index,
+            ):
+                for amount in amounts:
+                    _encode_integer(key, amount)
 
-        self._setup()
-        self._begin()
+                _encode_integer(key, pot_index)
+                _encode_integer(
+                    key,
+                    0 if board_index is None else board_index + 1,
+                )
+                _encode_integer(
+                    key,
+                    0 if hand_type_index is None else hand_type_index + 1,
+                )
 
-    def _setup(self) -> None:
-        self.deck_cards.extend(self.deck)
+    def _update_info_set(self, player_index: int) -> None:
+        if player_index not in self.player_indices:
+            raise ValueError(f'The player index {player_index} is invalid.')
 
-        shuffle(self.deck_cards)
+        key = bytearray()
+        hash_ = self._info_set_hashes[player_index]
+        operation_count = self._info_set_operation_counts[player_index]
 
-        for i in self.player_indices:
-            self.statuses.append(True)
-            self.bets.append(0)
-            self.stacks.append(self.starting_stacks[i])
-            self.payoffs.append(0)
-            self.hole_cards.append([])
-            self.hole_card_statuses.append([])
+        for operation in islice(self.operations, operation_count, None):
+            length = len(key)
 
-        for _ in self.street_indices:
-            self.discarded_cards.append([])
+            self._encode_operation(key, player_index, operation)
 
-        self._setup_ante_posting()
-        self._setup_bet_collection()
-        self._setup_blind_or_straddle_posting()
-        self._setup_dealing()
-        self._setup_betting()
-        self._setup_showdown()
-        self._setup_hand_killing()
-        self._setup_chips_pushing()
-        self._setup_chips_pulling()
+            hash_ = hash((hash_, bytes(key[length:])))
 
-    def _begin(self) -> None:
-        self._begin_ante_posting()
+        self._info_set_keys[player_index].extend(key)
+        self._info_set_hashes[player_index] = hash_
+        self._info_set_operation_counts[player_index] = len(self.operations)
 
-        self._update()
+    def get_info_set_key(self, player_index: int) -> bytes:
+        """Return the canonical key of the information set of the
+        player.
 
-    def _update(self, operation: Operation | None = None) -> None:
-        if operation is not None:
-            self.operations.append(operation)
+        The key is a compact byte string that encodes the player index
+        and every operation from the point of view of the player. The
+        hole cards of the other players that are face-down, the burnt
+        cards, and the cards discarded by the other players are
+        censored. Therefore, two states share the key for a player if
+        and only if they are indistinguishable to that player. The
+        unknown cards (``??``) and the cards not in the deck are
+        encoded by their string representations.
 
-    def _end(self) -> None:
-        self.status = False
+        The key is built incrementally: only the operations since the
+        last call are encoded. The key is stable across processes and
+        can be stored.
+
+        >>> from pokerkit import FixedLimitSevenCardStud
+        >>> state = FixedLimitSevenCardStud.create_state(
+        ...     (
+        ...         Automation.ANTE_POSTING,
+        ...         Automation.BET_COLLECTION,
+        ...         Automation.BLIND_OR_STRADDLE_POSTING,
+        ...         Automation.CARD_BURNING,
+        ...         Automation.BOARD_DEALING,
+        ...     ),
+        ...     True,
+        ...     1,
+        ...     1,
+        ...     2,
+        ...     4,
+        ...     200,
+        ...     2,
+        ... )
+        >>> other_state = state.clone()
+        >>> state.deal_hole('AsKsQs')  # doctest: +ELLIPSIS
+        HoleDealing(commentary=None, player_index=0, cards=(As, Ks, Qs), ...
+        >>> state.deal_hole('2c3c4c')  # doctest: +ELLIPSIS
+        HoleDealing(commentary=None, player_index=1, cards=(2c, 3c, 4c), ...
+        >>> other_state.deal_hole('AsKsQs')  # doctest: +ELLIPSIS
+        HoleDealing(commentary=None, player_index=0, cards=(As, Ks, Qs), ...
+        >>> other_state.deal_hole('2d3d4c')  # doctest: +ELLIPSIS
+        HoleDealing(commentary=None, player_index=1, cards=(2d, 3d, 4c), ...
+        >>> state.get_info_set_key(0) == other_state.get_info_set_key(0)
+        True
+        >>> state.get_info_set_key(1) == other_state.get_info_set_key(1)
+        False
+        >>> state.get_info_set_key(2)
+        Traceback (most recent call last):
+            ...
+        ValueError: The player index 2 is invalid.
+
+        :param player_index: The player index.
+        :return: The information set key.
+        :raises ValueError: If the player index is invalid.
+        """
+        self._update_info_set(player_index)
+
+        return bytes(self._info_set_keys[player_index])
+
+    def get_info_set_hash(self, player_index: int) -> int:
+        """Return the hash of the information set of the player.
+
+        The hash is updated incrementally with each operation, so it is
+        cheaper to obtain than the key (see
+        :meth:`pokerkit.state.State.get_info_set_key`). Unlike the key,
+        the hash is only stable within the same process.
+
+        >>> from pokerkit import KuhnPoker
+        >>> state = KuhnPoker.create_state(
+        ...     (
+        ...         Automation.ANTE_POSTING,
+        ...         Automation.BET_COLLECTION,
+        ...     ),
+        ... )
+        >>> state.deal_hole('Js')  # doctest: +ELLIPSIS
+        HoleDealing(commentary=None, player_index=0, cards=(Js,), statuses=...
+        >>> state.deal_hole('Qs')  # doctest: +ELLIPSIS
+        HoleDealing(commentary=None, player_index=1, cards=(Qs,), statuses=...
+        >>> hash_ = state.get_info_set_hash(1)
+        >>> state.check_or_call()
+        CheckingOrCalling(commentary=None, player_index=0, amount=0)
+        >>> hash_ == state.get_info_set_hash(1)
+        False
+
+        :param player_index: The player index.
+        :return: The information set hash.
+        :raises ValueError: If the player index is invalid.
+        """
+        self._update_info_set(player_index)
+
+        return self._info_set_hashes[player_index]
 
     @property
     def hand_type_count(self) -> int:
@@ -1392,8 +2944,7 @@ class State:
 
         :return: The draw statuses.
         """
-        for street in self.streets:
-            yield street.draw_status
+        yield from self.rule_table.draw_statuses
 
     @property
     def player_indices(self) -> range:
@@ -1686,10 +3237,9 @@ class State:
         if self.street_return_index is not None:
             assert self.runout_count is not None
 
-            mid = 0
-
-            for i in range(self.street_return_index):
-                mid += self.streets[i].board_dealing_count
+            mid = self.rule_table.board_dealing_offsets[
+                self.street_return_index
+            ]
 
             for i, cards in enumerate(self.board_cards):
                 index = board_index
@@ -1976,6 +3526,11 @@ class State:
         if not self.statuses[player_index]:
             return None
 
+        key = player_index, board_index, hand_type_index, False
+
+        if key in self._hand_cache:
+            return self._hand_cache[key]
+
         try:
             hand = self.hand_types[hand_type_index].from_game(
                 filter(None, self.hole_cards[player_index]),
@@ -1984,6 +3539,8 @@ class State:
         except (KeyError, ValueError):
             hand = None
 
+        self._hand_cache[key] = hand
+
         return hand
 
     def get_up_hand(
@@ -2098,6 +3655,11 @@ class State:
         if not self.statuses[player_index]:
             return None
 
+        key = player_index, board_index, hand_type_index, True
+
+        if key in self._hand_cache:
+            return self._hand_cache[key]
+
         try:
             hand = self.hand_types[hand_type_index].from_game(
                 self.get_up_cards(player_index),
@@ -2106,6 +3668,8 @@ class State:
         except ValueError:
             hand = None
 
+        self._hand_cache[key] = hand
+
         return hand
 
     def get_up_hands(
@@ -2288,12 +3852,14 @@ class State:
         :param player_index: The player index.
         :return: ``True`` if the player can win, otherwise ``False``.
         """
+        pots = tuple(self.pots)
+
         for i in self.board_indices:
             for j in self.hand_type_indices:
                 hands = tuple(self.get_up_hands(i, j))
                 hand = self.get_hand(player_index, i, j)
 
-                for pot in self.pots:
+                for pot in pots:
                     max_hand = max_or_none(
                         map(partial(getitem, hands), pot.player_indices),
                     )
@@ -2436,10 +4002,14 @@ class State:
             cards = dealable_cards[:cards]
         else:
             cards = Card.clean(cards)
-            dealable_cards = tuple(self.get_dealable_cards(len(cards)))
+
+            if len(cards) <= len(self.deck_cards):
+                recommended_cards: Iterable[Card] = self.deck_cards
+            else:
+                recommended_cards = tuple(self.get_dealable_cards(len(cards)))
 
             for card in cards:
-                if card not in dealable_cards and card:
+                if card and card not in recommended_cards:
                     warn(
                         (
                             f'A card being dealt {repr(card)} is not'
@@ -2452,7 +4022,12 @@ class State:
         return cards
 
     def _consume_cards(self, cards: tuple[Card, ...]) -> None:
-        if set(cards) > set(self.deck_cards):
+        card_set = set(cards)
+
+        if (
+                all(map(card_set.__contains__, self.deck_cards))
+                and card_set != set(self.deck_cards)
+        ):
             self._produce_cards(shuffled(self.reserved_cards))
 
             self.mucked_cards.clear()
@@ -2844,7 +4419,13 @@ class State:
             yield from self._pots
 
             return
-        elif sum(self.payoffs) == -sum(self.bets):
+        elif self._pot_cache is None:
+            self._pot_cache = tuple(self._create_pots())
+
+        yield from self._pot_cache
+
+    def _create_pots(self) -> Iterator[Pot]:
+        if sum(self.payoffs) == -sum(self.bets):
             return
 
         contributions = []
@@ -3879,6 +5460,8 @@ class State:
             self.hole_cards[player_index].append(card)
             self.hole_card_statuses[player_index].append(status)
 
+        self._hand_cache.clear()
+
         operation = HoleDealing(
             player_index,
             cards,
@@ -3987,11 +5570,7 @@ class State:
 
         self._consume_cards(cards)
 
-        index = 0
-
-        for i in range(self.street_index):
-            index += self.streets[i].board_dealing_count
-
+        index = self.rule_table.board_dealing_offsets[self.street_index]
         index += max(
             self.street.board_dealing_count - self.board_dealing_count,
             0,
@@ -4009,6 +5588,8 @@ class State:
 
             index += 1
 
+        self._hand_cache.clear()
+
         operation = BoardDealing(cards, commentary=commentary)
 
         self._update_dealing(operation)
@@ -4123,6 +5704,8 @@ class State:
             self.hole_card_statuses[player_index].pop(index)
             self.discarded_cards[self.street_index].append(card)
 
+        self._hand_cache.clear()
+
         operation = StandingPatOrDiscarding(
             player_index,
             cards,
@@ -4269,17 +5852,19 @@ class State:
             and self.bring_in > 0
         )
         self.completion_status = self.bring_in_status
-        self.actor_indices = deque(self.player_indices)
 
-        self.actor_indices.rotate(-self.opener_index)
+        self.actor_indices.clear()
 
-        for i in self.player_indices:
+        for i in chain(
+                range(self.opener_index, self.player_count),
+                range(self.opener_index),
+        ):
             if (
-                    not self.statuses[i]
-                    or not self.stacks[i]
-                    or not self.get_effective_stack(i)
+                    self.statuses[i]
+                    and self.stacks[i]
+                    and self.get_effective_stack(i)
             ):
-                self.actor_indices.remove(i)
+                self.actor_indices.append(i)
 
         self.completion_betting_or_raising_amount = 0
         self.completion_betting_or_raising_count = 0
@@ -5012,15 +6597,15 @@ class State:
         self.payoffs[player_index] -= delta
         self.bring_in_status = False
         self.completion_status = False
-        self.actor_indices = deque(self.player_indices)
 
-        self.actor_indices.rotate(-player_index)
-        self.actor_indices.popleft()
+        self.actor_indices.clear()
 
-        for i in self.player_indices:
-            if not self.statuses[i] or not self.stacks[i]:
-                if i in self.actor_indices:
-                    self.actor_indices.remove(i)
+        for i in chain(
+                range(player_index + 1, self.player_count),
+                range(player_index),
+        ):
+            if self.statuses[i] and self.stacks[i]:
+                self.actor_indices.append(i)
 
         assert self.actor_indices
 
@@ -5107,20 +6692,18 @@ class State:
         assert not self.showdown_indices
         assert self.street_index is not None
 
+        later_board_dealing_statuses = (
+            self.rule_table.later_board_dealing_statuses
+        )
+
         if (
                 not self.runout_count_selection_flag
                 and self.mode != Mode.TOURNAMENT
+                and later_board_dealing_statuses[self.street_index]
         ):
-            status = False
-
-            for i in range(self.street_index + 1, self.street_count):
-                if self.streets[i].board_dealing_count:
-                    status = True
-
-            if status:
-                for i in self.player_indices:
-                    if self.statuses[i]:
-                        self.runout_count_selector_statuses[i] = True
+            for i in self.player_indices:
+                if self.statuses[i]:
+                    self.runout_count_selector_statuses[i] = True
 
         self.showdown_indices = deque(self.player_indices)
 
@@ -5727,6 +7310,7 @@ class State:
             self.hole_cards[player_index].extend(hole_cards)
             self.hole_card_statuses[player_index].clear()
             self.hole_card_statuses[player_index].extend(hole_card_statuses)
+            self._hand_cache.clear()
         else:
             assert not cards and not hole_cards and not hole_card_statuses
 
@@ -5997,8 +7581,12 @@ class State:
     # chips pushing
 
     _pots: list[Pot] | None = field(default=None, init=False)
-    _sub_pots: list[tuple[int, int, int | None, int | None]] = field(
-        default_factory=list,
+    _sub_pots: deque[tuple[int, int, int | None, int | None]] = field(
+        default_factory=deque,
+        init=False,
+    )
+    _hand_rankings: dict[tuple[int, int], list[tuple[Hand, int]]] = field(
+        default_factory=dict,
         init=False,
     )
     total_pushed_amount: int = field(default=0, init=False)
@@ -6010,14 +7598,29 @@ class State:
     def _begin_chips_pushing(self) -> None:
         assert self._pots is None
         assert not self._sub_pots
+        assert not self._hand_rankings
 
         self.street_index = None
+        self._pot_cache = None
         self._pots = list(self.pots)
 
         if sum(self.statuses) == 1:
             for i, pot in enumerate(self._pots):
                 self._sub_pots.append((pot.unraked_amount, i, None, None))
         elif sum(self.statuses) > 1:
+            for j in self.board_indices:
+                for k in self.hand_type_indices:
+                    ranking = []
+
+                    for i, hand in enumerate(self.get_up_hands(j, k)):
+                        if hand is not None:
+                            ranking.append((hand, i))
+
+                    if ranking:
+                        ranking.sort(key=itemgetter(0), reverse=True)
+
+                        self._hand_rankings[j, k] = ranking
+
             for i, pot in enumerate(self._pots):
                 amount = pot.unraked_amount
                 quotient, remainder = self.divmod(amount, self.board_count)
@@ -6028,15 +7631,10 @@ class State:
                     if not j:
                         sub_amount += remainder
 
-                    hand_type_indices = []
-
-                    for k in self.hand_type_indices:
-                        for hand in self.get_up_hands(j, k):
-                            if hand is not None:
-                                hand_type_indices.append(k)
-
-                                break
-
+                    hand_type_indices = [
+                        k for k in self.hand_type_indices
+                        if (j, k) in self._hand_rankings
+                    ]
                     hand_type_count = len(hand_type_indices)
                     sub_quotient, sub_remainder = self.divmod(
                         sub_amount,
@@ -6072,6 +7670,8 @@ class State:
         assert self._pots is not None
         assert not self._sub_pots
 
+        self._hand_rankings.clear()
+
         self._begin_chips_pulling()
 
     def verify_chips_pushing(self) -> None:
@@ -6146,7 +7746,9 @@ class State:
         assert self._pots is not None and self._sub_pots
 
         bets = self.bets.copy()
-        amount, pot_index, board_index, hand_type_index = self._sub_pots.pop(0)
+        amount, pot_index, board_index, hand_type_index = (
+            self._sub_pots.popleft()
+        )
         pot = self._pots[pot_index]
         pot.unraked_amount -= amount
 
@@ -6162,13 +7764,24 @@ class State:
             assert 0 <= board_index < self.board_count
             assert 0 <= hand_type_index < self.hand_type_count
 
-            hands = tuple(self.get_up_hands(board_index, hand_type_index))
-            max_hand = max_or_none(
-                map(partial(getitem, hands), pot.player_indices),
-            )
-            player_indices = [
-                i for i in pot.player_indices if hands[i] == max_hand
-            ]
+            player_indices = []
+            max_hand = None
+
+            for hand, i in self._hand_rankings.get(
+                    (board_index, hand_type_index),
+                    (),
+            ):
+                if max_hand is not None and hand < max_hand:
+                    break
+                elif i in pot.player_indices:
+                    max_hand = hand
+
+                    player_indices.append(i)
+
+            if max_hand is None:  # no contender has a hand of the type
+                player_indices = list(pot.player_indices)
+
+            player_indices.sort()
 
             if player_indices:
                 quotient, remainder = self.divmod(amount, len(player_indices))
@@ -3,10 +3,12 @@ analysis related tools on PokerKit.
 """
 
 from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from unittest import TestCase, main
 
-from pokerkit.analysis import calculate_equities, parse_range
+from pokerkit.analysis import calculate_equities, parse_range, Statistics
 from pokerkit.hands import StandardHighHand
+from pokerkit.notation import HandHistory
 from pokerkit.utilities import Card, Deck
 
 
@@ -491,6 +493,40 @@ class HandHistoryTestCase(TestCase):
             self.assertAlmostEqual(equities[0], 0.5)
             self.assertAlmostEqual(equities[1], 0.5)
 
+    def test_statistics(self) -> None:
+        hhs = []
+
+        for i in range(4):
+            hhs.append(
+                HandHistory(
+                    variant='NT',
+                    antes=[0, 0],
+                    blinds_or_straddles=[1, 2],
+                    min_bet=2,
+                    starting_stacks=[200, 200],
+                    actions=[
+                        'd dh p1 ????',
+                        'd dh p2 ????',
+                        'p2 f' if i % 2 else 'p2 cbr 6',
+                        *([] if i % 2 else ['p1 f']),
+                    ],
+                    players=['Alice', 'Bob'] if i < 3 else None,
+                ),
+            )
+
+        fp = BytesIO()
+
+        HandHistory.dump_binary_all(hhs, fp)
+        fp.seek(0)
+
+        statistics = Statistics.from_hand_history_summary(
+            *HandHistory.load_binary_summaries(fp),
+        )
+
+        self.assertEqual(statistics, Statistics.from_hand_history(*hhs))
+        self.assertEqual(statistics['Alice'].payoffs, [-2, 1, -2])
+        self.assertEqual(statistics['Bob'].payoff_sum, 3)
+
 
 if __name__ == '__main__':
     main()  # pragma: no cover
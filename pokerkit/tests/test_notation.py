@@ -2,16 +2,36 @@
 notation related tools on PokerKit.
 """
 
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import time
+from decimal import Decimal
+from io import BytesIO, StringIO
+from operator import itemgetter
+from tempfile import TemporaryDirectory
 from tomllib import loads
+from typing import cast
 from unittest import TestCase, main
-from warnings import resetwarnings, simplefilter
+from warnings import catch_warnings, resetwarnings, simplefilter
 
 from pokerkit.games import (
     FixedLimitTexasHoldem,
     NoLimitTexasHoldem,
 )
-from pokerkit.notation import HandHistory
+from pokerkit.notation import (
+    AbsolutePokerParser,
+    FullTiltPokerParser,
+    HandHistory,
+    HandHistoryIndex,
+    IPokerNetworkParser,
+    OngameNetworkParser,
+    parse_action,
+    ParsingFailure,
+    PartyPokerParser,
+    PokerStarsParser,
+)
 from pokerkit.state import Automation
+from pokerkit.utilities import Card
 
 
 class HandHistoryTestCase(TestCase):
@@ -67,6 +87,484 @@ class HandHistoryTestCase(TestCase):
         self.assertEqual(loads(hh.dumps()).get('key'), 'value')
         self.assertEqual(loads(hh.dumps()).get('_key'), '_value')
 
+    def test_create_final_state(self) -> None:
+        s = """variant = 'NT'
+antes = [0, 0, 0]
+blinds_or_straddles = [1, 2, 0]
+min_bet = 2
+starting_stacks = [200, 100, 300]
+actions = [
+  'd dh p1 AcAd',
+  'd dh p2 KcKd',
+  'd dh p3 ????',
+  'p3 cc',
+  'p1 cbr 10',
+  'p2 cbr 100',
+  'p3 f',
+  'p1 cc',
+  'd db 2c3d4h',
+  'd db 9s',
+  'd db Ts',
+]
+finishing_stacks = [0, 0, 0]
+"""
+
+        for automations in (HandHistory.automations, ()):
+            hh = HandHistory.loads(s, automations=automations)
+            state = hh.create_final_state()
+            expected_state = tuple(hh)[-1]
+
+            self.assertFalse(state.status)
+            self.assertEqual(state.operations, expected_state.operations)
+            self.assertEqual(state.stacks, expected_state.stacks)
+            self.assertEqual(hh.final_stacks, [0, 0, 0])
+
+            hh.finishing_stacks = None
+
+            self.assertEqual(hh.final_stacks, expected_state.stacks)
+
+        hh.actions.append('p1 f')
+
+        self.assertRaises(ValueError, hh.create_final_state)
+        self.assertRaises(ValueError, tuple, hh)
+
+    def test_compiled_actions(self) -> None:
+        hh = HandHistory(
+            variant='NT',
+            antes=[0, 0],
+            blinds_or_straddles=[1, 2],
+            min_bet=2,
+            starting_stacks=[200, 200],
+            actions=[
+                'd dh p1 AcAd # first',
+                'd dh p2 ????',
+                'p2 cbr 6',
+                'p1 cc',
+            ],
+        )
+        compiled_actions = hh._compile_actions()
+
+        self.assertIs(hh._compile_actions(), compiled_actions)
+        self.assertEqual(compiled_actions[0].cards, tuple(Card.parse('AcAd')))
+        self.assertEqual(compiled_actions[0].commentary, 'first')
+        self.assertEqual(compiled_actions[2].amount, 6)
+        self.assertEqual(
+            HandHistory.loads(hh.dumps()),
+            hh,
+        )
+
+        hh.actions.extend(('d db 2c3d4h', 'p1 cbr 10'))
+
+        self.assertIsNot(hh._compile_actions(), compiled_actions)
+        self.assertEqual(
+            list(filter(None, map(itemgetter(1), hh.state_actions))),
+            hh.actions,
+        )
+
+        hh.actions.append('p1 xx')
+
+        errors = []
+
+        for _ in range(2):
+            with self.assertRaises(ValueError) as context:
+                hh.create_final_state()
+
+            errors.append(context.exception)
+
+        self.assertIsNot(errors[0], errors[1])
+        self.assertEqual(errors[0].args, errors[1].args)
+
+        hh.actions[-1] = 'p3 f'
+
+        self.assertRaises(ValueError, hh.create_final_state)
+
+        state = hh.create_state()
+
+        self.assertRaises(ValueError, parse_action, state, 'p2 f')
+
+        parse_action(state, 'd dh p1 AcAd')
+
+        self.assertEqual(state.hole_cards[0], list(Card.parse('AcAd')))
+
+    def test_load_all(self) -> None:
+        s = """_preamble = true
+
+[1]
+variant = 'NT'
+antes = [0, 0]
+blinds_or_straddles = [1, 2]
+min_bet = 2
+starting_stacks = [200, 200]
+actions = [
+  'd dh p1 ????',
+  'd dh p2 ????',
+  'p2 f',
+]
+_note = '''
+[2]
+variant = 'FT'
+'''
+
+[1._extra]
+key = 'value'
+
+[2]
+variant = 'NT'
+antes = [0, 0]
+blinds_or_straddles = [1, 2]
+min_bet = 2
+starting_stacks = [100, 300]
+actions = ['d dh p1 ????', 'd dh p2 ????', 'p2 cc', 'p1 f']
+"""
+        hhs = list(HandHistory.loads_all(s))
+
+        self.assertEqual(len(hhs), 2)
+        self.assertEqual(hhs[0].starting_stacks, [200, 200])
+        self.assertEqual(
+            hhs[0].user_defined_fields['_note'],
+            '[2]\nvariant = \'FT\'\n',
+        )
+        self.assertEqual(
+            hhs[0].user_defined_fields['_extra'],
+            {'key': 'value'},
+        )
+        self.assertEqual(hhs[1].starting_stacks, [100, 300])
+        self.assertEqual(hhs[1].actions[-1], 'p1 f')
+        self.assertEqual(
+            list(HandHistory.load_all(BytesIO(s.encode()))),
+            hhs,
+        )
+        self.assertEqual(
+            list(
+                HandHistory.load_all(
+                    BytesIO(HandHistory.dumps_all(hhs).encode()),
+                ),
+            ),
+            hhs,
+        )
+        s = """[1]
+variant = 'NT'
+antes = [0, 0]
+blinds_or_straddles = [1, 2]
+min_bet = 2
+starting_stacks = [200, 200]
+actions = ['d dh p1 ????', 'd dh p2 ????', 'p2 f']
+_matrix = [
+  [1, 2],
+  [3, 4],
+]
+_quote = "'''"  # \"\"\"
+_escaped_quote = "\\"\\"\\""
+_note = '''
+[2]
+'''
+"""
+
+        for hhs in (
+                list(HandHistory.loads_all(s)),
+                list(HandHistory.load_all(BytesIO(s.encode()))),
+        ):
+            self.assertEqual(len(hhs), 1)
+            self.assertEqual(
+                hhs[0].user_defined_fields,
+                {
+                    '_matrix': [[1, 2], [3, 4]],
+                    '_quote': "'''",
+                    '_escaped_quote': '"""',
+                    '_note': '[2]\n',
+                },
+            )
+
+    def test_load_many(self) -> None:
+        hhs = []
+
+        for i in range(10):
+            hhs.append(
+                HandHistory(
+                    variant='NT',
+                    antes=[0, 0],
+                    blinds_or_straddles=[1, 2],
+                    min_bet=2,
+                    starting_stacks=[200 + i, 200],
+                    actions=[
+                        'd dh p1 ????',
+                        'd dh p2 ????',
+                        'p2 f' if i % 2 else 'p2 cbr 6',
+                        *([] if i % 2 else ['p1 f']),
+                    ],
+                    hand=i,
+                    players=['Alice', 'Bob'],
+                ),
+            )
+
+        hhs[0].finishing_stacks = [0, 400]
+
+        with TemporaryDirectory() as directory:
+            paths = f'{directory}/1.phhs', f'{directory}/2.phhs'
+
+            for path, sub_hhs in zip(paths, (hhs[:7], hhs[7:])):
+                with open(path, 'wb') as file:
+                    HandHistory.dump_all(sub_hhs, file)
+
+            summaries = list(HandHistory.load_many(paths))
+
+            self.assertEqual(
+                [summary.hand for summary in summaries],
+                list(range(10)),
+            )
+            self.assertEqual(
+                [summary.payoffs for summary in summaries],
+                [[1, -1] if i % 2 else [-2, 2] for i in range(10)],
+            )
+            self.assertEqual(summaries[7].path, paths[1])
+            self.assertEqual(summaries[7].offset, 0)
+
+            with open(paths[0], 'rb') as file:
+                file.seek(summaries[3].offset)
+
+                self.assertEqual(file.readline(), b'[4]\n')
+
+            with ProcessPoolExecutor(2) as executor:
+                self.assertEqual(
+                    list(
+                        HandHistory.load_many(
+                            paths,
+                            executor=executor,
+                            shard_size=100,
+                        ),
+                    ),
+                    summaries,
+                )
+
+            summaries = list(
+                HandHistory.load_many(paths, replay_status=False),
+            )
+
+            self.assertEqual(summaries[0].finishing_stacks, [0, 400])
+            self.assertEqual(summaries[1].finishing_stacks, [202, 199])
+
+    def test_dump_all(self) -> None:
+        hh = HandHistory(
+            variant='NT',
+            antes=[0, 0],
+            blinds_or_straddles=[1, 2],
+            min_bet=2,
+            starting_stacks=[200, 200],
+            actions=['d dh p1 ????', 'd dh p2 ????', 'p2 f # it\'s'],
+            time=time(12, 34, 56),
+            players=['Alice', 'Bob'],
+            user_defined_fields={'_key 1': {'a b': True}, '_key_2': None},
+        )
+        fp = BytesIO()
+
+        def iterate_hand_histories() -> Iterator[HandHistory]:
+            for i in range(3):
+                self.assertEqual(fp.getvalue().count(b'variant'), i)
+
+                yield hh
+
+        HandHistory.dump_all(iterate_hand_histories(), fp)
+
+        self.assertEqual(
+            fp.getvalue().decode(),
+            HandHistory.dumps_all([hh, hh, hh]),
+        )
+        self.assertEqual(
+            HandHistory.dumps_all([hh, hh]),
+            f'[1]\n{hh.dumps()}\n\n[2]\n{hh.dumps()}',
+        )
+        self.assertEqual(
+            hh.dumps(),
+            (
+                'variant = \'NT\'\n'
+                'ante_trimming_status = false\n'
+                'antes = [0, 0]\n'
+                'blinds_or_straddles = [1, 2]\n'
+                'min_bet = 2\n'
+                'starting_stacks = [200, 200]\n'
+                'actions = [\'d dh p1 ????\', \'d dh p2 ????\','
+                ' \'\'\'p2 f # it\'s\'\'\']\n'
+                'time = 12:34:56\n'
+                'players = [\'Alice\', \'Bob\']\n'
+                '\'_key 1\' = {\'a b\' = true}'
+            ),
+        )
+
+        del hh.user_defined_fields['_key_2']
+
+        self.assertEqual(
+            list(HandHistory.load_all(BytesIO(fp.getvalue()))),
+            [hh] * 3,
+        )
+
+    def test_binary(self) -> None:
+        hhs = [
+            HandHistory(
+                variant='NT',
+                antes=[0, 0, 0],
+                blinds_or_straddles=[1, 2, 0],
+                min_bet=2,
+                starting_stacks=[200, 100, 300],
+                actions=[
+                    'd dh p1 AcAd # first',
+                    'd dh p2 KcKd',
+                    'd dh p3 ????',
+                    'p3 cc',
+                    'p1 cbr 10',
+                    'p2 cbr 100',
+                    'p3  f',
+                    'p1 cc',
+                    'p1 sm AcAd',
+                    'p2 sm -',
+                    'd db 2c3d4h',
+                    'd db 9s',
+                    'd db Ts',
+                    '# over',
+                ],
+                players=['Alice', 'Bob', 'Carol'],
+                hand=1,
+                time=time(12, 34, 56),
+                currency='USD',
+                user_defined_fields={'_a b': {'c': [1, (2, 3)]}},
+            ),
+            HandHistory(
+                variant='F2L3D',
+                antes=[0, 0],
+                blinds_or_straddles=[cast(int, Decimal('0.5')), 1],
+                small_bet=1,
+                big_bet=2,
+                starting_stacks=[cast(int, Decimal('20.5')), 30],
+                actions=[
+                    'd dh p1 ??????????',
+                    'd dh p2 ??????????',
+                    'p2 cbr 1,0',
+                    'p1 f',
+                ],
+                players=['Bob', 'Alice'],
+                hand='A1',
+                finishing_stacks=[20, 31],
+            ),
+            HandHistory(
+                variant='NT',
+                antes=[0, 0],
+                blinds_or_straddles=[1, 2],
+                min_bet=2,
+                starting_stacks=[200, 200],
+                actions=['d dh p1 ????', 'd dh p2 ????', 'p2 f'],
+            ),
+        ]
+        fp = BytesIO()
+
+        HandHistory.dump_binary_all(hhs, fp)
+        fp.seek(0)
+
+        self.assertEqual(list(HandHistory.load_binary_all(fp)), hhs)
+
+        fp.seek(0)
+
+        summaries = list(HandHistory.load_binary_summaries(fp))
+
+        self.assertEqual(
+            [summary.players for summary in summaries],
+            [hh.players for hh in hhs],
+        )
+        self.assertEqual(
+            [summary.hand for summary in summaries],
+            [hh.hand for hh in hhs],
+        )
+        self.assertEqual(
+            [summary.finishing_stacks for summary in summaries],
+            [hh.final_stacks for hh in hhs],
+        )
+        self.assertEqual(summaries[0].offset, 5)
+        self.assertLess(
+            len(fp.getvalue()),
+            len(HandHistory.dumps_all(hhs).encode()) / 2,
+        )
+
+        data = fp.getvalue()
+
+        for invalid_data in (b'PKHX' + data[4:], data[:-1], data[:6]):
+            self.assertRaises(
+                ValueError,
+                list,
+                HandHistory.load_binary_all(BytesIO(invalid_data)),
+            )
+
+        hhs[0].user_defined_fields['_b'] = {1, 2}
+
+        self.assertRaises(
+            ValueError,
+            HandHistory.dump_binary_all,
+            hhs,
+            BytesIO(),
+        )
+
+    def test_index(self) -> None:
+        hhs = []
+
+        for i in range(5):
+            hhs.append(
+                HandHistory(
+                    variant='FT' if i == 3 else 'NT',
+                    antes=[0, 0],
+                    blinds_or_straddles=[1, 2],
+                    small_bet=2,
+                    big_bet=4,
+                    min_bet=2,
+                    starting_stacks=[200, 200],
+                    actions=['d dh p1 ????', 'd dh p2 ????', 'p2 f'],
+                    hand=12345670 + i,
+                    table='Table',
+                    players=['Alice', 'Bob' if i % 2 else 'Carol'],
+                    time=time(12, 34, i),
+                ),
+            )
+
+        with TemporaryDirectory() as directory:
+            path = f'{directory}/hands.phhs'
+
+            with open(path, 'wb') as file:
+                HandHistory.dump_all(hhs, file)
+
+            with open(path, 'rb') as file:
+                index = HandHistoryIndex.build(file)
+
+            with open(f'{path}.index', 'wb') as file:
+                index.dump(file)
+
+            with open(f'{path}.index', 'rb') as file:
+                self.assertEqual(HandHistoryIndex.load(file), index)
+
+            self.assertEqual(
+                [entry.key for entry in index.entries],
+                ['1', '2', '3', '4', '5'],
+            )
+            self.assertEqual(index.entries[2].time, '12:34:02')
+            self.assertEqual(
+                [entry.hand for entry in index.filter(player='Bob')],
+                [12345671, 12345673],
+            )
+            self.assertEqual(
+                [
+                    entry.hand
+                    for entry in index.filter(player='Bob', variant='NT')
+                ],
+                [12345671],
+            )
+            self.assertEqual(
+                list(index.filter(table='Other')),
+                [],
+            )
+
+            with open(path, 'rb') as file:
+                hhs = list(HandHistory.load_all(file))
+
+                for i in (4, 0, 2, 3):
+                    entry, = index.filter(hand=12345670 + i)
+
+                    self.assertEqual(index.read(file, entry), hhs[i])
+
     def test_to_acpc_protocol_full(self) -> None:
         game: FixedLimitTexasHoldem | NoLimitTexasHoldem = (
             FixedLimitTexasHoldem(
@@ -852,5 +1350,653 @@ class HandHistoryTestCase(TestCase):
         )
 
 
+class ParserTestCase(TestCase):
+    POKERSTARS_LOG = '\n'.join(
+        (
+            (
+                "PokerStars Hand #1001: Tournament #1, Hold'em No Limit"
+                ' - Level I (1/2) - 2020/01/02 3:04:05 ET'
+            ),
+            "Table 'Alpha 1' 6-max Seat #1 is the button",
+            'Seat 1: Alice (200 in chips)',
+            'Seat 2: Mr. Bob (300 in chips)',
+            'Seat 3: Carol (400 in chips)',
+            'Mr. Bob: posts small blind 1',
+            'Carol: posts big blind 2',
+            '*** HOLE CARDS ***',
+            'Dealt to Alice [Ah Kh]',
+            'Alice: raises 4 to 6',
+            'Mr. Bob: folds',
+            'Carol: calls 4',
+            '*** FLOP *** [2c 3d 4h]',
+            'Carol: checks',
+            'Alice: bets 10',
+            'Carol: raises 20 to 30',
+            'Alice: calls 20',
+            '*** TURN *** [2c 3d 4h] [5s]',
+            'Carol: checks',
+            'Alice: checks',
+            '*** RIVER *** [2c 3d 4h 5s] [Kd]',
+            'Carol: checks',
+            'Alice: checks',
+            '*** SHOW DOWN ***',
+            'Alice: shows [Ah Kh] (two pair, Kings and Fives)',
+            'Carol: shows [Qc Qd] (a pair of Queens)',
+            'Alice collected 73 from pot',
+            '*** SUMMARY ***',
+            'Seat 1: Alice (button) showed [Ah Kh] and won (73)',
+            'Seat 2: Mr. Bob (small blind) folded before Flop',
+            'Seat 3: Carol (big blind) showed [Qc Qd] and lost',
+            '',
+            '',
+            (
+                "PokerStars Hand #1002: Tournament #1, Hold'em No Limit"
+                ' - Level I (1/2) - 2020/01/02 3:05:05 ET'
+            ),
+            "Table 'Alpha 1' 6-max Seat #2 is the button",
+            'Seat 1: Alice (236 in chips)',
+            'Seat 2: Mr. Bob (299 in chips)',
+            'Mr. Bob: posts small blind 1',
+            'Alice: posts big blind 2',
+            '*** HOLE CARDS ***',
+            'Dealt to Alice [7c 2d]',
+            'Mr. Bob: raises 4 to 6',
+            'Alice: folds',
+            'Mr. Bob collected 4 from pot',
+            '*** SUMMARY ***',
+            'Seat 2: Mr. Bob (button) (small blind) collected (4)',
+            '',
+            '',
+            '',
+        ),
+    )
+
+    ABSOLUTE_POKER_LOG = '\n'.join(
+        (
+            'Stage #1234: Holdem  No Limit $2 - 2009-01-02 03:04:05 (ET)',
+            'Table: ALPHA (Real Money) Seat #1 is the dealer',
+            'Seat 1 - Alice ($200 in chips)',
+            'Seat 2 - Bob ($300 in chips)',
+            'Seat 3 - Carol ($400 in chips)',
+            'Alice - Ante $1',
+            'Bob - Ante $1',
+            'Carol - Ante $1',
+            'Bob - Posts small blind $1',
+            'Carol - Posts big blind $2',
+            '*** POCKET CARDS ***',
+            'Alice - Raises $6',
+            'Bob - Folds',
+            'Carol - Calls $4',
+            '*** FLOP *** [2c 3d 4h]',
+            'Carol - Checks',
+            'Alice - Bets $10',
+            'Carol - Calls $10',
+            '*** TURN *** [2c 3d 4h] [5s]',
+            'Carol - Checks',
+            'Alice - Checks',
+            '*** RIVER *** [2c 3d 4h 5s] [Kd]',
+            'Carol - Checks',
+            'Alice - Checks',
+            '*** SHOW DOWN ***',
+            'Alice - Shows [Ah Kh]',
+            'Carol - Shows [Qc Qd]',
+            '*** SUMMARY ***',
+            'Seat 1: Alice collected Total ($36)',
+            '',
+            '',
+            '',
+        ),
+    )
+    FULL_TILT_POKER_LOG = '\n'.join(
+        (
+            (
+                'Full Tilt Poker Game #1234: Table Beta (6 max) - $1/$2 - No'
+                " Limit Hold'em - 3:04:05 ET - 2009/01/02"
+            ),
+            'Seat 1: Alice ($200)',
+            'Seat 2: Bob ($300)',
+            'Seat 3: Carol ($400)',
+            'Bob posts the small blind of $1',
+            'Carol posts the big blind of $2',
+            'The button is in seat #1',
+            '*** HOLE CARDS ***',
+            'Alice raises to $6',
+            'Bob folds',
+            'Carol calls $4',
+            '*** FLOP *** [2c 3d 4h]',
+            'Carol checks',
+            'Alice bets $10',
+            'Carol raises to $30',
+            'Alice calls $20',
+            '*** TURN *** [2c 3d 4h] [5s]',
+            'Carol checks',
+            'Alice checks',
+            '*** RIVER *** [2c 3d 4h 5s] [Kd]',
+            'Carol checks',
+            'Alice checks',
+            '*** SHOW DOWN ***',
+            'Alice shows [Ah Kh]',
+            'Carol shows [Qc Qd]',
+            '*** SUMMARY ***',
+            'Seat 1: Alice collected ($73)',
+            '',
+            '',
+            '',
+        ),
+    )
+    IPOKER_NETWORK_LOG = '\n'.join(
+        (
+            '<session sessioncode="1">',
+            '<general>',
+            '<tablename>Gamma</tablename>',
+            '<currency>USD</currency>',
+            '<startdate>2009-01-02 03:04:05</startdate>',
+            '</general>',
+            '<game gamecode="1234">',
+            '<general>',
+            '<startdate>2009-01-02 03:04:05</startdate>',
+            '<players>',
+            (
+                '<player seat="1" name="Alice" chips="$200" dealer="1"'
+                ' win="$33" bet="$16" />'
+            ),
+            (
+                '<player seat="2" name="Bob" chips="$300" dealer="0" win="$0"'
+                ' bet="$1" />'
+            ),
+            (
+                '<player seat="3" name="Carol" chips="$400" dealer="0"'
+                ' win="$0" bet="$16" />'
+            ),
+            '</players>',
+            '</general>',
+            '<round no="0">',
+            '<action no="1" player="Bob" type="1" sum="$1"/>',
+            '<action no="2" player="Carol" type="2" sum="$2"/>',
+            '</round>',
+            '<round no="1">',
+            '<cards type="Pocket" player="Alice">hA hK</cards>',
+            '<action no="3" player="Alice" type="23" sum="$6"/>',
+            '<action no="4" player="Bob" type="0" sum="$0"/>',
+            '<action no="5" player="Carol" type="3" sum="$4"/>',
+            '</round>',
+            '<round no="2">',
+            '<cards type="Flop" player="">c2 d3 h4</cards>',
+            '<action no="6" player="Carol" type="4" sum="$0"/>',
+            '<action no="7" player="Alice" type="5" sum="$10"/>',
+            '<action no="8" player="Carol" type="3" sum="$10"/>',
+            '</round>',
+            '<round no="3">',
+            '<cards type="Turn" player="">s5</cards>',
+            '<action no="9" player="Carol" type="4" sum="$0"/>',
+            '<action no="10" player="Alice" type="4" sum="$0"/>',
+            '</round>',
+            '<round no="4">',
+            '<cards type="River" player="">dK</cards>',
+            '<action no="11" player="Carol" type="4" sum="$0"/>',
+            '<action no="12" player="Alice" type="4" sum="$0"/>',
+            '</round>',
+            '</game>',
+            '</session>',
+            '',
+        ),
+    )
+    ONGAME_NETWORK_LOG = '\n'.join(
+        (
+            '***** History for hand R5-1234 *****',
+            'Start hand: Fri Jan 2 03:04:05 GMT 2009',
+            'Table: Delta [1234] (NO_LIMIT TEXAS_HOLDEM $1/$2, Real money)',
+            'User: Alice',
+            'Button: seat 1',
+            'Players in round: 3',
+            'Seat 1: Alice ($200) ',
+            'Seat 2: Bob ($300) ',
+            'Seat 3: Carol ($400) ',
+            'Bob posts small blind ($1)',
+            'Carol posts big blind ($2)',
+            '---',
+            'Dealing pocket cards',
+            'Dealing to Alice: [Ah, Kh]',
+            'Alice raises $6 to $6',
+            'Bob folds',
+            'Carol calls $4',
+            '--- Dealing flop [2c, 3d, 4h]',
+            'Carol checks',
+            'Alice bets $10',
+            'Carol calls $10',
+            '--- Dealing turn [5s]',
+            'Carol checks',
+            'Alice checks',
+            '--- Dealing river [Kd]',
+            'Carol checks',
+            'Alice checks',
+            '---',
+            'Summary:',
+            'Main pot: $33 won by Alice ($33)',
+            'Rake taken: $0',
+            'Seat 1: Alice ($217), net: +$17, [Ah, Kh] (TWO_PAIR KING, THREE)',
+            'Seat 2: Bob ($299), net: -$1',
+            'Seat 3: Carol ($384), net: -$16, [Qc, Qd] (ONE_PAIR QUEEN)',
+            '***** End of hand R5-1234 *****',
+            '',
+            '',
+            '',
+        ),
+    )
+    PARTY_POKER_LOG = '\n'.join(
+        (
+            'Game #1234 starts.',
+            '',
+            '#Game No : 1234',
+            '***** Hand History for Game 1234 *****',
+            (
+                "$1/$2 USD NL Texas Hold'em - Friday, January 02, 03:04:05 EST"
+                ' 2009'
+            ),
+            'Table Epsilon (Real Money)',
+            'Seat 1 is the button',
+            'Total number of players : 3/6',
+            'Seat 1: Alice ( $200 USD )',
+            'Seat 2: Bob ( $300 USD )',
+            'Seat 3: Carol ( $400 USD )',
+            'Bob posts small blind [$1 USD].',
+            'Carol posts big blind [$2 USD].',
+            '** Dealing down cards **',
+            'Alice raises [$6 USD]',
+            'Bob folds',
+            'Carol calls [$4 USD]',
+            '** Dealing Flop ** [ 2c, 3d, 4h ]',
+            'Carol checks',
+            'Alice bets [$10 USD]',
+            'Carol calls [$10 USD]',
+            '** Dealing Turn ** [ 5s ]',
+            'Carol checks',
+            'Alice checks',
+            '** Dealing River ** [ Kd ]',
+            'Carol checks',
+            'Alice checks',
+            'Alice shows [ Ah, Kh ] two pairs.',
+            'Carol shows [ Qc, Qd ] a pair of Queens.',
+            'Alice wins $33 USD from the main pot with two pairs.',
+            'Game #1235 starts.',
+            '',
+            '',
+            '',
+        ),
+    )
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        simplefilter('ignore')
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        resetwarnings()
+
+    def verify_hand_history(
+            self,
+            hh: HandHistory,
+            antes: list[int],
+            actions: list[str],
+    ) -> None:
+        self.assertEqual(hh.players, ['Bob', 'Carol', 'Alice'])
+        self.assertEqual(hh.seats, [2, 3, 1])
+        self.assertEqual(hh.antes, antes)
+        self.assertEqual(hh.blinds_or_straddles, [1, 2, 0])
+        self.assertEqual(hh.starting_stacks, [300, 400, 200])
+        self.assertEqual(hh.actions, actions)
+
+    def test_absolute_poker(self) -> None:
+        hhs = list(
+            AbsolutePokerParser()(self.ABSOLUTE_POKER_LOG, error_status=True),
+        )
+
+        self.assertEqual(len(hhs), 1)
+        self.assertEqual(hhs[0].hand, 1234)
+        self.assertEqual(hhs[0].table, 'ALPHA')
+        self.verify_hand_history(
+            hhs[0],
+            [1, 1, 1],
+            [
+                'd dh p1 ????',
+                'd dh p2 ????',
+                'd dh p3 ????',
+                'p3 cbr 6',
+                'p1 f',
+                'p2 cc',
+                'd db 2c3d4h',
+                'p2 cc',
+                'p3 cbr 10',
+                'p2 cc',
+                'd db 5s',
+                'p2 cc',
+                'p3 cc',
+                'd db Kd',
+                'p2 cc',
+                'p3 cc',
+                'p3 sm AhKh',
+                'p2 sm QcQd',
+            ],
+        )
+        self.assertEqual(hhs[0].final_stacks, [298, 383, 219])
+
+    def test_full_tilt_poker(self) -> None:
+        hhs = list(
+            FullTiltPokerParser()(self.FULL_TILT_POKER_LOG, error_status=True),
+        )
+
+        self.assertEqual(len(hhs), 1)
+        self.assertEqual(hhs[0].hand, 1234)
+        self.assertEqual(hhs[0].table, 'Beta')
+        self.verify_hand_history(
+            hhs[0],
+            [0, 0, 0],
+            [
+                'd dh p1 ????',
+                'd dh p2 ????',
+                'd dh p3 ????',
+                'p3 cbr 6',
+                'p1 f',
+                'p2 cc',
+                'd db 2c3d4h',
+                'p2 cc',
+                'p3 cbr 10',
+                'p2 cbr 30',
+                'p3 cc',
+                'd db 5s',
+                'p2 cc',
+                'p3 cc',
+                'd db Kd',
+                'p2 cc',
+                'p3 cc',
+                'p3 sm AhKh',
+                'p2 sm QcQd',
+            ],
+        )
+        self.assertEqual(hhs[0].final_stacks, [299, 364, 237])
+
+    def test_ipoker_network(self) -> None:
+        hhs = list(
+            IPokerNetworkParser()(self.IPOKER_NETWORK_LOG, error_status=True),
+        )
+
+        self.assertEqual(len(hhs), 1)
+        self.assertEqual(hhs[0].hand, 1234)
+        self.assertEqual(hhs[0].table, 'Gamma')
+        self.verify_hand_history(
+            hhs[0],
+            [0, 0, 0],
+            [
+                'd dh p1 ????',
+                'd dh p2 ????',
+                'd dh p3 AhKh',
+                'p3 cbr 6',
+                'p1 f',
+                'p2 cc',
+                'd db 2c3d4h',
+                'p2 cc',
+                'p3 cbr 10',
+                'p2 cc',
+                'd db 5s',
+                'p2 cc',
+                'p3 cc',
+                'd db Kd',
+                'p2 cc',
+                'p3 cc',
+                'p2 sm ????',
+                'p3 sm ????',
+            ],
+        )
+
+    def test_ongame_network(self) -> None:
+        hhs = list(
+            OngameNetworkParser()(self.ONGAME_NETWORK_LOG, error_status=True),
+        )
+
+        self.assertEqual(len(hhs), 1)
+        self.assertEqual(hhs[0].hand, 'R5-1234')
+        self.assertEqual(hhs[0].table, 'Delta')
+        self.verify_hand_history(
+            hhs[0],
+            [0, 0, 0],
+            [
+                'd dh p1 ????',
+                'd dh p2 ????',
+                'd dh p3 ????',
+                'p3 cbr 6',
+                'p1 f',
+                'p2 cc',
+                'd db 2c3d4h',
+                'p2 cc',
+                'p3 cbr 10',
+                'p2 cc',
+                'd db 5s',
+                'p2 cc',
+                'p3 cc',
+                'd db Kd',
+                'p2 cc',
+                'p3 cc',
+                'p3 sm AhKh',
+                'p2 sm QcQd',
+            ],
+        )
+        self.assertEqual(hhs[0].final_stacks, [299, 384, 217])
+
+    def test_party_poker(self) -> None:
+        hhs = list(PartyPokerParser()(self.PARTY_POKER_LOG, error_status=True))
+
+        self.assertEqual(len(hhs), 1)
+        self.assertEqual(hhs[0].hand, 1234)
+        self.assertEqual(hhs[0].table, 'Epsilon')
+        self.verify_hand_history(
+            hhs[0],
+            [0, 0, 0],
+            [
+                'd dh p1 ????',
+                'd dh p2 ????',
+                'd dh p3 ????',
+                'p3 cbr 6',
+                'p1 f',
+                'p2 cc',
+                'd db 2c3d4h',
+                'p2 cc',
+                'p3 cbr 10',
+                'p2 cc',
+                'd db 5s',
+                'p2 cc',
+                'p3 cc',
+                'd db Kd',
+                'p2 cc',
+                'p3 cc',
+                'p3 sm AhKh',
+                'p2 sm QcQd',
+            ],
+        )
+        self.assertEqual(hhs[0].final_stacks, [299, 384, 217])
+
+    def test_pokerstars(self) -> None:
+        it = PokerStarsParser()(self.POKERSTARS_LOG, error_status=True)
+        hhs = []
+
+        while True:
+            try:
+                hhs.append(next(it))
+            except StopIteration as e:
+                count = e.value
+
+                break
+
+        self.assertEqual(count, 2)
+        self.assertEqual(len(hhs), 2)
+        self.assertEqual(hhs[0].hand, 1001)
+        self.assertEqual(hhs[0].table, 'Alpha 1')
+        self.assertEqual(hhs[0].players, ['Mr. Bob', 'Carol', 'Alice'])
+        self.assertEqual(hhs[0].seats, [2, 3, 1])
+        self.assertEqual(hhs[0].blinds_or_straddles, [1, 2, 0])
+        self.assertEqual(hhs[0].starting_stacks, [300, 400, 200])
+        self.assertEqual(
+            hhs[0].actions,
+            [
+                'd dh p1 ????',
+                'd dh p2 ????',
+                'd dh p3 AhKh',
+                'p3 cbr 6',
+                'p1 f',
+                'p2 cc',
+                'd db 2c3d4h',
+                'p2 cc',
+                'p3 cbr 10',
+                'p2 cbr 30',
+                'p3 cc',
+                'd db 5s',
+                'p2 cc',
+                'p3 cc',
+                'd db Kd',
+                'p2 cc',
+                'p3 cc',
+                'p3 sm AhKh',
+                'p2 sm QcQd',
+            ],
+        )
+        self.assertEqual(hhs[1].hand, 1002)
+        self.assertEqual(hhs[1].players, ['Alice', 'Mr. Bob'])
+        self.assertEqual(hhs[1].seats, [1, 2])
+        self.assertEqual(hhs[1].blinds_or_straddles, [1, 2])
+        self.assertEqual(hhs[1].starting_stacks, [236, 299])
+        self.assertEqual(
+            hhs[1].actions,
+            ['d dh p1 7c2d', 'd dh p2 ????', 'p2 cbr 6', 'p1 f'],
+        )
+        self.assertEqual(hhs[1].final_stacks, [234, 301])
+
+    def test_pokerstars_without_replay(self) -> None:
+        hhs = list(PokerStarsParser()(self.POKERSTARS_LOG))
+        raw_hhs = list(
+            PokerStarsParser(replay_status=False)(self.POKERSTARS_LOG),
+        )
+
+        self.assertEqual(len(raw_hhs), 2)
+
+        for hh, raw_hh in zip(hhs, raw_hhs):
+            self.assertEqual(raw_hh.hand, hh.hand)
+            self.assertEqual(raw_hh.time, hh.time)
+            self.assertEqual(raw_hh.players, hh.players)
+            self.assertEqual(raw_hh.seats, hh.seats)
+            self.assertEqual(raw_hh.antes, hh.antes)
+            self.assertEqual(
+                raw_hh.blinds_or_straddles,
+                hh.blinds_or_straddles,
+            )
+            self.assertEqual(raw_hh.starting_stacks, hh.starting_stacks)
+            self.assertEqual(raw_hh.final_stacks, hh.final_stacks)
+
+        self.assertEqual(
+            raw_hhs[1].actions,
+            ['d dh p1 7c2d', 'p2 cbr 6', 'p1 f'],
+        )
+
+        raw_hh = next(
+            PokerStarsParser(replay_status=False)(
+                self.POKERSTARS_LOG.replace('Mr. Bob: folds', 'Carol: folds'),
+            ),
+        )
+
+        self.assertRaises(ValueError, raw_hh.create_final_state)
+
+    def test_streaming(self) -> None:
+        hhs = list(PokerStarsParser()(self.POKERSTARS_LOG))
+        raw_log = self.POKERSTARS_LOG.encode()
+
+        for s in (
+                raw_log,
+                BytesIO(raw_log.replace(b'\n', b'\r\n')),
+                StringIO(self.POKERSTARS_LOG),
+                (raw_log[i:i + 5] for i in range(0, len(raw_log), 5)),
+        ):
+            self.assertEqual(list(PokerStarsParser()(s)), hhs)
+
+    def test_non_hand_text(self) -> None:
+        hhs = list(PokerStarsParser()(self.POKERSTARS_LOG))
+        text = ('-' * 99 + '\n') * 50000
+        raw_log = (
+            text + 'PokerStars Hand #1003: ???\n\n\n' + self.POKERSTARS_LOG
+        ).encode()
+
+        for s in (
+                BytesIO(raw_log),
+                (raw_log[i:i + 1000] for i in range(0, len(raw_log), 1000)),
+        ):
+            failures: list[ParsingFailure] = []
+
+            self.assertEqual(
+                list(PokerStarsParser()(s, error_sink=failures.append)),
+                hhs,
+            )
+            self.assertEqual(len(failures), 1)
+            self.assertEqual(failures[0].offset, len(text))
+
+    def test_error_sink(self) -> None:
+        invalid_hand = 'PokerStars Hand #1003: ???\n\n\n'
+        index = self.POKERSTARS_LOG.index('PokerStars Hand #1002')
+        s = (
+            self.POKERSTARS_LOG[:index]
+            + invalid_hand
+            + self.POKERSTARS_LOG[index:]
+        )
+        failures: list[ParsingFailure] = []
+
+        with catch_warnings(record=True) as records:
+            simplefilter('always')
+
+            it = PokerStarsParser()(s, error_sink=failures.append)
+            hhs = []
+
+            while True:
+                try:
+                    hhs.append(next(it))
+                except StopIteration as e:
+                    count = e.value
+
+                    break
+
+        self.assertEqual(count, 3)
+        self.assertEqual([hh.hand for hh in hhs], [1001, 1002])
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(failures[0].index, 1)
+        self.assertEqual(failures[0].offset, index)
+        self.assertEqual(failures[0].text, invalid_hand[:-2])
+        self.assertIsInstance(failures[0].error, ValueError)
+        self.assertFalse(
+            [
+                record for record in records
+                if 'Unable to parse' in str(record.message)
+            ],
+        )
+
+        failures.clear()
+
+        self.assertRaises(
+            ValueError,
+            list,
+            PokerStarsParser()(
+                s,
+                error_status=True,
+                error_sink=failures.append,
+            ),
+        )
+        self.assertEqual(len(failures), 1)
+
+        with catch_warnings(record=True) as records:
+            simplefilter('always')
+            list(PokerStarsParser()(s))
+
+        self.assertTrue(
+            [
+                record for record in records
+                if 'Unable to parse' in str(record.message)
+            ],
+        )
+
+
 if __name__ == '__main__':
     main()  # pragma: no cover
@@ -0,0 +1,306 @@
+""":mod:`pokerkit.tests.test_simulation` implements unit tests for
+:mod:`pokerkit.simulation`.
+"""
+
+from unittest import TestCase, main
+
+from pokerkit.games import (
+    FixedLimitDeuceToSevenLowballTripleDraw,
+    KuhnPoker,
+    NoLimitTexasHoldem,
+    Poker,
+)
+from pokerkit.simulation import (
+    Action,
+    Batch,
+    encode_observations,
+    simulate,
+    VectorEnvironment,
+)
+from pokerkit.state import Automation, State
+
+
+class SimulationTestCase(TestCase):
+    def test_simulate(self) -> None:
+        game: Poker = KuhnPoker(tuple(Automation))
+        states = list[State]()
+
+        def call(state: State) -> None:
+            states.append(state)
+            state.check_or_call()
+
+        def raise_(state: State) -> None:
+            if state.can_complete_bet_or_raise_to():
+                state.complete_bet_or_raise_to()
+            else:
+                state.check_or_call()
+
+        payoffs = simulate(game, 2, 2, (call, call), hand_count=100)
+
+        self.assertEqual(len(payoffs), 2)
+        self.assertEqual(sum(payoffs), 0)
+        self.assertEqual(len(states), 200)
+        self.assertIs(states[0], states[-1])
+
+        payoffs = simulate(
+            game,
+            2,
+            2,
+            (raise_, raise_),
+            hand_count=100,
+            table_count=7,
+        )
+
+        self.assertEqual(sum(payoffs), 0)
+        self.assertEqual(
+            simulate(game, 2, 2, (call, call), hand_count=0),
+            [0, 0],
+        )
+
+        game = KuhnPoker((Automation.HOLE_CARDS_SHOWING_OR_MUCKING,))
+        payoffs = simulate(game, 2, 2, (raise_, call), hand_count=10)
+
+        self.assertEqual(sum(payoffs), 0)
+
+        game = FixedLimitDeuceToSevenLowballTripleDraw(
+            tuple(Automation),
+            True,
+            0,
+            (1, 2),
+            2,
+            4,
+        )
+
+        def stand_pat_or_call(state: State) -> None:
+            if state.can_stand_pat_or_discard():
+                state.stand_pat_or_discard()
+            else:
+                state.check_or_call()
+
+        payoffs = simulate(
+            game,
+            200,
+            3,
+            (stand_pat_or_call,) * 3,
+            hand_count=20,
+            table_count=3,
+        )
+
+        self.assertEqual(sum(payoffs), 0)
+
+    def test_encode_observations(self) -> None:
+        game = KuhnPoker(tuple(Automation))
+        states = [game(2, 2) for _ in range(4)]
+        observation_size = states[0].observation_size
+        buffer = encode_observations(states, (0, 1, 0, 1), [0.0] * 1000)
+
+        for i, state in enumerate(states):
+            self.assertEqual(
+                buffer[i * observation_size:(i + 1) * observation_size],
+                list(state.encode_observation(i % 2)),
+            )
+
+        self.assertEqual(len(encode_observations((), ())), 0)
+        self.assertRaises(
+            ValueError,
+            encode_observations,
+            (game(2, 2), game(2, 3)),
+            (0, 0),
+        )
+        self.assertRaises(
+            ValueError,
+            encode_observations,
+            states,
+            (0, 1, 0, 1),
+            [0.0] * 10,
+        )
+
+    def test_simulate_errors(self) -> None:
+        game = KuhnPoker(tuple(Automation))
+
+        def call(state: State) -> None:
+            state.check_or_call()
+
+        def idle(state: State) -> None:
+            pass
+
+        self.assertRaises(
+            ValueError,
+            simulate,
+            game,
+            2,
+            2,
+            (call,),
+            hand_count=1,
+        )
+        self.assertRaises(
+            ValueError,
+            simulate,
+            game,
+            2,
+            2,
+            (call, call),
+            hand_count=1,
+            table_count=0,
+        )
+        self.assertRaises(
+            ValueError,
+            simulate,
+            game,
+            2,
+            2,
+            (call, idle),
+            hand_count=1,
+        )
+
+
+class VectorEnvironmentTestCase(TestCase):
+    def get_actions(self, batch: Batch, table_count: int) -> list[Action]:
+        actions = []
+
+        for i in range(table_count):
+            mask = batch.masks[i * len(Action):(i + 1) * len(Action)]
+
+            if mask[Action.COMPLETION_BETTING_OR_RAISING]:
+                actions.append(Action.COMPLETION_BETTING_OR_RAISING)
+            elif mask[Action.CHECKING_OR_CALLING]:
+                actions.append(Action.CHECKING_OR_CALLING)
+            else:
+                self.assertTrue(mask[Action.HOLE_CARDS_SHOWING])
+
+                actions.append(Action.HOLE_CARDS_SHOWING)
+
+        return actions
+
+    def play(self, environment: VectorEnvironment) -> Batch:
+        table_count = environment.table_count
+        player_count = environment.player_count
+        observation_size = environment.game(
+            environment.raw_starting_stacks,
+            player_count,
+        ).observation_size
+        batch = environment.reset()
+        terminal_count = 0
+
+        for _ in range(50):
+            self.assertEqual(len(batch.masks), table_count * len(Action))
+            self.assertEqual(len(batch.player_indices), table_count)
+
+            batch = environment.step(self.get_actions(batch, table_count))
+
+            self.assertEqual(
+                len(batch.observations),
+                table_count * observation_size,
+            )
+            self.assertEqual(len(batch.rewards), table_count * player_count)
+
+            for i, status in enumerate(batch.terminal_statuses):
+                rewards = batch.rewards[
+                    i * player_count:(i + 1) * player_count
+                ]
+
+                self.assertEqual(sum(rewards), 0)
+
+                if status:
+                    terminal_count += 1
+                else:
+                    self.assertFalse(any(rewards))
+
+        self.assertGreater(terminal_count, 0)
+
+        return batch
+
+    def test_step(self) -> None:
+        game = NoLimitTexasHoldem(
+            (
+                Automation.ANTE_POSTING,
+                Automation.BET_COLLECTION,
+                Automation.BLIND_OR_STRADDLE_POSTING,
+                Automation.CARD_BURNING,
+                Automation.HOLE_DEALING,
+                Automation.BOARD_DEALING,
+                Automation.HAND_KILLING,
+                Automation.CHIPS_PUSHING,
+                Automation.CHIPS_PULLING,
+            ),
+            False,
+            0,
+            (1, 2),
+            2,
+        )
+
+        with VectorEnvironment(game, 20, 3, 4) as environment:
+            self.play(environment)
+            self.assertRaises(
+                ValueError,
+                environment.step,
+                (Action.FOLDING,) * 3,
+            )
+            self.assertRaises(
+                ValueError,
+                environment.step,
+                (Action.FOLDING,) * 4,
+                (None,) * 3,
+            )
+            self.assertRaises(
+                ValueError,
+                environment.step,
+                (Action.BRING_IN_POSTING,) * 4,
+            )
+
+        self.assertRaises(ValueError, environment.reset)
+        self.assertRaises(ValueError, VectorEnvironment, game, 20, 3, 0)
+        self.assertRaises(ValueError, VectorEnvironment, game, 20, 3, 1, -1)
+
+        with VectorEnvironment(game, 20, 3, 5, 2) as environment:
+            self.play(environment)
+            self.assertRaises(
+                ValueError,
+                environment.step,
+                (Action.BRING_IN_POSTING,) * 5,
+            )
+
+        self.assertRaises(ValueError, environment.reset)
+
+    def test_invalid_step(self) -> None:
+        game = NoLimitTexasHoldem(tuple(Automation), False, 0, (1, 2), 2)
+
+        for process_count in (0, 2):
+            with VectorEnvironment(game, 20, 2, 2, process_count) as env:
+                batch = env.reset()
+
+                self.assertRaises(
+                    ValueError,
+                    env.step,
+                    (Action.FOLDING, Action.BRING_IN_POSTING),
+                )
+
+                batch = env.step(self.get_actions(batch, 2))
+
+                self.assertEqual(list(batch.terminal_statuses), [0, 0])
+
+                batch = env.step((Action.FOLDING, Action.FOLDING))
+
+                self.assertEqual(list(batch.terminal_statuses), [1, 1])
+
+    def test_worker_error(self) -> None:
+        game = NoLimitTexasHoldem(tuple(Automation), False, 0, (1, 2), 2)
+
+        for process_count in (0, 2):
+            with VectorEnvironment(game, 20, 2, 2, process_count) as env:
+                batch = env.reset()
+
+                self.assertRaises(
+                    TypeError,
+                    env.step,
+                    (Action.COMPLETION_BETTING_OR_RAISING,) * 2,
+                    ('4', '4'),
+                )
+
+                batch = env.step(self.get_actions(batch, 2))
+
+                self.assertEqual(list(batch.terminal_statuses), [0, 0])
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,87 @@
+""":mod:`pokerkit.tests.test_solvers` implements unit tests for
+:mod:`pokerkit.solvers`.
+"""
+
+from unittest import main, TestCase
+
+from pokerkit.games import KuhnPoker, RhodeIslandHoldem
+from pokerkit.solvers import CFRSolver
+from pokerkit.state import Automation
+from pokerkit.utilities import Card
+
+AUTOMATIONS = (
+    Automation.ANTE_POSTING,
+    Automation.BET_COLLECTION,
+    Automation.BLIND_OR_STRADDLE_POSTING,
+    Automation.CARD_BURNING,
+    Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
+    Automation.HAND_KILLING,
+    Automation.CHIPS_PUSHING,
+    Automation.CHIPS_PULLING,
+)
+
+
+class CFRSolverTestCase(TestCase):
+    def test_kuhn_poker(self) -> None:
+        game = KuhnPoker(AUTOMATIONS)
+        keys = []
+
+        for hole_cards in ('QsJs', 'QsKs'):
+            state = game(2, 2)
+
+            for card in Card.parse(hole_cards):
+                state.deal_hole((card,))
+
+            state.complete_bet_or_raise_to()
+            keys.append(state.get_info_set_key(1))
+
+        for plus_status in (False, True):
+            solver = CFRSolver(game, 2, 2, plus_status=plus_status)
+            exploitability = solver.compute_exploitability()
+
+            solver.solve(100)
+
+            self.assertEqual(solver.iteration_count, 100)
+            self.assertEqual(len(solver.iteration_times), 100)
+            self.assertEqual(len(solver.regrets), 12)
+            self.assertLess(solver.compute_exploitability(), 0.01)
+            self.assertLess(solver.compute_exploitability(), exploitability)
+            self.assertGreater(solver.get_average_strategy(keys[0])[0], 0.98)
+            self.assertGreater(solver.get_average_strategy(keys[1])[1], 0.98)
+
+    def test_rhode_island_holdem(self) -> None:
+        solver = CFRSolver(
+            RhodeIslandHoldem(AUTOMATIONS),
+            155,
+            2,
+            sampling_status=True,
+        )
+
+        solver.iterate()
+
+        self.assertEqual(solver.iteration_count, 1)
+        self.assertGreater(len(solver.regrets), 0)
+
+        for key, regrets in solver.regrets.items():
+            self.assertIsInstance(key, bytes)
+            self.assertEqual(len(regrets), len(solver.strategy_sums[key]))
+
+    def test_errors(self) -> None:
+        self.assertRaises(
+            ValueError,
+            CFRSolver,
+            KuhnPoker(AUTOMATIONS),
+            2,
+            3,
+        )
+        self.assertRaises(
+            ValueError,
+            CFRSolver,
+            KuhnPoker(tuple(Automation)),
+            2,
+            2,
+        )
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
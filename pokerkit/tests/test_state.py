@@ -5,6 +5,7 @@
 from functools import partial
 from hashlib import md5
 from itertools import combinations
+from pickle import dumps
 from unittest import main, TestCase
 from warnings import resetwarnings, simplefilter
 
@@ -18,7 +19,7 @@ from pokerkit.games import (
     NoLimitTexasHoldem,
     RhodeIslandHoldem,
 )
-from pokerkit.hands import KuhnPokerHand, StandardHighHand
+from pokerkit.hands import Hand, KuhnPokerHand, StandardHighHand
 from pokerkit.notation import HandHistory
 from pokerkit.state import (
     Automation,
@@ -31,11 +32,18 @@ from pokerkit.state import (
     _LowHandOpeningLookup,
     Opening,
     Pot,
+    RuleTable,
     State,
     Street,
 )
 from pokerkit.tests.test_lookups import LookupTestCaseMixin
-from pokerkit.utilities import Deck, rake, ValuesLike
+from pokerkit.utilities import (
+    Card,
+    CardsLike,
+    Deck,
+    rake,
+    ValuesLike,
+)
 
 
 class LowHandOpeningLookupTestCase(LookupTestCaseMixin, TestCase):
@@ -115,6 +123,66 @@ class StreetTestCase(TestCase):
         )
 
 
+class RuleTableTestCase(TestCase):
+    def test_compile(self) -> None:
+        game = NoLimitDeuceToSevenLowballSingleDraw((), True, 0, (1, 2), 2)
+        rule_table = RuleTable.compile(game.streets)
+
+        self.assertEqual(rule_table.board_dealing_counts, (0, 0))
+        self.assertEqual(rule_table.board_dealing_offsets, (0, 0, 0))
+        self.assertEqual(rule_table.draw_statuses, (False, True))
+        self.assertEqual(
+            rule_table.later_board_dealing_statuses,
+            (False, False),
+        )
+        self.assertIs(game.rule_table, rule_table)
+        self.assertIs(game(200, 2).rule_table, game(100, 3).rule_table)
+        self.assertIs(
+            NoLimitDeuceToSevenLowballSingleDraw(
+                (),
+                True,
+                0,
+                (1, 2),
+                2,
+            ).rule_table,
+            rule_table,
+        )
+        self.assertIs(RuleTable.compile(list(game.streets)), rule_table)
+
+        streets = [
+            Street(
+                False,
+                [False, False],  # type: ignore[arg-type]
+                0,
+                False,
+                Opening.POSITION,
+                2,
+                None,
+            ),
+        ]
+        state = State(
+            tuple(Automation),
+            Deck.STANDARD,
+            (StandardHighHand,),
+            streets,  # type: ignore[arg-type]
+            BettingStructure.NO_LIMIT,
+            True,
+            0,
+            (1, 2),
+            0,
+            200,
+            2,
+        )
+
+        self.assertEqual(state.rule_table.board_dealing_counts, (0,))
+        self.assertEqual(State.from_bytes(state.to_bytes()), state)
+
+        state.fold()
+
+        self.assertFalse(state.status)
+        self.assertEqual(state.stacks, [201, 199])
+
+
 class StateTestCase(TestCase):
     def test_init(self) -> None:
         self.assertRaises(
@@ -1719,6 +1787,777 @@ class StateTestCase(TestCase):
         state.fold()
         self.assertTrue(state.folded_status)
 
+    def test_pots(self) -> None:
+        state = NoLimitTexasHoldem.create_state(
+            (
+                Automation.ANTE_POSTING,
+                Automation.BET_COLLECTION,
+                Automation.BLIND_OR_STRADDLE_POSTING,
+                Automation.CARD_BURNING,
+                Automation.HOLE_DEALING,
+                Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
+                Automation.HAND_KILLING,
+                Automation.CHIPS_PUSHING,
+                Automation.CHIPS_PULLING,
+            ),
+            True,
+            0,
+            (1, 2),
+            2,
+            (50, 100, 200, 1000, 1000),
+            5,
+        )
+
+        self.assertEqual(tuple(state.pots), ())
+        self.assertEqual(state.total_pot_amount, 3)
+
+        state.complete_bet_or_raise_to(200)
+        state.check_or_call()
+        state.check_or_call()
+        state.check_or_call()
+        state.check_or_call()
+
+        pots = (
+            Pot(0, 250, (0, 1, 2, 3, 4)),
+            Pot(0, 200, (1, 2, 3, 4)),
+            Pot(0, 300, (2, 3, 4)),
+        )
+
+        self.assertEqual(tuple(state.pots), pots)
+        self.assertEqual(tuple(state.pots), pots)
+        self.assertEqual(tuple(state.pot_amounts), (250, 200, 300))
+        self.assertEqual(state.total_pot_amount, 750)
+
+        state.deal_board()
+        state.complete_bet_or_raise_to(100)
+
+        self.assertEqual(tuple(state.pots), pots)
+        self.assertEqual(state.total_pot_amount, 850)
+
+        state.fold()
+
+        self.assertEqual(
+            tuple(state.pots),
+            (
+                Pot(0, 250, (0, 1, 2, 3)),
+                Pot(0, 200, (1, 2, 3)),
+                Pot(0, 300, (2, 3)),
+            ),
+        )
+        self.assertEqual(state.total_pot_amount, 750)
+
+    def test_reset(self) -> None:
+        game = NoLimitTexasHoldem(
+            (
+                Automation.ANTE_POSTING,
+                Automation.BET_COLLECTION,
+                Automation.BLIND_OR_STRADDLE_POSTING,
+                Automation.CARD_BURNING,
+                Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
+                Automation.HAND_KILLING,
+                Automation.CHIPS_PUSHING,
+                Automation.CHIPS_PULLING,
+            ),
+            True,
+            1,
+            (1, 2),
+            2,
+        )
+        state = game((100, 200, 300), 3)
+        operations = state.operations
+
+        while state.can_deal_hole():
+            state.deal_hole()
+
+        state.complete_bet_or_raise_to(10)
+        state.check_or_call()
+        state.check_or_call()
+
+        while state.status:
+            if state.can_deal_board():
+                state.deal_board()
+            else:
+                state.check_or_call()
+
+        state.reset()
+
+        self.assertIs(state.operations, operations)
+
+        reference_state = game((100, 200, 300), 3)
+        reference_state.deck_cards = state.deck_cards.copy()
+
+        self.assertEqual(state, reference_state)
+        self.assertEqual(tuple(state.pots), tuple(reference_state.pots))
+
+        while state.can_deal_hole():
+            state.deal_hole()
+
+        state.fold()
+        state.fold()
+
+        self.assertEqual(state.stacks, [98, 203, 299])
+
+        state.rotate_button()
+
+        self.assertEqual(state.starting_stacks, (203, 299, 98))
+
+        reference_state = game((203, 299, 98), 3)
+        reference_state.deck_cards = state.deck_cards.copy()
+
+        self.assertEqual(state, reference_state)
+
+    def test_actor_indices(self) -> None:
+        state = NoLimitTexasHoldem.create_state(
+            tuple(Automation),
+            True,
+            0,
+            (1, 2),
+            2,
+            (200, 200, 50, 200, 200, 30),
+            6,
+        )
+
+        self.assertEqual(tuple(state.actor_indices), (2, 3, 4, 5, 0, 1))
+
+        state.complete_bet_or_raise_to(50)
+
+        self.assertEqual(tuple(state.actor_indices), (3, 4, 5, 0, 1))
+
+        state.fold()
+        state.complete_bet_or_raise_to(150)
+
+        self.assertEqual(tuple(state.actor_indices), (5, 0, 1))
+
+        state.check_or_call()
+        state.fold()
+        state.check_or_call()
+
+        self.assertEqual(tuple(state.actor_indices), (1, 4))
+        self.assertEqual(state.actor_index, 1)
+
+    def test_hand_cache(self) -> None:
+        evaluation_counts = [0]
+
+        class CountingHand(StandardHighHand):
+            @classmethod
+            def from_game(
+                    cls,
+                    hole_cards: CardsLike,
+                    board_cards: CardsLike = (),
+            ) -> Hand:
+                evaluation_counts[0] += 1
+
+                return super().from_game(hole_cards, board_cards)
+
+        state = NoLimitTexasHoldem.create_state(
+            (
+                Automation.ANTE_POSTING,
+                Automation.BET_COLLECTION,
+                Automation.BLIND_OR_STRADDLE_POSTING,
+                Automation.CARD_BURNING,
+                Automation.HAND_KILLING,
+                Automation.CHIPS_PUSHING,
+                Automation.CHIPS_PULLING,
+            ),
+            True,
+            0,
+            (1, 2),
+            2,
+            (50, 100, 200),
+            3,
+        )
+        state.hand_types = (CountingHand,)
+
+        state.deal_hole('AsAh')
+        state.deal_hole('KsKh')
+        state.deal_hole('QsQh')
+        state.complete_bet_or_raise_to(200)
+        state.check_or_call()
+        state.check_or_call()
+
+        self.assertIsNone(state.get_hand(0, 0, 0))
+
+        state.show_or_muck_hole_cards(True)
+        state.show_or_muck_hole_cards(True)
+        state.show_or_muck_hole_cards(True)
+        state.deal_board('2c3d7h')
+
+        hand = CountingHand('AsAh2c3d7h')
+
+        self.assertEqual(state.get_hand(0, 0, 0), hand)
+
+        count = evaluation_counts[0]
+
+        self.assertEqual(state.get_hand(0, 0, 0), hand)
+        self.assertEqual(state.get_up_hand(0, 0, 0), hand)
+        self.assertEqual(evaluation_counts[0], count + 1)
+
+        state.deal_board('8c')
+
+        count = evaluation_counts[0]
+
+        state.deal_board('Js')
+
+        self.assertLessEqual(evaluation_counts[0] - count, 6)
+        self.assertFalse(state.status)
+        self.assertEqual(state.stacks, [150, 100, 100])
+
+    def test_hand_rankings(self) -> None:
+        state = NoLimitTexasHoldem.create_state(
+            (
+                Automation.ANTE_POSTING,
+                Automation.BET_COLLECTION,
+                Automation.BLIND_OR_STRADDLE_POSTING,
+                Automation.CARD_BURNING,
+                Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
+                Automation.HAND_KILLING,
+                Automation.CHIPS_PULLING,
+            ),
+            True,
+            0,
+            (1, 2),
+            2,
+            (51, 100, 100),
+            3,
+        )
+
+        state.deal_hole('AcKc')
+        state.deal_hole('AsKd')
+        state.deal_hole('2c3d')
+        state.complete_bet_or_raise_to(100)
+        state.check_or_call()
+        state.check_or_call()
+        state.deal_board('7h8h9d')
+        state.deal_board('Jc')
+        state.deal_board('Qs')
+
+        self.assertEqual(state.push_chips().amounts, (77, 76, 0))
+        self.assertEqual(state.push_chips().amounts, (0, 98, 0))
+        self.assertFalse(state.can_push_chips())
+
+        while state.can_pull_chips():
+            state.pull_chips()
+
+        self.assertFalse(state.status)
+        self.assertEqual(state.stacks, [77, 174, 0])
+
+        state = FixedLimitOmahaHoldemHighLowSplitEightOrBetter.create_state(
+            (
+                Automation.ANTE_POSTING,
+                Automation.BET_COLLECTION,
+                Automation.BLIND_OR_STRADDLE_POSTING,
+                Automation.CARD_BURNING,
+                Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
+                Automation.HAND_KILLING,
+                Automation.CHIPS_PULLING,
+            ),
+            True,
+            0,
+            (1, 2),
+            2,
+            4,
+            (6, 100, 100),
+            3,
+        )
+
+        state.deal_hole('Ac2c3d4d')
+        state.deal_hole('KsKhQsQh')
+        state.deal_hole('JsJhTsTh')
+        state.complete_bet_or_raise_to()
+        state.complete_bet_or_raise_to()
+        state.check_or_call()
+        state.check_or_call()
+        state.deal_board('5c6h8s')
+        state.complete_bet_or_raise_to()
+        state.check_or_call()
+        state.deal_board('Kd')
+        state.check_or_call()
+        state.check_or_call()
+        state.deal_board('Qc')
+        state.check_or_call()
+        state.check_or_call()
+
+        self.assertEqual(state.push_chips().amounts, (0, 9, 0))
+        self.assertEqual(state.push_chips().amounts, (9, 0, 0))
+        self.assertEqual(state.push_chips().amounts, (0, 2, 0))
+        self.assertEqual(state.push_chips().amounts, (0, 2, 0))
+        self.assertFalse(state.can_push_chips())
+
+        while state.can_pull_chips():
+            state.pull_chips()
+
+        self.assertFalse(state.status)
+        self.assertEqual(state.stacks, [9, 105, 92])
+        self.assertEqual(sum(state.stacks), 206)
+
+    def test_advance_until_decision(self) -> None:
+        state = FixedLimitDeuceToSevenLowballTripleDraw.create_state(
+            (),
+            True,
+            0,
+            (1, 2),
+            2,
+            4,
+            200,
+            3,
+        )
+
+        while state.status:
+            operations = state.advance_until_decision()
+
+            self.assertFalse(state.can_post_ante())
+            self.assertFalse(state.can_collect_bets())
+            self.assertFalse(state.can_post_blind_or_straddle())
+            self.assertFalse(state.can_burn_card())
+            self.assertFalse(state.can_deal_hole())
+            self.assertFalse(state.can_deal_board())
+            self.assertFalse(state.can_kill_hand())
+            self.assertFalse(state.can_push_chips())
+            self.assertFalse(state.can_pull_chips())
+            self.assertEqual(
+                operations,
+                state.operations[len(state.operations) - len(operations):],
+            )
+
+            if state.can_stand_pat_or_discard():
+                state.stand_pat_or_discard()
+            elif state.can_check_or_call():
+                state.check_or_call()
+            elif state.can_show_or_muck_hole_cards():
+                state.show_or_muck_hole_cards()
+
+        self.assertEqual(sum(state.payoffs), 0)
+        self.assertEqual(state.advance_until_decision(), [])
+
+        state = NoLimitTexasHoldem.create_state(
+            (
+                Automation.ANTE_POSTING,
+                Automation.BET_COLLECTION,
+                Automation.BLIND_OR_STRADDLE_POSTING,
+                Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
+            ),
+            True,
+            0,
+            (1, 2),
+            2,
+            200,
+            2,
+        )
+
+        state.advance_until_decision('AsKs')
+        state.check_or_call()
+        state.check_or_call()
+        state.advance_until_decision('QsJsTs9s')
+
+        self.assertEqual(
+            state.board_cards,
+            [[card] for card in Card.parse('QsJsTs')],
+        )
+        self.assertEqual(state.actor_index, 0)
+
+        state = NoLimitTexasHoldem.create_state(
+            (),
+            True,
+            0,
+            (1, 2),
+            2,
+            200,
+            3,
+        )
+
+        state.advance_until_decision('', 'AcKcQc')
+
+        self.assertEqual(
+            [cards[0] for cards in state.hole_cards],
+            list(Card.parse('AcKcQc')),
+        )
+        self.assertEqual(sum(map(len, state.hole_cards)), 6)
+
+    def test_clone(self) -> None:
+        state = NoLimitTexasHoldem.create_state(
+            tuple(Automation),
+            True,
+            0,
+            (1, 2),
+            2,
+            200,
+            3,
+        )
+
+        state.complete_bet_or_raise_to(6)
+
+        clone = state.clone()
+
+        self.assertIsNot(clone.stacks, state.stacks)
+        self.assertIsNot(clone.deck_cards, state.deck_cards)
+        self.assertIsNot(clone.hole_cards[0], state.hole_cards[0])
+        self.assertEqual(clone.stacks, state.stacks)
+        self.assertEqual(clone.bets, state.bets)
+        self.assertEqual(list(clone.pots), list(state.pots))
+        self.assertEqual(clone.operations, state.operations)
+
+        clone.check_or_call()
+        clone.check_or_call()
+
+        self.assertEqual(state.stacks, [199, 198, 194])
+        self.assertEqual(state.bets, [1, 2, 6])
+        self.assertEqual(len(state.board_cards), 0)
+        self.assertEqual(clone.stacks, [194, 194, 194])
+        self.assertEqual(len(clone.board_cards), 3)
+        self.assertEqual(len(clone.operations) - len(state.operations), 5)
+
+        state.fold()
+        state.fold()
+
+        self.assertFalse(state.status)
+        self.assertTrue(clone.status)
+        self.assertEqual(state.stacks, [199, 198, 203])
+
+    def test_to_bytes(self) -> None:
+        state = NoLimitTexasHoldem.create_state(
+            tuple(Automation),
+            True,
+            0,
+            (1, 2),
+            2,
+            200,
+            3,
+        )
+
+        state.complete_bet_or_raise_to(6)
+        state.check_or_call()
+
+        data = state.to_bytes()
+        loaded_state = State.from_bytes(data)
+
+        self.assertEqual(loaded_state, state)
+        self.assertLess(len(data), len(dumps(state)))
+        self.assertEqual(list(loaded_state.pots), list(state.pots))
+        self.assertEqual(
+            loaded_state.get_info_set_key(1),
+            state.get_info_set_key(1),
+        )
+        self.assertIs(loaded_state.rule_table, state.rule_table)
+
+        for s in (state, loaded_state):
+            s.check_or_call()
+            s.complete_bet_or_raise_to(10)
+            s.fold()
+            s.check_or_call()
+
+        self.assertEqual(loaded_state, state)
+        self.assertEqual(State.from_bytes(state.to_bytes()), state)
+
+        state = NoLimitDeuceToSevenLowballSingleDraw.create_state(
+            (
+                Automation.ANTE_POSTING,
+                Automation.BET_COLLECTION,
+                Automation.BLIND_OR_STRADDLE_POSTING,
+                Automation.CARD_BURNING,
+            ),
+            True,
+            0,
+            (1, 2),
+            2,
+            200,
+            2,
+        )
+
+        while state.can_deal_hole():
+            state.deal_hole('??')
+
+        state.check_or_call()
+        state.check_or_call()
+        state.stand_pat_or_discard('????')
+
+        loaded_state = State.from_bytes(state.to_bytes())
+
+        self.assertEqual(loaded_state, state)
+        self.assertEqual(loaded_state.discarded_cards, state.discarded_cards)
+
+        state = NoLimitTexasHoldem.create_state(
+            tuple(Automation),
+            True,
+            0,
+            (1, 2),
+            2,
+            200,
+            2,
+        )
+
+        state.fold()
+
+        loaded_state = State.from_bytes(state.to_bytes())
+
+        self.assertFalse(loaded_state.status)
+        self.assertEqual(loaded_state, state)
+
+        state = NoLimitTexasHoldem.create_state(
+            tuple(Automation),
+            True,
+            0,
+            (1, 2),
+            2,
+            200,
+            2,
+            rake=lambda amount, state: (0, amount),
+        )
+
+        self.assertRaises(ValueError, state.to_bytes)
+
+    def test_from_bytes(self) -> None:
+        state = NoLimitTexasHoldem.create_state(
+            tuple(Automation),
+            True,
+            0,
+            (1, 2),
+            2,
+            200,
+            2,
+        )
+        data = state.to_bytes()
+
+        self.assertRaises(ValueError, State.from_bytes, b'')
+        self.assertRaises(ValueError, State.from_bytes, b'PKSU' + data[4:])
+        self.assertRaises(ValueError, State.from_bytes, data[:4] + b'\x02')
+        self.assertRaises(ValueError, State.from_bytes, data[:-1])
+        self.assertRaises(ValueError, State.from_bytes, data + b'\x00')
+        self.assertRaises(ValueError, State.from_bytes, data[:-1] + b'\xff')
+        self.assertRaises(
+            ValueError,
+            State.from_bytes,
+            data[:5] + bytes(4) + data[9:],
+        )
+        self.assertRaisesRegex(
+            ValueError,
+            'untrusted',
+            State.from_bytes,
+            data.replace(
+                b'pokerkit.utilities:divmod',
+                b'pokerkit.state:accumulate',
+            ),
+        )
+
+        state = NoLimitTexasHoldem.create_state(
+            tuple(Automation),
+            True,
+            0,
+            (1, 2),
+            2,
+            200,
+            2,
+            divmod=divmod,
+        )
+        data = state.to_bytes()
+
+        self.assertRaisesRegex(
+            ValueError,
+            'untrusted',
+            State.from_bytes,
+            data,
+        )
+        self.assertEqual(State.from_bytes(data, trusted=True), state)
+
+        state = NoLimitTexasHoldem.create_state(
+            tuple(Automation),
+            True,
+            0,
+            (1, 2),
+            2,
+            200,
+            2,
+            rake=partial(rake, percentage=0.05),
+        )
+        data = state.to_bytes()
+
+        self.assertRaisesRegex(
+            ValueError,
+            'untrusted',
+            State.from_bytes,
+            data,
+        )
+
+        loaded_state = State.from_bytes(data, trusted=True)
+
+        self.assertEqual(
+            loaded_state.rake(100, loaded_state),
+            state.rake(100, state),
+        )
+        self.assertEqual(loaded_state.stacks, state.stacks)
+
+    def test_info_set_key(self) -> None:
+        def create_state() -> State:
+            return NoLimitDeuceToSevenLowballSingleDraw.create_state(
+                (
+                    Automation.ANTE_POSTING,
+                    Automation.BET_COLLECTION,
+                    Automation.BLIND_OR_STRADDLE_POSTING,
+                    Automation.CARD_BURNING,
+                ),
+                True,
+                0,
+                (1, 2),
+                2,
+                200,
+                2,
+            )
+
+        states = create_state(), create_state()
+
+        for state, hole_cards, discarded_card in (
+                (states[0], '7cKs5dQs4hJs3s9s2c8s', 'Ks'),
+                (states[1], '7cKd5dQs4hJs3s9s2c8s', 'Kd'),
+        ):
+            for card in Card.parse(hole_cards):
+                state.deal_hole((card,))
+
+            state.check_or_call()
+            state.check_or_call()
+
+            while state.can_stand_pat_or_discard():
+                if state.stand_patter_or_discarder_index == 1:
+                    state.stand_pat_or_discard(discarded_card)
+                else:
+                    state.stand_pat_or_discard()
+
+        self.assertEqual(
+            states[0].get_info_set_key(0),
+            states[1].get_info_set_key(0),
+        )
+        self.assertEqual(
+            states[0].get_info_set_hash(0),
+            states[1].get_info_set_hash(0),
+        )
+        self.assertNotEqual(
+            states[0].get_info_set_key(1),
+            states[1].get_info_set_key(1),
+        )
+        self.assertNotEqual(
+            states[0].get_info_set_key(0),
+            states[0].get_info_set_key(1),
+        )
+
+        for state in states:
+            state.deal_hole('6c')
+
+        self.assertEqual(
+            states[0].get_info_set_key(0),
+            states[1].get_info_set_key(0),
+        )
+
+        clone = states[0].clone()
+        key = states[0].get_info_set_key(0)
+
+        clone.check_or_call()
+
+        self.assertEqual(states[0].get_info_set_key(0), key)
+        self.assertTrue(clone.get_info_set_key(0).startswith(key))
+        self.assertNotEqual(clone.get_info_set_key(0), key)
+
+        clone.check_or_call()
+        clone.show_or_muck_hole_cards(True)
+        clone.show_or_muck_hole_cards(True)
+
+        self.assertNotEqual(
+            clone.get_info_set_key(0),
+            states[1].clone().get_info_set_key(0),
+        )
+
+        key = create_state().get_info_set_key(0)
+
+        states[0].reset()
+
+        self.assertEqual(states[0].get_info_set_key(0), key)
+        self.assertRaises(ValueError, states[0].get_info_set_key, -1)
+        self.assertRaises(ValueError, states[0].get_info_set_hash, 2)
+
+        states = create_state(), create_state()
+
+        states[0].deal_hole('??????????')
+        states[0].deal_hole('??????????')
+        states[1].deal_hole('AhAdAcAsKh')
+        states[1].deal_hole('??????????')
+
+        self.assertNotEqual(
+            states[0].get_info_set_key(0),
+            states[1].get_info_set_key(0),
+        )
+        self.assertEqual(
+            states[0].get_info_set_key(1),
+            states[1].get_info_set_key(1),
+        )
+
+        key = states[0].get_info_set_key(0)
+
+        states[0].check_or_call()
+
+        self.assertTrue(states[0].get_info_set_key(0).startswith(key))
+
+    def test_encode_observation(self) -> None:
+        state = FixedLimitSevenCardStud.create_state(
+            (
+                Automation.ANTE_POSTING,
+                Automation.BET_COLLECTION,
+                Automation.BLIND_OR_STRADDLE_POSTING,
+                Automation.CARD_BURNING,
+            ),
+            True,
+            1,
+            2,
+            4,
+            8,
+            100,
+            2,
+        )
+
+        state.deal_hole('AcKc2d')
+        state.deal_hole('AsKs3d')
+
+        ace, deuce, trey = Card.parse('Ac2d3d')
+        observation = state.encode_observation(0)
+        hole_cards = observation[:52]
+        up_cards = observation[104:156]
+
+        self.assertEqual(len(observation), state.observation_size)
+        self.assertEqual(sum(hole_cards), 3)
+        self.assertEqual(hole_cards[Deck.STANDARD.index(ace)], 1)
+        self.assertEqual(sum(observation[52:104]), 0)
+        self.assertEqual(sum(up_cards), 1)
+        self.assertEqual(up_cards[Deck.STANDARD.index(trey)], 1)
+        self.assertEqual(up_cards[Deck.STANDARD.index(deuce)], 0)
+        self.assertEqual(observation[-3], 1)
+
+        end = 10 + state.observation_size
+        observation = state.encode_observation(1, [0.5] * 200, 10)
+
+        self.assertEqual(observation[:10], [0.5] * 10)
+        self.assertEqual(observation[end - 6:end], [0] * 6)
+        self.assertEqual(observation[end:], [0.5] * (200 - end))
+        self.assertRaises(ValueError, state.encode_observation, 2)
+        self.assertRaises(ValueError, state.encode_observation, 0, [0] * 10)
+
+    def test_slots(self) -> None:
+        state = NoLimitTexasHoldem.create_state(
+            tuple(Automation),
+            True,
+            0,
+            (1, 2),
+            2,
+            200,
+            3,
+        )
+
+        while state.status:
+            state.check_or_call()
+
+        self.assertTrue(state.operations)
+
+        for operation in state.operations:
+            self.assertFalse(hasattr(operation, '__dict__'))
+
+        for street in state.streets:
+            self.assertFalse(hasattr(street, '__dict__'))
+
 
 if __name__ == '__main__':
     main()  # pragma: no cover
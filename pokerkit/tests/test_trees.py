@@ -0,0 +1,165 @@
+""":mod:`pokerkit.tests.test_trees` implements unit tests for
+:mod:`pokerkit.trees`.
+"""
+
+from collections.abc import Iterator
+from unittest import main, TestCase
+
+from pokerkit.games import (
+    FixedLimitDeuceToSevenLowballTripleDraw,
+    FixedLimitSevenCardStud,
+    KuhnPoker,
+    NoLimitTexasHoldem,
+)
+from pokerkit.simulation import Action
+from pokerkit.state import Automation, State
+from pokerkit.trees import GameTree, iterate_nodes, Node
+
+
+class TreesTestCase(TestCase):
+    def assert_tree(self, tree: GameTree) -> None:
+        self.assertEqual(len(tree.child_offsets), len(tree) + 1)
+        self.assertEqual(len(tree.child_indices), len(tree) - 1)
+
+        for i in range(len(tree)):
+            node = tree.get_node(i)
+
+            self.assertEqual(node.index, i)
+
+            for j in tree.get_child_indices(i):
+                self.assertEqual(tree.parent_indices[j], i)
+
+            if node.actor_index is None:
+                self.assertEqual(tuple(tree.get_child_indices(i)), ())
+            else:
+                self.assertNotEqual(tuple(tree.get_child_indices(i)), ())
+
+    def test_iterate_nodes(self) -> None:
+        state = KuhnPoker.create_state(tuple(Automation))
+        stacks = state.stacks.copy()
+        operation_count = len(state.operations)
+        nodes = list(iterate_nodes(state))
+
+        self.assertEqual(len(nodes), 9)
+        self.assertEqual(state.stacks, stacks)
+        self.assertEqual(len(state.operations), operation_count)
+        self.assertEqual(
+            nodes[3],
+            Node(3, 1, Action.COMPLETION_BETTING_OR_RAISING, 1, 0, 0, 3),
+        )
+        self.assertEqual(
+            sum(node.actor_index is None for node in nodes),
+            5,
+        )
+
+        state = NoLimitTexasHoldem.create_state(
+            tuple(Automation),
+            False,
+            0,
+            (1, 2),
+            2,
+            4,
+            2,
+        )
+        nodes = list(iterate_nodes(state))
+
+        self.assertEqual(len(nodes), 34)
+        self.assertEqual(
+            [node.street_index for node in nodes[:10]],
+            [0, None, 0, 1, 1, 2, 2, 3, 3, None],
+        )
+        self.assertEqual(
+            [node.pot_amount for node in nodes[:13]],
+            [3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 6, 6, 8],
+        )
+        self.assertEqual(
+            nodes[-3],
+            Node(31, 0, Action.COMPLETION_BETTING_OR_RAISING, 4, 0, 0, 6),
+        )
+
+        def get_bet_sizes(state: State) -> Iterator[int]:
+            yield 0
+            yield 3
+            yield 100
+
+        nodes = list(iterate_nodes(state, get_bet_sizes))
+
+        self.assertEqual(len(nodes), 10)
+        self.assertEqual(
+            sum(node.action == Action.FOLDING for node in nodes),
+            1,
+        )
+
+    def test_game_tree(self) -> None:
+        state = KuhnPoker.create_state(tuple(Automation))
+        tree = GameTree.from_state(state)
+
+        self.assert_tree(tree)
+        self.assertEqual(tuple(tree.get_child_indices(0)), (1, 6))
+        self.assertEqual(tuple(tree.get_child_indices(3)), (4, 5))
+        self.assertEqual(list(tree.actions), [-1, 1, 1, 2, 0, 1, 2, 0, 1])
+        self.assertEqual(
+            list(tree.amounts),
+            [-1, -1, -1, 1, -1, -1, 1, -1, -1],
+        )
+        self.assertEqual(
+            [tree.get_node(i) for i in range(len(tree))],
+            list(iterate_nodes(state)),
+        )
+
+        state = FixedLimitSevenCardStud.create_state(
+            tuple(Automation),
+            True,
+            1,
+            1,
+            2,
+            4,
+            4,
+            2,
+        )
+        tree = GameTree.from_state(state)
+
+        self.assert_tree(tree)
+        self.assertEqual(tree.get_node(1).action, Action.BRING_IN_POSTING)
+        self.assertEqual(
+            tree.get_node(max(tree.get_child_indices(1))).action,
+            Action.COMPLETION_BETTING_OR_RAISING,
+        )
+
+        state = FixedLimitDeuceToSevenLowballTripleDraw.create_state(
+            tuple(Automation),
+            True,
+            0,
+            (1, 2),
+            2,
+            4,
+            3,
+            2,
+        )
+        tree = GameTree.from_state(state)
+
+        self.assert_tree(tree)
+        self.assertEqual(max(tree.street_indices), 3)
+
+    def test_from_nodes(self) -> None:
+        tree = GameTree.from_nodes(())
+
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(list(tree.child_offsets), [0])
+        self.assertRaises(
+            ValueError,
+            GameTree.from_nodes,
+            (Node(1, None, None, None, 0, 0, 0),),
+        )
+        self.assertRaises(
+            ValueError,
+            GameTree.from_nodes,
+            (
+                Node(0, None, None, None, 0, 0, 0),
+                Node(1, 1, Action.FOLDING, None, None, None, 0),
+            ),
+        )
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
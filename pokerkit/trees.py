@@ -0,0 +1,403 @@
+""":mod:`pokerkit.trees` implements classes related to game trees.
+
+The game trees here are public betting trees. Their nodes are the
+decisions of the players to act and the terminal states, and their edges
+are the betting actions (folding, checking/calling, posting the
+bring-in, and completing/betting/raising). Every other operation,
+including the dealings, standing pat, and showdowns, is carried out
+without branching.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+
+from pokerkit.simulation import Action, apply_action
+from pokerkit.state import ChipsPulling, State
+
+BetSizer = Callable[[State], Iterable[int]]
+"""The type of bet sizers.
+
+A bet sizer is called with a state in which a player may complete, bet,
+or raise. It returns the completion, betting, or raising to amounts that
+are considered in the tree (i.e. the bet-size abstraction). The amounts
+that are not allowed are ignored.
+"""
+
+
+def get_min_and_max_bet_sizes(state: State) -> Iterator[int]:
+    """Return the minimum and maximum completion, betting, or raising
+    to amounts.
+
+    This is the default bet sizer.
+
+    >>> from pokerkit import Automation, NoLimitTexasHoldem
+    >>> state = NoLimitTexasHoldem.create_state(
+    ...     tuple(Automation),
+    ...     False,
+    ...     0,
+    ...     (1, 2),
+    ...     2,
+    ...     200,
+    ...     2,
+    ... )
+    >>> tuple(get_min_and_max_bet_sizes(state))
+    (4, 200)
+
+    :param state: The state.
+    :return: The minimum and maximum amounts if applicable.
+    """
+    amount = state.min_completion_betting_or_raising_to_amount
+
+    if amount is not None:
+        yield amount
+
+    amount = state.max_completion_betting_or_raising_to_amount
+
+    if amount is not None:
+        yield amount
+
+
+@dataclass(frozen=True, slots=True)
+class Node:
+    """The class for nodes of game trees.
+
+    :param index: The index.
+    :param parent_index: The parent index.
+    :param action: The action from the parent.
+    :param amount: The completion, betting, or raising to amount.
+    :param actor_index: The actor index.
+    :param street_index: The street index.
+    :param pot_amount: The total pot amount.
+    """
+
+    index: int
+    """The index.
+
+    The nodes are indexed in depth-first pre-order.
+    """
+    parent_index: int | None
+    """The parent index (``None`` for the root)."""
+    action: Action | None
+    """The action from the parent (``None`` for the root)."""
+    amount: int | None
+    """The completion, betting, or raising to amount, if applicable."""
+    actor_index: int | None
+    """The index of the player to act (``None`` for terminal nodes)."""
+    street_index: int | None
+    """The street index (``None`` for terminal nodes)."""
+    pot_amount: int
+    """The total pot amount, including the bets.
+
+    For terminal nodes, this is the total amount pulled by the
+    players.
+    """
+
+
+def _advance(state: State) -> None:
+    while state.status:
+        state.advance_until_decision()
+
+        if state.can_stand_pat_or_discard():
+            state.stand_pat_or_discard()
+        elif state.can_select_runout_count():
+            state.select_runout_count()
+        elif state.can_show_or_muck_hole_cards(True):
+            state.show_or_muck_hole_cards(True)
+        else:
+            break
+
+
+def get_actions(
+        state: State,
+        bet_sizer: BetSizer = get_min_and_max_bet_sizes,
+) -> list[tuple[Action, int | None]]:
+    """Return the betting actions available to the actor.
+
+    >>> from pokerkit import Automation, KuhnPoker
+    >>> state = KuhnPoker.create_state(tuple(Automation))
+    >>> for action, amount in get_actions(state):
+    ...     print(action.name, amount)
+    CHECKING_OR_CALLING None
+    COMPLETION_BETTING_OR_RAISING 1
+
+    :param state: The state.
+    :param bet_sizer: The bet sizer, defaults to
+                      :func:`pokerkit.trees.get_min_and_max_bet_sizes`.
+    :return: The actions and the completion, betting, or raising to
+             amounts (if applicable).
+    """
+    actions: list[tuple[Action, int | None]] = []
+
+    if state.can_fold():
+        actions.append((Action.FOLDING, None))
+
+    if state.can_check_or_call():
+        actions.append((Action.CHECKING_OR_CALLING, None))
+
+    if state.can_post_bring_in():
+        actions.append((Action.BRING_IN_POSTING, None))
+
+    for amount in sorted(set(bet_sizer(state))):
+        if state.can_complete_bet_or_raise_to(amount):
+            actions.append((Action.COMPLETION_BETTING_OR_RAISING, amount))
+
+    return actions
+
+
+def iterate_nodes(
+        state: State,
+        bet_sizer: BetSizer = get_min_and_max_bet_sizes,
+) -> Iterator[Node]:
+    """Iterate through the nodes of the game tree rooted at the state.
+
+    The nodes are yielded in depth-first pre-order as they are
+    expanded. Only the states along the current path (and their pending
+    siblings) are kept, so large trees can be streamed without being
+    stored. The supplied state is not modified.
+
+    >>> from pokerkit import Automation, KuhnPoker
+    >>> state = KuhnPoker.create_state(tuple(Automation))
+    >>> for node in iterate_nodes(state):
+    ...     action = None if node.action is None else node.action.name
+    ...     print(node.index, node.parent_index, action, node.actor_index)
+    0 None None 0
+    1 0 CHECKING_OR_CALLING 1
+    2 1 CHECKING_OR_CALLING None
+    3 1 COMPLETION_BETTING_OR_RAISING 0
+    4 3 FOLDING None
+    5 3 CHECKING_OR_CALLING None
+    6 0 COMPLETION_BETTING_OR_RAISING 1
+    7 6 FOLDING None
+    8 6 CHECKING_OR_CALLING None
+
+    :param state: The root state.
+    :param bet_sizer: The bet sizer, defaults to
+                      :func:`pokerkit.trees.get_min_and_max_bet_sizes`.
+    :return: The nodes.
+    """
+    state = state.clone()
+
+    _advance(state)
+
+    stack: list[tuple[State, int | None, Action | None, int | None]] = [
+        (state, None, None, None),
+    ]
+    index = 0
+
+    while stack:
+        state, parent_index, action, amount = stack.pop()
+
+        if state.status:
+            actor_index = state.actor_index
+            street_index = state.street_index
+            pot_amount = state.total_pot_amount
+        else:
+            actor_index = street_index = None
+            pot_amount = sum(
+                operation.amount
+                for operation in state.operations
+                if isinstance(operation, ChipsPulling)
+            )
+
+        yield Node(
+            index,
+            parent_index,
+            action,
+            amount,
+            actor_index,
+            street_index,
+            pot_amount,
+        )
+
+        if actor_index is not None:
+            actions = get_actions(state, bet_sizer)
+
+            for i, (child_action, child_amount) in enumerate(
+                    reversed(actions),
+            ):
+                child = state if i == len(actions) - 1 else state.clone()
+
+                apply_action(child, child_action, child_amount)
+                _advance(child)
+                stack.append((child, index, child_action, child_amount))
+
+        index += 1
+
+
+@dataclass
+class GameTree:
+    """The class for game trees stored as node tables.
+
+    Each column is a contiguous :class:`array.array` indexed by the node
+    index. The missing values (e.g. the parent index of the root or the
+    actor index of a terminal node) are stored as ``-1``. The children
+    of each node are stored contiguously in
+    :attr:`pokerkit.trees.GameTree.child_indices`, delimited by
+    :attr:`pokerkit.trees.GameTree.child_offsets`.
+
+    >>> from pokerkit import Automation, KuhnPoker
+    >>> state = KuhnPoker.create_state(tuple(Automation))
+    >>> tree = GameTree.from_state(state)
+    >>> len(tree)
+    9
+    >>> tree.parent_indices.tolist()
+    [-1, 0, 1, 1, 3, 3, 0, 6, 6]
+    >>> tree.actor_indices.tolist()
+    [0, 1, -1, 0, -1, -1, 1, -1, -1]
+    >>> tree.pot_amounts.tolist()
+    [2, 2, 2, 3, 3, 4, 3, 3, 4]
+    >>> tuple(tree.get_child_indices(0))
+    (1, 6)
+    >>> tuple(tree.get_child_indices(2))
+    ()
+    >>> tree.get_node(3)  # doctest: +ELLIPSIS
+    Node(index=3, parent_index=1, action=<Action.COMPLETION_BETTING_OR_...
+
+    :param parent_indices: The parent indices.
+    :param actions: The actions from the parents.
+    :param amounts: The completion, betting, or raising to amounts.
+    :param actor_indices: The actor indices.
+    :param street_indices: The street indices.
+    :param pot_amounts: The total pot amounts.
+    """
+
+    parent_indices: array[int] = field(
+        default_factory=lambda: array('l'),
+    )
+    """The parent indices."""
+    actions: array[int] = field(default_factory=lambda: array('b'))
+    """The actions from the parents."""
+    amounts: array[int] = field(default_factory=lambda: array('q'))
+    """The completion, betting, or raising to amounts."""
+    actor_indices: array[int] = field(default_factory=lambda: array('l'))
+    """The actor indices."""
+    street_indices: array[int] = field(default_factory=lambda: array('b'))
+    """The street indices."""
+    pot_amounts: array[int] = field(default_factory=lambda: array('q'))
+    """The total pot amounts."""
+    child_offsets: array[int] = field(
+        default_factory=lambda: array('l', (0,)),
+        init=False,
+    )
+    """The offsets of the children of each node.
+
+    The children of the node at index ``i`` are at
+    ``child_indices[child_offsets[i]:child_offsets[i + 1]]``.
+    """
+    child_indices: array[int] = field(
+        default_factory=lambda: array('l'),
+        init=False,
+    )
+    """The child indices."""
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[Node]) -> GameTree:
+        """Create a game tree from the nodes.
+
+        The nodes must be supplied in the order of their indices, and
+        each parent must precede its children.
+
+        :param nodes: The nodes.
+        :return: The game tree.
+        :raises ValueError: If the nodes are out of order.
+        """
+        tree = cls()
+
+        for node in nodes:
+            if node.index != len(tree):
+                raise ValueError(f'The node {node.index} is out of order.')
+            elif (
+                    node.parent_index is not None
+                    and not 0 <= node.parent_index < node.index
+            ):
+                raise ValueError(
+                    f'The parent of the node {node.index} is out of order.',
+                )
+
+            tree.parent_indices.append(
+                -1 if node.parent_index is None else node.parent_index,
+            )
+            tree.actions.append(-1 if node.action is None else node.action)
+            tree.amounts.append(-1 if node.amount is None else node.amount)
+            tree.actor_indices.append(
+                -1 if node.actor_index is None else node.actor_index,
+            )
+            tree.street_indices.append(
+                -1 if node.street_index is None else node.street_index,
+            )
+            tree.pot_amounts.append(node.pot_amount)
+
+        child_counts = [0] * len(tree)
+
+        for parent_index in tree.parent_indices:
+            if parent_index >= 0:
+                child_counts[parent_index] += 1
+
+        for child_count in child_counts:
+            tree.child_offsets.append(tree.child_offsets[-1] + child_count)
+
+        positions = list(tree.child_offsets[:-1])
+        tree.child_indices = array('l', [0] * tree.child_offsets[-1])
+
+        for index, parent_index in enumerate(tree.parent_indices):
+            if parent_index >= 0:
+                tree.child_indices[positions[parent_index]] = index
+                positions[parent_index] += 1
+
+        return tree
+
+    @classmethod
+    def from_state(
+            cls,
+            state: State,
+            bet_sizer: BetSizer = get_min_and_max_bet_sizes,
+    ) -> GameTree:
+        """Build the game tree rooted at the state.
+
+        For more details, please consult
+        :func:`pokerkit.trees.iterate_nodes`.
+
+        :param state: The root state.
+        :param bet_sizer: The bet sizer, defaults to
+                          :func:`pokerkit.trees.get_min_and_max_bet_sizes`.
+        :return: The game tree.
+        """
+        return cls.from_nodes(iterate_nodes(state, bet_sizer))
+
+    def __len__(self) -> int:
+        return len(self.parent_indices)
+
+    def get_child_indices(self, index: int) -> Iterator[int]:
+        """Iterate through the child indices of the node.
+
+        :param index: The node index.
+        :return: The child indices.
+        """
+        yield from self.child_indices[
+            self.child_offsets[index]:self.child_offsets[index + 1]
+        ]
+
+    def get_node(self, index: int) -> Node:
+        """Return the node at the index.
+
+        :param index: The node index.
+        :return: The node.
+        """
+        parent_index = self.parent_indices[index]
+        action = self.actions[index]
+        amount = self.amounts[index]
+        actor_index = self.actor_indices[index]
+        street_index = self.street_indices[index]
+
+        return Node(
+            index,
+            None if parent_index < 0 else parent_index,
+            None if action < 0 else Action(action),
+            None if amount < 0 else amount,
+            None if actor_index < 0 else actor_index,
+            None if street_index < 0 else street_index,
+            self.pot_amounts[index],
+        )